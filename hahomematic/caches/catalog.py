@@ -0,0 +1,195 @@
+"""Module for the catalog of the parameters of all devices."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Final
+
+from hahomematic import central as hmcu
+from hahomematic.const import (
+    IGNORE_FOR_UN_IGNORE_PARAMETERS,
+    UN_IGNORE_WILDCARD,
+    Operations,
+    ParamsetKey,
+)
+from hahomematic.platforms.device import HmDevice
+from hahomematic.platforms.generic.entity import GenericEntity
+
+# (model, channel_no, paramset_key, parameter)
+_CATALOG_KEY = tuple[str, int | None, ParamsetKey, str]
+# (paramset_key, operations, text)
+_QUERY_KEY = tuple[ParamsetKey, int, str]
+
+
+@dataclass(slots=True)
+class ParameterCatalogEntry:
+    """A parameter of a channel of a model."""
+
+    model: str
+    channel_no: int | None
+    paramset_key: ParamsetKey
+    parameter: str
+    # {channel_address, operations}
+    operations: dict[str, int] = field(default_factory=dict)
+    # {channel_address, entity}. The entity is None, if no entity has been created.
+    entities: dict[str, GenericEntity | None] = field(default_factory=dict)
+    # The names of the parameter as used in the un ignore file
+    un_ignore_name: str = field(init=False)
+    un_ignore_wildcard_name: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Init the names of the parameter."""
+        channel = "" if self.channel_no is None else str(self.channel_no)
+        self.un_ignore_name = f"{self.parameter}:{self.paramset_key}@{self.model}:{channel}"
+        self.un_ignore_wildcard_name = (
+            f"{self.parameter}:{self.paramset_key}@{self.model}:{UN_IGNORE_WILDCARD}"
+        )
+
+    def supports_operations(self, operations_mask: int) -> bool:
+        """Return, if a channel supports all operations of the mask."""
+        return any(
+            operations & operations_mask == operations_mask
+            for operations in self.operations.values()
+        )
+
+    def is_un_ignore_candidate(self, operations_mask: int = 0) -> bool:
+        """
+        Return, if the parameter is a candidate for un ignore.
+
+        The parameter must be a candidate on a channel, that supports all operations of the mask.
+        The state of the entities is evaluated on every call.
+        """
+        if self.parameter in IGNORE_FOR_UN_IGNORE_PARAMETERS:
+            return False
+        for channel_address, operations in self.operations.items():
+            if operations & operations_mask != operations_mask:
+                continue
+            if (
+                entity := self.entities.get(channel_address)
+            ) is None or not entity.enabled_default or entity.is_un_ignored:
+                return True
+        return False
+
+
+class ParameterCatalog:
+    """
+    Catalog of the parameters of all devices by model and channel.
+
+    The catalog is updated, when devices are created, reloaded or removed.
+    The results of the queries are kept until the next update. The un ignore state
+    depends on the entities and is not part of the kept results.
+    """
+
+    def __init__(self, central: hmcu.CentralUnit) -> None:
+        """Init the parameter catalog."""
+        self._central: Final = central
+        self._entries: Final[dict[_CATALOG_KEY, ParameterCatalogEntry]] = {}
+        # {device_address, {catalog_key}}
+        self._keys_by_device: Final[dict[str, set[_CATALOG_KEY]]] = {}
+        self._results: Final[dict[_QUERY_KEY, tuple[ParameterCatalogEntry, ...]]] = {}
+
+    @property
+    def size(self) -> int:
+        """Return the number of entries of the catalog."""
+        return len(self._entries)
+
+    def add_device(self, device: HmDevice) -> None:
+        """Add or update the parameters of a device."""
+        self.remove_device(device=device)
+        keys = self._keys_by_device[device.address] = set()
+        for channel in device.channels.values():
+            entities: dict[tuple[ParamsetKey, str], GenericEntity] = {
+                (entity.paramset_key, entity.parameter): entity
+                for entity in channel.generic_entities
+            }
+            for paramset_key, paramset_description in channel.paramsset_descriptions.items():
+                for parameter, parameter_data in paramset_description.items():
+                    key = (device.model, channel.no, paramset_key, parameter)
+                    if (entry := self._entries.get(key)) is None:
+                        entry = self._entries[key] = ParameterCatalogEntry(
+                            model=device.model,
+                            channel_no=channel.no,
+                            paramset_key=paramset_key,
+                            parameter=parameter,
+                        )
+                    entity = entities.get((paramset_key, parameter))
+                    operations = parameter_data["OPERATIONS"]
+                    if paramset_key == ParamsetKey.MASTER and operations == 0 and entity:
+                        # hm master paramset operation values are fixed on creation
+                        operations = 3
+                    entry.operations[channel.address] = operations
+                    entry.entities[channel.address] = entity
+                    keys.add(key)
+        self._results.clear()
+
+    def remove_device(self, device: HmDevice) -> None:
+        """Remove the parameters of a device."""
+        if (keys := self._keys_by_device.pop(device.address, None)) is None:
+            return
+        for key in keys:
+            entry = self._entries[key]
+            for channel_address in device.channels:
+                entry.operations.pop(channel_address, None)
+                entry.entities.pop(channel_address, None)
+            if not entry.entities:
+                del self._entries[key]
+        self._results.clear()
+
+    def query(
+        self,
+        paramset_key: ParamsetKey,
+        operations: tuple[Operations, ...] = (),
+        un_ignore_candidates_only: bool = False,
+        text: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[ParameterCatalogEntry, ...]:
+        """
+        Return the entries of the catalog, that match the filters.
+
+        All operations must be supported by a single channel of the parameter. The text
+        is searched case-insensitive in the un ignore name. The entries are sorted by model,
+        channel and parameter.
+        """
+        operations_mask = 0
+        for operation in operations:
+            operations_mask |= operation
+        query_key = (paramset_key, operations_mask, (text or "").lower())
+        if (result := self._results.get(query_key)) is None:
+            result = self._results[query_key] = self._get_entries(query_key=query_key)
+        if un_ignore_candidates_only:
+            return tuple(
+                islice(
+                    (
+                        entry
+                        for entry in result
+                        if entry.is_un_ignore_candidate(operations_mask=operations_mask)
+                    ),
+                    offset,
+                    None if limit is None else offset + limit,
+                )
+            )
+        if offset or limit is not None:
+            return result[offset : None if limit is None else offset + limit]
+        return result
+
+    def _get_entries(self, query_key: _QUERY_KEY) -> tuple[ParameterCatalogEntry, ...]:
+        """Return the sorted entries, that match the query."""
+        paramset_key, operations_mask, text = query_key
+        return tuple(
+            sorted(
+                (
+                    entry
+                    for entry in self._entries.values()
+                    if entry.paramset_key == paramset_key
+                    and entry.supports_operations(operations_mask=operations_mask)
+                    and (not text or text in entry.un_ignore_name.lower())
+                ),
+                key=lambda entry: (
+                    entry.model,
+                    -1 if entry.channel_no is None else entry.channel_no,
+                    entry.parameter,
+                ),
+            )
+        )
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
 from datetime import datetime
 import logging
 from typing import Any, Final, cast
 
-from hahomematic import central as hmcu
+from hahomematic import central as hmcu, client as hmcl, config
 from hahomematic.config import (
     LAST_COMMAND_SEND_STORE_TIMEOUT,
     PING_PONG_MISMATCH_COUNT,
@@ -31,7 +32,8 @@ from hahomematic.const import (
 )
 from hahomematic.converter import CONVERTABLE_PARAMETERS, convert_combined_parameter_to_paramset
 from hahomematic.platforms.device import HmDevice
-from hahomematic.support import changed_within_seconds, get_entity_key
+from hahomematic.platforms.generic import GenericEntity
+from hahomematic.support import changed_within_seconds, get_device_address, get_entity_key
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -130,6 +132,8 @@ class DeviceDetailsCache:
         """Init the device details cache."""
         self._central: Final = central
         self._channel_rooms: Final[dict[str, set[str]]] = {}
+        # {device_address, rooms of all channels}
+        self._device_rooms: Final[dict[str, set[str]]] = {}
         self._device_channel_ids: Final[dict[str, str]] = {}
         self._functions: Final[dict[str, set[str]]] = {}
         self._interface_cache: Final[dict[str, str]] = {}
@@ -149,6 +153,7 @@ class DeviceDetailsCache:
         _LOGGER.debug("LOAD: Loading rooms for %s", self._central.name)
         self._channel_rooms.clear()
         self._channel_rooms.update(await self._get_all_rooms())
+        self._init_device_rooms()
         _LOGGER.debug("LOAD: Loading functions for %s", self._central.name)
         self._functions.clear()
         self._functions.update(await self._get_all_functions())
@@ -189,13 +194,17 @@ class DeviceDetailsCache:
             return await client.get_all_rooms()
         return {}
 
+    def _init_device_rooms(self) -> None:
+        """Build the rooms of the devices from the rooms of the channels."""
+        self._device_rooms.clear()
+        for channel_address, channel_rooms in self._channel_rooms.items():
+            self._device_rooms.setdefault(get_device_address(channel_address), set()).update(
+                channel_rooms
+            )
+
     def get_device_rooms(self, device_address: str) -> set[str]:
         """Return all rooms by device_address."""
-        rooms: set[str] = set()
-        for channel_address, channel_rooms in self._channel_rooms.items():
-            if channel_address.startswith(device_address):
-                rooms.update(channel_rooms)
-        return rooms
+        return set(self._device_rooms.get(device_address, ()))
 
     def get_channel_rooms(self, channel_address: str) -> set[str]:
         """Return rooms by channel_address."""
@@ -225,6 +234,7 @@ class DeviceDetailsCache:
         """Clear the cache."""
         self._names_cache.clear()
         self._channel_rooms.clear()
+        self._device_rooms.clear()
         self._functions.clear()
         self._refreshed_at = INIT_DATETIME
 
@@ -235,41 +245,120 @@ class CentralDataCache:
     def __init__(self, central: hmcu.CentralUnit) -> None:
         """Init the central data cache."""
         self._central: Final = central
-        # { key, value}
-        self._value_cache: Final[dict[str, Any]] = {}
-        self._refreshed_at = INIT_DATETIME
+        # { interface, {channel_address, {parameter, value}}}
+        self._value_cache: Final[dict[str, dict[str, dict[str, Any]]]] = {}
+        # { interface, refreshed_at}
+        self._refreshed_at: Final[dict[str, datetime]] = {}
+        # { interface, server time of the last sync}
+        self._sync_timestamps: Final[dict[str, int]] = {}
+        self._is_revalidating: bool = False
+        self._revalidated_at = INIT_DATETIME
 
     @property
     def is_empty(self) -> bool:
-        """Return if cache is empty."""
+        """Return if cache is empty or outdated."""
         if len(self._value_cache) == 0:
             return True
-        if not changed_within_seconds(last_change=self._refreshed_at):
-            self.clear()
-            return True
-        return False
+        return any(
+            not changed_within_seconds(last_change=refreshed_at)
+            for refreshed_at in self._refreshed_at.values()
+        )
 
     async def load(self, direct_call: bool = False) -> None:
         """Fetch data from backend."""
-        if direct_call is False and changed_within_seconds(
-            last_change=self._refreshed_at, max_age=int(MAX_CACHE_AGE / 2)
+        if not (
+            clients := [
+                client
+                for client in self._central.clients
+                if direct_call
+                or not changed_within_seconds(
+                    last_change=self._refreshed_at.get(client.interface, INIT_DATETIME),
+                    max_age=int(MAX_CACHE_AGE / 2),
+                )
+            ]
         ):
             return
-        self.clear()
         _LOGGER.debug("load: Loading device data for %s", self._central.name)
-        for client in self._central.clients:
-            await client.fetch_all_device_data()
+        # Each interface merges its data on completion, so a slow one does not delay the others.
+        sema = asyncio.Semaphore(max(1, config.MAX_CONCURRENT_DATA_LOADS))
+
+        async def _fetch_all_device_data(client: hmcl.Client) -> None:
+            async with sema:
+                await client.fetch_all_device_data()
+
+        await asyncio.gather(*(_fetch_all_device_data(client=client) for client in clients))
 
     async def refresh_entity_data(self, paramset_key: ParamsetKey | None = None) -> None:
-        """Refresh entity data."""
+        """
+        Refresh entity data.
+
+        The values are loaded per device with one call per channel and paramset_key.
+        The number of devices, that load values at once, is limited per interface.
+        """
+        entities_by_device: dict[HmDevice, list[GenericEntity]] = {}
         for entity in self._central.get_readable_generic_entities(paramset_key=paramset_key):
-            await entity.load_entity_value(call_source=CallSource.HM_INIT)
+            if not changed_within_seconds(last_change=entity.refreshed_at):
+                entities_by_device.setdefault(entity.device, []).append(entity)
+        semas: dict[str, asyncio.Semaphore] = {}
+
+        async def _load_values(device: HmDevice, entities: list[GenericEntity]) -> None:
+            if (sema := semas.get(device.interface_id)) is None:
+                sema = semas[device.interface_id] = asyncio.Semaphore(
+                    max(1, config.MAX_CONCURRENT_VALUE_LOADS)
+                )
+            async with sema:
+                await device.value_cache.load_values(
+                    entities=entities, call_source=CallSource.HM_INIT
+                )
 
-    def add_data(self, all_device_data: dict[str, Any]) -> None:
-        """Add data to cache."""
-        self.clear()
-        self._value_cache.update(all_device_data)
-        self._refreshed_at = datetime.now()
+        await asyncio.gather(
+            *(
+                _load_values(device=device, entities=entities)
+                for device, entities in entities_by_device.items()
+            )
+        )
+
+    def get_sync_timestamp(self, interface: str) -> int:
+        """Return the server time of the last sync of the interface. 0 requests a full sync."""
+        return self._sync_timestamps.get(interface, 0)
+
+    def add_data(
+        self,
+        interface: str,
+        all_device_data: dict[str, Any],
+        sync_timestamp: int,
+        is_delta: bool = False,
+    ) -> bool:
+        """
+        Add data to cache.
+
+        A delta is merged into the existing data of the interface,
+        otherwise the data of the interface is replaced.
+        Returns False, if the delta cannot be applied and a full sync is required.
+        """
+        if is_delta:
+            if interface not in self._sync_timestamps:
+                _LOGGER.debug(
+                    "ADD_DATA: No previous sync for interface %s. Full sync required", interface
+                )
+                return False
+            if sync_timestamp < self._sync_timestamps[interface]:
+                _LOGGER.debug(
+                    "ADD_DATA: Server time of interface %s went backwards. Full sync required",
+                    interface,
+                )
+                return False
+            segment = self._value_cache.setdefault(interface, {})
+        else:
+            segment = {}
+        for key, value in all_device_data.items():
+            # key: {interface}.{channel_address with %3A}.{parameter}
+            channel_address, _, parameter = key.partition(".")[2].rpartition(".")
+            segment.setdefault(channel_address.replace("%3A", ":"), {})[parameter] = value
+        self._value_cache[interface] = segment
+        self._sync_timestamps[interface] = sync_timestamp
+        self._refreshed_at[interface] = datetime.now()
+        return True
 
     def get_data(
         self,
@@ -277,16 +366,44 @@ class CentralDataCache:
         channel_address: str,
         parameter: str,
     ) -> Any:
-        """Get data from cache."""
-        if not self.is_empty:
-            key = f"{interface}.{channel_address.replace(':','%3A')}.{parameter}"
-            return self._value_cache.get(key, NO_CACHE_ENTRY)
-        return NO_CACHE_ENTRY
-
-    def clear(self) -> None:
-        """Clear the cache."""
+        """Get data from cache. Outdated data is returned, while it is revalidated in background."""
+        if (refreshed_at := self._refreshed_at.get(interface)) is None:
+            return NO_CACHE_ENTRY
+        if not changed_within_seconds(last_change=refreshed_at):
+            self._revalidate()
+        if (channel_data := self._value_cache[interface].get(channel_address)) is None:
+            return NO_CACHE_ENTRY
+        return channel_data.get(parameter, NO_CACHE_ENTRY)
+
+    def clear(self, interface: str | None = None) -> None:
+        """Clear the cache. If an interface is given, only the data of this interface is cleared."""
+        if interface is not None:
+            self._value_cache.pop(interface, None)
+            self._refreshed_at.pop(interface, None)
+            self._sync_timestamps.pop(interface, None)
+            return
         self._value_cache.clear()
-        self._refreshed_at = INIT_DATETIME
+        self._refreshed_at.clear()
+        self._sync_timestamps.clear()
+
+    def _revalidate(self) -> None:
+        """Reload the outdated data in background. Only one revalidation runs at a time."""
+        if self._is_revalidating or changed_within_seconds(
+            last_change=self._revalidated_at, max_age=int(MAX_CACHE_AGE / 2)
+        ):
+            return
+        self._is_revalidating = True
+        self._revalidated_at = datetime.now()
+        self._central.looper.create_task(
+            target=self._load_outdated(), name=f"revalidate_data_cache_{self._central.name}"
+        )
+
+    async def _load_outdated(self) -> None:
+        """Load the outdated data."""
+        try:
+            await self.load()
+        finally:
+            self._is_revalidating = False
 
 
 class PingPongCache:
@@ -2,22 +2,27 @@
 
 from __future__ import annotations
 
-from abc import ABC
+from abc import ABC, abstractmethod
 import asyncio
 from collections.abc import Mapping
 from datetime import datetime
-from functools import lru_cache
+from functools import partial
+from importlib.metadata import PackageNotFoundError, version
 import logging
 import os
-from typing import Any, Final
+import sys
+from typing import Any, Final, cast
 
 import orjson
 
-from hahomematic import central as hmcu
+import hahomematic
+from hahomematic import central as hmcu, config
 from hahomematic.const import (
     CACHE_PATH,
     DEFAULT_ENCODING,
     FILE_DEVICES,
+    FILE_ENTITY_PLAN,
+    FILE_JOURNAL_POSTFIX,
     FILE_PARAMSETS,
     INIT_DATETIME,
     DataOperationResult,
@@ -36,9 +41,34 @@ from hahomematic.support import (
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+_ADD: Final = "add"
+_CHANNELS: Final = "channels"
+_CREATED: Final = "created"
+_DEVICES: Final = "devices"
+_FINGERPRINT: Final = "fingerprint"
+_FIRMWARE: Final = "firmware"
+_FORMAT: Final = "format"
+_FORMAT_COMPACT: Final = "compact"
+_INTERFACES: Final = "interfaces"
+_MODEL: Final = "model"
+_PARAMSETS: Final = "paramsets"
+_REMOVE: Final = "remove"
+
+# Fields of the parameter data with string values, that are interned
+_INTERNED_PARAMETER_FIELDS: Final = ("ID", "TYPE", "UNIT")
+
+_FLYWEIGHT_KEY = tuple[str, str | None, str, ParamsetKey]
+
 
 class BasePersistentCache(ABC):
-    """Cache for files."""
+    """
+    Cache for files.
+
+    Changes are appended to a journal next to the file, so adding or removing a device
+    doesn't rewrite the whole file. The journal is compacted into the file, if it exceeds
+    its max size or age, or if a compaction is requested e.g. on stop of the central.
+    The entries of the journal must be idempotent, because they are replayed on load.
+    """
 
     _file_postfix: str
 
@@ -52,9 +82,18 @@ class BasePersistentCache(ABC):
         self._central: Final = central
         self._cache_dir: Final = f"{central.config.storage_folder}/{CACHE_PATH}"
         self._filename: Final = f"{central.name}_{self._file_postfix}"
+        self._journal_filename: Final = f"{self._filename}{FILE_JOURNAL_POSTFIX}"
         self._persistant_cache: Final = persistant_cache
         self.last_save_triggered: datetime = INIT_DATETIME
-        self.last_hash_saved = hash_sha256(value=persistant_cache)
+        # The hash is only maintained, if config.VERIFY_CACHE_HASH is enabled.
+        self.last_hash_saved: str | None = None
+        # interface_ids or device_addresses, that have been changed since the last save
+        self._dirty_segments: Final[set[str]] = set()
+        # changes since the last save, that are appended to the journal
+        self._journal_entries: Final[list[list[Any]]] = []
+        self._journal_created: datetime | None = None
+        self._requires_compaction: bool = False
+        self._write_count: int = 0
 
     @property
     def cache_hash(self) -> str:
@@ -64,56 +103,227 @@ class BasePersistentCache(ABC):
     @property
     def data_changed(self) -> bool:
         """Return if the data has changed."""
-        return self.cache_hash != self.last_hash_saved
+        return len(self._dirty_segments) > 0
 
-    async def save(self) -> DataOperationResult:
-        """Save current name data in NAMES to disk."""
-        self.last_save_triggered = datetime.now()
-        if (
-            not check_or_create_directory(self._cache_dir)
-            or not self._central.config.use_caches
-            or (cache_hash := self.cache_hash) == self.last_hash_saved
+    @property
+    def write_count(self) -> int:
+        """Return the number of writes to the file or the journal."""
+        return self._write_count
+
+    @property
+    def dirty_segments(self) -> frozenset[str]:
+        """Return the segments, that have been changed since the last save."""
+        return frozenset(self._dirty_segments)
+
+    def _mark_dirty(self, segment: str) -> None:
+        """Mark a segment of the cache as changed."""
+        self._dirty_segments.add(segment)
+
+    def _record_change(self, segment: str, entry: list[Any] | None = None) -> None:
+        """
+        Mark a segment of the cache as changed and add the change to the journal.
+
+        A change without a journal entry requires a compaction with the next save.
+        """
+        self._mark_dirty(segment=segment)
+        if entry is None:
+            self._requires_compaction = True
+        else:
+            self._journal_entries.append(entry)
+
+    @abstractmethod
+    def _replay_journal_entry(self, entry: list[Any]) -> None:
+        """Apply an entry of the journal to the cache."""
+
+    def _get_file_content(self) -> Any:
+        """
+        Return a snapshot of the content, that is written to the file.
+
+        Only the containers, that are changed by the cache, are copied.
+        The stored descriptions are replaced, but never modified, so they are shared
+        with the snapshot, that is serialized in the executor.
+        """
+        return dict(self._persistant_cache)
+
+    def _get_cache_content(self, file_content: Any) -> dict[str, Any]:
+        """Return the content of the cache from the content of the file."""
+        cache_content: dict[str, Any] = file_content
+        return cache_content
+
+    def _is_journal_exceeded(self) -> bool:
+        """Return if the journal exceeds its max size or age."""
+        if not os.path.exists(
+            journal_file := os.path.join(self._cache_dir, self._journal_filename)
         ):
+            return False
+        return os.path.getsize(journal_file) > config.CACHE_JOURNAL_MAX_SIZE or (
+            self._journal_created is not None
+            and (datetime.now() - self._journal_created).total_seconds()
+            > config.CACHE_JOURNAL_MAX_AGE
+        )
+
+    def _check_files(self, data_changed: bool, compact: bool) -> bool | None:
+        """
+        Return if the cache must be compacted into the file, or None if nothing is saved.
+
+        This runs in the executor, like all other accesses to the file and the journal.
+        """
+        if not check_or_create_directory(self._cache_dir):
+            return None
+        if not (
+            data_changed
+            or (compact and os.path.exists(os.path.join(self._cache_dir, self._journal_filename)))
+        ):
+            return None
+        return (
+            not os.path.exists(os.path.join(self._cache_dir, self._filename))
+            or self._is_journal_exceeded()
+        )
+
+    async def save(self, compact: bool = False) -> DataOperationResult:
+        """Save the changes of the cache to the journal, or compact the cache into the file."""
+        self.last_save_triggered = datetime.now()
+        if not self._central.config.use_caches:
+            self._journal_entries.clear()
+            return DataOperationResult.NO_SAVE
+        if not (self.data_changed or compact):
             return DataOperationResult.NO_SAVE
 
-        def _save() -> DataOperationResult:
-            with open(
-                file=os.path.join(self._cache_dir, self._filename),
-                mode="wb",
-            ) as fptr:
-                fptr.write(
-                    orjson.dumps(
-                        self._persistant_cache,
-                        option=orjson.OPT_NON_STR_KEYS,
-                    )
+        async with self._sema_save_or_load:
+            if (
+                requires_file_compaction := await self._central.looper.async_add_executor_job(
+                    partial(self._check_files, data_changed=self.data_changed, compact=compact),
+                    name=f"check-persistent-cache-{self._filename}",
                 )
+            ) is None:
+                return DataOperationResult.NO_SAVE
+
+            cache_hash: str | None = None
+            if (
+                config.VERIFY_CACHE_HASH
+                and (cache_hash := self.cache_hash) == self.last_hash_saved
+            ):
+                self._dirty_segments.clear()
+                self._journal_entries.clear()
+                return DataOperationResult.NO_SAVE
+
+            dirty_segments = self.dirty_segments
+            journal_entries = tuple(self._journal_entries)
+            requires_compaction = compact or self._requires_compaction or requires_file_compaction
+            # The snapshot is taken on the loop, because the cache may be changed meanwhile.
+            # The serialization of the snapshot and the journal entries runs in the executor.
+            file_content = self._get_file_content() if requires_compaction else None
+            self._dirty_segments.clear()
+            self._journal_entries.clear()
+            self._requires_compaction = False
+
+            def _save() -> DataOperationResult:
+                if requires_compaction:
+                    self._write_file(
+                        content=orjson.dumps(file_content, option=orjson.OPT_NON_STR_KEYS)
+                    )
+                else:
+                    self._append_journal(
+                        content=b"".join(
+                            orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+                            for entry in journal_entries
+                        )
+                    )
                 self.last_hash_saved = cache_hash
+                self._write_count += 1
+                return DataOperationResult.SAVE_SUCCESS
 
-            return DataOperationResult.SAVE_SUCCESS
+            try:
+                return await self._central.looper.async_add_executor_job(
+                    _save, name=f"save-persistent-cache-{self._filename}"
+                )
+            except Exception:
+                self._dirty_segments.update(dirty_segments)
+                self._journal_entries[0:0] = journal_entries
+                self._requires_compaction = requires_compaction
+                raise
+
+    def _write_file(self, content: bytes) -> None:
+        """Write the serialized cache atomically into the file and remove the journal."""
+        file_name = os.path.join(self._cache_dir, self._filename)
+        tmp_file_name = f"{file_name}.tmp"
+        with open(file=tmp_file_name, mode="wb") as fptr:
+            fptr.write(content)
+            fptr.flush()
+            os.fsync(fptr.fileno())
+        os.replace(tmp_file_name, file_name)
+        delete_file(folder=self._cache_dir, file_name=self._journal_filename)
+        self._journal_created = None
+
+    def _append_journal(self, content: bytes) -> None:
+        """Append the serialized entries to the journal."""
+        with open(
+            file=os.path.join(self._cache_dir, self._journal_filename),
+            mode="ab",
+        ) as fptr:
+            if self._journal_created is None or fptr.tell() == 0:
+                self._journal_created = datetime.now()
+                fptr.write(orjson.dumps({_CREATED: self._journal_created.timestamp()}) + b"\n")
+            fptr.write(content)
+            fptr.flush()
+            os.fsync(fptr.fileno())
+
+    def _read_journal(self) -> list[list[Any]]:
+        """
+        Read the entries of the journal.
 
-        async with self._sema_save_or_load:
-            return await self._central.looper.async_add_executor_job(
-                _save, name=f"save-persistent-cache-{self._filename}"
-            )
+        An incomplete last entry is ignored. The journal is compacted with the next save,
+        so further entries are not appended to the incomplete one.
+        """
+        journal_entries: list[list[Any]] = []
+        self._journal_created = None
+        if not os.path.exists(
+            journal_file := os.path.join(self._cache_dir, self._journal_filename)
+        ):
+            return journal_entries
+        with open(file=journal_file, mode="rb") as fptr:
+            for line in fptr:
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    _LOGGER.warning(
+                        "READ_JOURNAL: Ignoring incomplete entry of journal %s",
+                        self._journal_filename,
+                    )
+                    self._requires_compaction = True
+                    break
+                if isinstance(entry, dict):
+                    self._journal_created = datetime.fromtimestamp(entry[_CREATED])
+                else:
+                    journal_entries.append(entry)
+        return journal_entries
 
     async def load(self) -> DataOperationResult:
-        """Load file from disk into dict."""
-        if not check_or_create_directory(self._cache_dir) or not os.path.exists(
-            os.path.join(self._cache_dir, self._filename)
-        ):
-            return DataOperationResult.NO_LOAD
+        """Load file and journal from disk into dict."""
 
         def _load() -> DataOperationResult:
-            with open(
-                file=os.path.join(self._cache_dir, self._filename),
-                encoding=DEFAULT_ENCODING,
-            ) as fptr:
-                data = orjson.loads(fptr.read())
+            if not check_or_create_directory(self._cache_dir) or not (
+                os.path.exists(os.path.join(self._cache_dir, self._filename))
+                or os.path.exists(os.path.join(self._cache_dir, self._journal_filename))
+            ):
+                return DataOperationResult.NO_LOAD
+            data: dict[str, Any] = {}
+            if os.path.exists(file_name := os.path.join(self._cache_dir, self._filename)):
+                with open(file=file_name, encoding=DEFAULT_ENCODING) as fptr:
+                    data = self._get_cache_content(file_content=orjson.loads(fptr.read()))
+            journal_entries = self._read_journal()
+            if config.VERIFY_CACHE_HASH and not journal_entries:
                 if (converted_hash := hash_sha256(value=data)) == self.last_hash_saved:
                     return DataOperationResult.NO_LOAD
-                self._persistant_cache.clear()
-                self._persistant_cache.update(data)
                 self.last_hash_saved = converted_hash
+            self._persistant_cache.clear()
+            self._persistant_cache.update(data)
+            for entry in journal_entries:
+                self._replay_journal_entry(entry=entry)
+            if config.VERIFY_CACHE_HASH and journal_entries:
+                self.last_hash_saved = self.cache_hash
+            self._dirty_segments.clear()
+            self._journal_entries.clear()
             return DataOperationResult.LOAD_SUCCESS
 
         async with self._sema_save_or_load:
@@ -122,95 +332,177 @@ class BasePersistentCache(ABC):
             )
 
     async def clear(self) -> None:
-        """Remove stored file from disk."""
+        """Remove stored file and journal from disk."""
 
         def _clear() -> None:
             delete_file(folder=self._cache_dir, file_name=self._filename)
+            delete_file(folder=self._cache_dir, file_name=self._journal_filename)
             self._persistant_cache.clear()
+            self._dirty_segments.clear()
+            self._journal_entries.clear()
+            self._journal_created = None
+            self._requires_compaction = False
+            self.last_hash_saved = None
 
-        await self._central.looper.async_add_executor_job(_clear, name="clear-persistent-cache")
+        async with self._sema_save_or_load:
+            await self._central.looper.async_add_executor_job(
+                _clear, name="clear-persistent-cache"
+            )
 
 
 class DeviceDescriptionCache(BasePersistentCache):
-    """Cache for device/channel names."""
+    """
+    Cache for device/channel names.
+
+    The device descriptions are stored by address. The file keeps a list of
+    device descriptions per interface, that is only built for the serialisation.
+    """
 
     _file_postfix = FILE_DEVICES
 
     def __init__(self, central: hmcu.CentralUnit) -> None:
         """Init the device description cache."""
-        # {interface_id, [device_descriptions]}
-        self._raw_device_descriptions: Final[dict[str, list[DeviceDescription]]] = {}
+        # {interface_id, {address, device_description}}
+        self._raw_device_descriptions: Final[dict[str, dict[str, DeviceDescription]]] = {}
         super().__init__(
             central=central,
             persistant_cache=self._raw_device_descriptions,
         )
-        # {interface_id, {device_address, [channel_address]}}
+        # {interface_id, {device_address, {address}}}
         self._addresses: Final[dict[str, dict[str, set[str]]]] = {}
-        # {interface_id, {address, device_descriptions}}
-        self._device_descriptions: Final[dict[str, dict[str, DeviceDescription]]] = {}
+        # {interface_id, {model, {device_address}}}
+        self._device_addresses_by_model: Final[dict[str, dict[str, set[str]]]] = {}
 
     def add_device_description(
         self, interface_id: str, device_description: DeviceDescription
     ) -> None:
         """Add device_description to cache."""
-        if interface_id not in self._raw_device_descriptions:
-            self._raw_device_descriptions[interface_id] = []
-
-        self._remove_device(
-            interface_id=interface_id,
-            deleted_addresses=[device_description["ADDRESS"]],
-        )
-        self._raw_device_descriptions[interface_id].append(device_description)
-
-        self._convert_device_description(
+        if (
+            self.find_device_description(
+                interface_id=interface_id, device_address=device_description["ADDRESS"]
+            )
+            != device_description
+        ):
+            self._record_change(
+                segment=interface_id, entry=[_ADD, interface_id, device_description]
+            )
+        self._add_device_description(
             interface_id=interface_id, device_description=device_description
         )
 
     def get_raw_device_descriptions(self, interface_id: str) -> list[DeviceDescription]:
-        """Find raw device in cache."""
-        return self._raw_device_descriptions.get(interface_id, [])
+        """Return the device descriptions of the interface as list."""
+        return list(self._raw_device_descriptions.get(interface_id, {}).values())
 
     def remove_device(self, device: HmDevice) -> None:
         """Remove device from cache."""
+        deleted_addresses = [device.address, *list(device.channels.keys())]
+        self._record_change(
+            segment=device.interface_id, entry=[_REMOVE, device.interface_id, deleted_addresses]
+        )
         self._remove_device(
             interface_id=device.interface_id,
-            deleted_addresses=[device.address, *list(device.channels.keys())],
+            deleted_addresses=deleted_addresses,
         )
 
+    def _replay_journal_entry(self, entry: list[Any]) -> None:
+        """Apply an entry of the journal to the cache. The indexes are built after the load."""
+        operation, interface_id, data = entry
+        device_descriptions = self._raw_device_descriptions.setdefault(interface_id, {})
+        if operation == _ADD:
+            device_descriptions[data["ADDRESS"]] = data
+            return
+        for address in data:
+            device_descriptions.pop(address, None)
+
+    def _add_device_description(
+        self, interface_id: str, device_description: DeviceDescription
+    ) -> None:
+        """Add device_description to cache and indexes."""
+        address = device_description["ADDRESS"]
+        device_descriptions = self._raw_device_descriptions.setdefault(interface_id, {})
+        if (
+            ":" not in address
+            and (old_device_description := device_descriptions.get(address))
+            and old_device_description["TYPE"] != device_description["TYPE"]
+        ):
+            self._remove_from_model_index(
+                interface_id=interface_id,
+                model=old_device_description["TYPE"],
+                device_address=address,
+            )
+        device_descriptions[address] = device_description
+        self._add_to_indexes(interface_id=interface_id, device_description=device_description)
+
+    def _add_to_indexes(self, interface_id: str, device_description: DeviceDescription) -> None:
+        """Add the device description to the indexes."""
+        address = device_description["ADDRESS"]
+        addresses = self._addresses.setdefault(interface_id, {})
+        if ":" in address:
+            addresses.setdefault(get_device_address(address), set()).add(address)
+            return
+        addresses.setdefault(address, set()).add(address)
+        self._device_addresses_by_model.setdefault(interface_id, {}).setdefault(
+            device_description["TYPE"], set()
+        ).add(address)
+
+    def _remove_from_model_index(self, interface_id: str, model: str, device_address: str) -> None:
+        """Remove the device address from the model index."""
+        models = self._device_addresses_by_model.get(interface_id, {})
+        if (device_addresses := models.get(model)) is not None:
+            device_addresses.discard(device_address)
+            if not device_addresses:
+                del models[model]
+
     def _remove_device(self, interface_id: str, deleted_addresses: list[str]) -> None:
         """Remove device from cache."""
-        self._raw_device_descriptions[interface_id] = [
-            device_descriptions
-            for device_descriptions in self.get_raw_device_descriptions(interface_id)
-            if device_descriptions["ADDRESS"] not in deleted_addresses
-        ]
-
+        device_descriptions = self._raw_device_descriptions.get(interface_id, {})
+        addresses = self._addresses.get(interface_id, {})
         for address in deleted_addresses:
-            try:
-                if ":" not in address and self._addresses.get(interface_id, {}).get(address):
-                    del self._addresses[interface_id][address]
-                if self._device_descriptions.get(interface_id, {}).get(address):
-                    del self._device_descriptions[interface_id][address]
-            except KeyError:
-                _LOGGER.warning("REMOVE_DEVICE failed: Unable to delete: %s", address)
+            device_description = device_descriptions.pop(address, None)
+            if ":" in address:
+                if (channel_addresses := addresses.get(get_device_address(address))) is not None:
+                    channel_addresses.discard(address)
+                continue
+            addresses.pop(address, None)
+            if device_description:
+                self._remove_from_model_index(
+                    interface_id=interface_id,
+                    model=device_description["TYPE"],
+                    device_address=address,
+                )
+
+    def _init_indexes(self) -> None:
+        """Build the indexes from the device descriptions."""
+        self._addresses.clear()
+        self._device_addresses_by_model.clear()
+        for interface_id, device_descriptions in self._raw_device_descriptions.items():
+            for device_description in device_descriptions.values():
+                self._add_to_indexes(
+                    interface_id=interface_id, device_description=device_description
+                )
 
     def get_addresses(self, interface_id: str) -> tuple[str, ...]:
         """Return the addresses by interface."""
         return tuple(self._addresses.get(interface_id, {}).keys())
 
+    def get_device_addresses_by_model(self, interface_id: str, model: str) -> tuple[str, ...]:
+        """Return the device addresses by interface and model."""
+        return tuple(self._device_addresses_by_model.get(interface_id, {}).get(model, ()))
+
     def get_device_descriptions(self, interface_id: str) -> dict[str, DeviceDescription]:
         """Return the devices by interface."""
-        return self._device_descriptions.get(interface_id, {})
+        return self._raw_device_descriptions.get(interface_id, {})
 
     def find_device_description(
         self, interface_id: str, device_address: str
     ) -> DeviceDescription | None:
         """Return the device description by interface and device_address."""
-        return self._device_descriptions.get(interface_id, {}).get(device_address)
+        return self._raw_device_descriptions.get(interface_id, {}).get(device_address)
 
     def get_device_description(self, interface_id: str, address: str) -> DeviceDescription:
         """Return the device description by interface and device_address."""
-        return self._device_descriptions[interface_id][address]
+        return self._raw_device_descriptions[interface_id][address]
 
     def get_device_with_channels(
         self, interface_id: str, device_address: str
@@ -228,42 +520,29 @@ class DeviceDescriptionCache(BasePersistentCache):
             )
         return device_descriptions
 
-    @lru_cache
     def get_model(self, device_address: str) -> str | None:
         """Return the device type."""
-        for data in self._device_descriptions.values():
-            if items := data.get(device_address):
-                return items["TYPE"]
+        for device_descriptions in self._raw_device_descriptions.values():
+            if device_description := device_descriptions.get(device_address):
+                return device_description["TYPE"]
         return None
 
-    def _convert_device_descriptions(
-        self, interface_id: str, device_descriptions: list[DeviceDescription]
-    ) -> None:
-        """Convert provided list of device descriptions."""
-        for device_description in device_descriptions:
-            self._convert_device_description(
-                interface_id=interface_id, device_description=device_description
-            )
-
-    def _convert_device_description(
-        self, interface_id: str, device_description: DeviceDescription
-    ) -> None:
-        """Convert provided dict of device descriptions."""
-        if interface_id not in self._addresses:
-            self._addresses[interface_id] = {}
-        if interface_id not in self._device_descriptions:
-            self._device_descriptions[interface_id] = {}
-
-        address = device_description["ADDRESS"]
-        self._device_descriptions[interface_id][address] = device_description
+    def _get_file_content(self) -> Any:
+        """Return the device descriptions as list per interface."""
+        return {
+            interface_id: list(device_descriptions.values())
+            for interface_id, device_descriptions in self._raw_device_descriptions.items()
+        }
 
-        if ":" not in address and address not in self._addresses[interface_id]:
-            self._addresses[interface_id][address] = {address}
-        if ":" in address:
-            device_address = get_device_address(address)
-            if device_address not in self._addresses[interface_id]:
-                self._addresses[interface_id][device_address] = set()
-            self._addresses[interface_id][device_address].add(address)
+    def _get_cache_content(self, file_content: Any) -> dict[str, Any]:
+        """Return the device descriptions by address from the lists of the file."""
+        return {
+            interface_id: {
+                device_description["ADDRESS"]: device_description
+                for device_description in device_descriptions
+            }
+            for interface_id, device_descriptions in file_content.items()
+        }
 
     async def load(self) -> DataOperationResult:
         """Load device data from disk into _device_description_cache."""
@@ -271,13 +550,14 @@ class DeviceDescriptionCache(BasePersistentCache):
             _LOGGER.debug("load: not caching paramset descriptions for %s", self._central.name)
             return DataOperationResult.NO_LOAD
         result = await super().load()
-        for (
-            interface_id,
-            device_descriptions,
-        ) in self._raw_device_descriptions.items():
-            self._convert_device_descriptions(interface_id, device_descriptions)
+        self._init_indexes()
         return result
 
+    async def clear(self) -> None:
+        """Remove stored file and journal from disk and clear the indexes."""
+        await super().clear()
+        self._init_indexes()
+
 
 class ParamsetDescriptionCache(BasePersistentCache):
     """Cache for paramset descriptions."""
@@ -297,6 +577,16 @@ class ParamsetDescriptionCache(BasePersistentCache):
 
         # {(device_address, parameter), [channel_no]}
         self._address_parameter_cache: Final[dict[tuple[str, str], set[int | None]]] = {}
+        # {interface_id, {device_address, {channel_address}}}
+        self._channel_addresses: Final[dict[str, dict[str, set[str]]]] = {}
+
+        # {(model, firmware, channel_type, paramset_key), paramset_description}
+        self._flyweights: Final[dict[_FLYWEIGHT_KEY, dict[str, ParameterData]]] = {}
+        # {(model, firmware, channel_type, paramset_key), number of channels}
+        self._flyweight_refs: Final[dict[_FLYWEIGHT_KEY, int]] = {}
+        # {id(shared paramset_description), (model, firmware, channel_type, paramset_key)}
+        self._flyweight_keys: Final[dict[int, _FLYWEIGHT_KEY]] = {}
+        self._migration_required: bool = False
 
     @property
     def raw_paramset_descriptions(
@@ -313,27 +603,152 @@ class ParamsetDescriptionCache(BasePersistentCache):
         paramset_description: dict[str, ParameterData],
     ) -> None:
         """Add paramset description to cache."""
+        if (
+            self._raw_paramset_descriptions.get(interface_id, {})
+            .get(channel_address, {})
+            .get(paramset_key)
+            != paramset_description
+        ):
+            self._record_change(
+                segment=interface_id,
+                entry=[_ADD, interface_id, channel_address, paramset_key, paramset_description],
+            )
+            # The entity plan of the device is only valid for unchanged paramset descriptions.
+            self._central.entity_plan.remove_entity_plan(
+                device_address=get_device_address(channel_address)
+            )
         if interface_id not in self._raw_paramset_descriptions:
             self._raw_paramset_descriptions[interface_id] = {}
         if channel_address not in self._raw_paramset_descriptions[interface_id]:
             self._raw_paramset_descriptions[interface_id][channel_address] = {}
-        if paramset_key not in self._raw_paramset_descriptions[interface_id][channel_address]:
-            self._raw_paramset_descriptions[interface_id][channel_address][paramset_key] = {}
+            self._add_channel_address(interface_id=interface_id, channel_address=channel_address)
+        replaced_paramset_description = self._raw_paramset_descriptions[interface_id][
+            channel_address
+        ].get(paramset_key)
 
         self._raw_paramset_descriptions[interface_id][channel_address][paramset_key] = (
-            paramset_description
+            self._get_flyweight(
+                interface_id=interface_id,
+                channel_address=channel_address,
+                paramset_key=paramset_key,
+                paramset_description=paramset_description,
+            )
         )
+        if replaced_paramset_description is not None:
+            self._release_flyweight(paramset_description=replaced_paramset_description)
 
         self._add_address_parameter(
             channel_address=channel_address, paramsets=[paramset_description]
         )
 
+    def _get_flyweight(
+        self,
+        interface_id: str,
+        channel_address: str,
+        paramset_key: ParamsetKey,
+        paramset_description: dict[str, ParameterData],
+    ) -> dict[str, ParameterData]:
+        """
+        Return the shared paramset description of channels with the same model and firmware.
+
+        The paramset description is only shared, if it is equal to the already known one.
+        The shared paramset descriptions must not be modified per channel.
+        The returned paramset description is counted as a reference of the channel.
+        """
+        key = self._get_flyweight_key(
+            interface_id=interface_id,
+            channel_address=channel_address,
+            paramset_key=paramset_key,
+        )
+        if (
+            key is not None
+            and (flyweight := self._flyweights.get(key)) is not None
+            and (flyweight is paramset_description or flyweight == paramset_description)
+        ):
+            self._flyweight_refs[key] += 1
+            return flyweight
+        interned = {
+            sys.intern(parameter): _intern_parameter_data(parameter_data=parameter_data)
+            for parameter, parameter_data in paramset_description.items()
+        }
+        if key is not None and key not in self._flyweights:
+            self._flyweights[key] = interned
+            self._flyweight_refs[key] = 1
+            self._flyweight_keys[id(interned)] = key
+        return interned
+
+    def _retain_flyweight(self, paramset_description: dict[str, ParameterData]) -> None:
+        """Count a further channel, that refers to a shared paramset description."""
+        if (key := self._flyweight_keys.get(id(paramset_description))) is not None:
+            self._flyweight_refs[key] += 1
+
+    def _release_flyweight(self, paramset_description: dict[str, ParameterData]) -> None:
+        """Remove a shared paramset description, if no channel refers to it anymore."""
+        if (key := self._flyweight_keys.get(id(paramset_description))) is None:
+            return
+        if (refs := self._flyweight_refs[key] - 1) > 0:
+            self._flyweight_refs[key] = refs
+            return
+        del self._flyweights[key]
+        del self._flyweight_refs[key]
+        del self._flyweight_keys[id(paramset_description)]
+
+    def _get_flyweight_key(
+        self, interface_id: str, channel_address: str, paramset_key: ParamsetKey
+    ) -> _FLYWEIGHT_KEY | None:
+        """Return the (model, firmware, channel_type, paramset_key) of a channel."""
+        device_descriptions = self._central.device_descriptions
+        if (
+            channel_description := device_descriptions.find_device_description(
+                interface_id=interface_id, device_address=channel_address
+            )
+        ) is None or (
+            device_description := device_descriptions.find_device_description(
+                interface_id=interface_id, device_address=get_device_address(channel_address)
+            )
+        ) is None:
+            return None
+        return (
+            device_description["TYPE"],
+            device_description.get("FIRMWARE"),
+            channel_description["TYPE"],
+            paramset_key,
+        )
+
+    @property
+    def flyweight_count(self) -> int:
+        """Return the number of shared paramset descriptions."""
+        return len(self._flyweights)
+
     def remove_device(self, device: HmDevice) -> None:
         """Remove device paramset descriptions from cache."""
         if interface := self._raw_paramset_descriptions.get(device.interface_id):
-            for channel_address in device.channels:
-                if channel_address in interface:
-                    del self._raw_paramset_descriptions[device.interface_id][channel_address]
+            if deleted_addresses := [
+                channel_address
+                for channel_address in device.channels
+                if channel_address in interface
+            ]:
+                self._record_change(
+                    segment=device.interface_id,
+                    entry=[_REMOVE, device.interface_id, deleted_addresses],
+                )
+            for channel_address in deleted_addresses:
+                for paramset_description in interface.pop(channel_address).values():
+                    self._release_flyweight(paramset_description=paramset_description)
+        self._channel_addresses.get(device.interface_id, {}).pop(device.address, None)
+
+    def _replay_journal_entry(self, entry: list[Any]) -> None:
+        """Apply an entry of the journal to the cache."""
+        if entry[0] == _ADD:
+            _, interface_id, channel_address, paramset_key, paramset_description = entry
+            self._raw_paramset_descriptions.setdefault(interface_id, {}).setdefault(
+                channel_address, {}
+            )[paramset_key] = paramset_description
+        else:
+            _, interface_id, deleted_addresses = entry
+            interface = self._raw_paramset_descriptions.get(interface_id, {})
+            for channel_address in deleted_addresses:
+                interface.pop(channel_address, None)
 
     def has_interface_id(self, interface_id: str) -> bool:
         """Return if interface is in paramset_descriptions cache."""
@@ -390,18 +805,64 @@ class ParamsetDescriptionCache(BasePersistentCache):
         """Get device channel addresses."""
         channel_addresses: dict[ParamsetKey, list[str]] = {}
         interface_paramset_descriptions = self._raw_paramset_descriptions[interface_id]
-        for (
-            channel_address,
-            paramset_descriptions,
-        ) in interface_paramset_descriptions.items():
-            if channel_address.startswith(device_address):
-                for p_key in paramset_descriptions:
-                    if (paramset_key := ParamsetKey(p_key)) not in channel_addresses:
-                        channel_addresses[paramset_key] = []
-                    channel_addresses[paramset_key].append(channel_address)
+        for channel_address in self._channel_addresses.get(interface_id, {}).get(
+            device_address, ()
+        ):
+            for p_key in interface_paramset_descriptions.get(channel_address, {}):
+                if (paramset_key := ParamsetKey(p_key)) not in channel_addresses:
+                    channel_addresses[paramset_key] = []
+                channel_addresses[paramset_key].append(channel_address)
 
         return channel_addresses
 
+    def _add_channel_address(self, interface_id: str, channel_address: str) -> None:
+        """Add the channel address to the channel addresses of its device."""
+        self._channel_addresses.setdefault(interface_id, {}).setdefault(
+            get_device_address(channel_address), set()
+        ).add(channel_address)
+
+    def _init_channel_addresses(self) -> None:
+        """Build the channel addresses of the devices."""
+        self._channel_addresses.clear()
+        for interface_id, channel_paramsets in self._raw_paramset_descriptions.items():
+            for channel_address in channel_paramsets:
+                self._add_channel_address(
+                    interface_id=interface_id, channel_address=channel_address
+                )
+
+    def _init_flyweights(self) -> None:
+        """
+        Replace the loaded paramset descriptions by the shared ones.
+
+        The paramset descriptions of the compact format are already shared in the file,
+        so each of them is only compared and interned once.
+        """
+        self._clear_flyweights()
+        # {id(loaded paramset_description), (loaded paramset_description, shared one)}
+        replaced: dict[int, tuple[dict[str, ParameterData], dict[str, ParameterData]]] = {}
+        for interface_id, channel_paramsets in self._raw_paramset_descriptions.items():
+            for channel_address, paramsets in channel_paramsets.items():
+                for paramset_key, paramset_description in paramsets.items():
+                    if (entry := replaced.get(id(paramset_description))) is None:
+                        entry = replaced[id(paramset_description)] = (
+                            paramset_description,
+                            self._get_flyweight(
+                                interface_id=interface_id,
+                                channel_address=channel_address,
+                                paramset_key=ParamsetKey(paramset_key),
+                                paramset_description=paramset_description,
+                            ),
+                        )
+                    else:
+                        self._retain_flyweight(paramset_description=entry[1])
+                    paramsets[paramset_key] = entry[1]
+
+    def _clear_flyweights(self) -> None:
+        """Clear the shared paramset descriptions and their references."""
+        self._flyweights.clear()
+        self._flyweight_refs.clear()
+        self._flyweight_keys.clear()
+
     def _init_address_parameter_list(self) -> None:
         """
         Initialize a device_address/parameter list.
@@ -433,9 +894,195 @@ class ParamsetDescriptionCache(BasePersistentCache):
             _LOGGER.debug("load: not caching device descriptions for %s", self._central.name)
             return DataOperationResult.NO_LOAD
         result = await super().load()
+        if self._migration_required:
+            # Enforce the next save to write the file in the configured format.
+            for interface_id in self._raw_paramset_descriptions:
+                self._record_change(segment=interface_id)
+            self.last_hash_saved = None
+            self._migration_required = False
+        self._init_flyweights()
         self._init_address_parameter_list()
+        self._init_channel_addresses()
         return result
 
-    async def save(self) -> DataOperationResult:
+    async def clear(self) -> None:
+        """Remove stored file and journal from disk and clear the indexes."""
+        await super().clear()
+        self._channel_addresses.clear()
+        self._clear_flyweights()
+
+    async def save(self, compact: bool = False) -> DataOperationResult:
         """Save current paramset descriptions to disk."""
-        return await super().save()
+        return await super().save(compact=compact)
+
+    def _get_file_content(self) -> Any:
+        """
+        Return a snapshot of the content, that is written to the file.
+
+        The compact format contains each shared paramset description only once,
+        and the channels refer to it by its index.
+        """
+        if not config.COMPACT_PARAMSET_CACHE:
+            return {
+                interface_id: {
+                    channel_address: dict(paramset_descriptions)
+                    for channel_address, paramset_descriptions in channel_paramsets.items()
+                }
+                for interface_id, channel_paramsets in self._raw_paramset_descriptions.items()
+            }
+
+        paramsets: list[dict[str, ParameterData]] = []
+        # {id(paramset_description), index}
+        indexes: dict[int, int] = {}
+        interfaces: dict[str, dict[str, dict[ParamsetKey, int]]] = {}
+        for interface_id, channel_paramsets in self._raw_paramset_descriptions.items():
+            interface = interfaces[interface_id] = {}
+            for channel_address, paramset_descriptions in channel_paramsets.items():
+                channel = interface[channel_address] = {}
+                for paramset_key, paramset_description in paramset_descriptions.items():
+                    if (index := indexes.get(id(paramset_description))) is None:
+                        index = indexes[id(paramset_description)] = len(paramsets)
+                        paramsets.append(paramset_description)
+                    channel[paramset_key] = index
+        return {_FORMAT: _FORMAT_COMPACT, _PARAMSETS: paramsets, _INTERFACES: interfaces}
+
+    def _get_cache_content(self, file_content: Any) -> dict[str, Any]:
+        """
+        Return the content of the cache from the content of the file.
+
+        Files of both formats can be loaded, so an existing file is migrated with the next save.
+        """
+        is_compact = file_content.get(_FORMAT) == _FORMAT_COMPACT
+        self._migration_required = is_compact != config.COMPACT_PARAMSET_CACHE
+        if not is_compact:
+            return super()._get_cache_content(file_content=file_content)
+
+        paramsets: list[dict[str, ParameterData]] = file_content[_PARAMSETS]
+        return {
+            interface_id: {
+                channel_address: {
+                    paramset_key: paramsets[index] for paramset_key, index in channel.items()
+                }
+                for channel_address, channel in interface.items()
+            }
+            for interface_id, interface in file_content[_INTERFACES].items()
+        }
+
+
+def _intern_parameter_data(parameter_data: ParameterData) -> ParameterData:
+    """Return a copy of the parameter data with interned strings."""
+    interned: dict[str, Any] = {}
+    for field, value in parameter_data.items():
+        if field in _INTERNED_PARAMETER_FIELDS and isinstance(value, str):
+            value = sys.intern(value)
+        elif field == "VALUE_LIST" and isinstance(value, list):
+            value = [sys.intern(item) if isinstance(item, str) else item for item in value]
+        interned[sys.intern(field)] = value
+    return cast(ParameterData, interned)
+
+
+class EntityPlanCache(BasePersistentCache):
+    """
+    Cache for the entity plans of the devices.
+
+    An entity plan contains the paramset_key, parameter and kind of all entities
+    and events of the channels of a device. It is replayed on device creation, as long as
+    the library version, the visibility rules, the un ignore list and the model and firmware
+    of the device match. The paramset description cache removes the entity plan of a device,
+    whose paramset descriptions are changed, so the validity is checked without hashing them.
+    """
+
+    _file_postfix = FILE_ENTITY_PLAN
+
+    def __init__(self, central: hmcu.CentralUnit) -> None:
+        """Init the entity plan cache."""
+        # {fingerprint, str},
+        # {devices, {device_address, {model, firmware, channels}}}
+        self._raw_entity_plans: Final[dict[str, Any]] = {}
+        super().__init__(
+            central=central,
+            persistant_cache=self._raw_entity_plans,
+        )
+        self._fingerprint: str | None = None
+
+    @property
+    def fingerprint(self) -> str:
+        """Return the fingerprint of the library version, the rules and the un ignore list."""
+        if self._fingerprint is None:
+            self._fingerprint = hash_sha256(
+                value=(
+                    _get_library_version(),
+                    self._central.parameter_visibility.rules_hash,
+                    sorted(self._central.parameter_visibility.raw_un_ignore_list),
+                )
+            )
+        return self._fingerprint
+
+    def _get_devices(self) -> dict[str, Any]:
+        """Return the device plans, that match the fingerprint."""
+        if self._raw_entity_plans.get(_FINGERPRINT) != self.fingerprint:
+            self._raw_entity_plans.clear()
+            self._raw_entity_plans[_FINGERPRINT] = self.fingerprint
+            self._raw_entity_plans[_DEVICES] = {}
+            self._record_change(segment=_FINGERPRINT)
+        devices: dict[str, Any] = self._raw_entity_plans[_DEVICES]
+        return devices
+
+    def _get_file_content(self) -> Any:
+        """Return a snapshot of the entity plans, that is written to the file."""
+        return {
+            **self._raw_entity_plans,
+            _DEVICES: dict(self._raw_entity_plans.get(_DEVICES, {})),
+        }
+
+    def get_entity_plan(self, device: HmDevice) -> dict[str, list[list[str]]] | None:
+        """Return the entity plan of the device, if it is still valid."""
+        if (
+            (device_plan := self._get_devices().get(device.address))
+            and device_plan[_MODEL] == device.model
+            and device_plan[_FIRMWARE] == device.firmware
+        ):
+            channels: dict[str, list[list[str]]] = device_plan[_CHANNELS]
+            return channels
+        return None
+
+    def add_entity_plan(self, device: HmDevice, entity_plan: dict[str, list[list[str]]]) -> None:
+        """Add the entity plan of a device to the cache."""
+        device_plan = self._get_devices()[device.address] = {
+            _MODEL: device.model,
+            _FIRMWARE: device.firmware,
+            _CHANNELS: entity_plan,
+        }
+        self._record_change(segment=device.address, entry=[_ADD, device.address, device_plan])
+
+    def remove_device(self, device: HmDevice) -> None:
+        """Remove the entity plan of a device from the cache."""
+        self.remove_entity_plan(device_address=device.address)
+
+    def remove_entity_plan(self, device_address: str) -> None:
+        """Remove the entity plan of a device, e.g. because its paramset descriptions changed."""
+        if self._get_devices().pop(device_address, None) is not None:
+            self._record_change(segment=device_address, entry=[_REMOVE, device_address])
+
+    def _replay_journal_entry(self, entry: list[Any]) -> None:
+        """Apply an entry of the journal to the cache."""
+        devices: dict[str, Any] = self._raw_entity_plans.setdefault(_DEVICES, {})
+        if entry[0] == _ADD:
+            devices[entry[1]] = entry[2]
+        else:
+            devices.pop(entry[1], None)
+
+    async def load(self) -> DataOperationResult:
+        """Load entity plans from disk."""
+        if not self._central.config.use_caches:
+            _LOGGER.debug("load: not caching entity plans for %s", self._central.name)
+            return DataOperationResult.NO_LOAD
+        return await super().load()
+
+
+def _get_library_version() -> str:
+    """Return the version of the installed library."""
+    try:
+        return version("hahomematic")
+    except PackageNotFoundError:
+        return hahomematic.__version__
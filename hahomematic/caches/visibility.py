@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from functools import lru_cache
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 import logging
 import os
 from typing import Any, Final
@@ -17,7 +17,7 @@ from hahomematic.const import (
     ParamsetKey,
 )
 from hahomematic.platforms.custom import get_required_parameters
-from hahomematic.support import element_matches_key, reduce_args
+from hahomematic.support import reduce_args
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -255,6 +255,36 @@ _IGNORE_PARAMETERS_BY_DEVICE: Final[Mapping[Parameter, tuple[str, ...]]] = {
 # but we want to use it only from a certain channel.
 _ACCEPT_PARAMETER_ONLY_ON_CHANNEL: Final[Mapping[str, int]] = {Parameter.LOWBAT: 0}
 
+# The kinds of a memoized visibility decision
+_DECISION_HIDDEN: Final = "hidden"
+_DECISION_IGNORED: Final = "ignored"
+_DECISION_UN_IGNORED: Final = "un_ignored"
+
+_EMPTY_PARAMETERS: Final[frozenset[str]] = frozenset()
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _ModelRules:
+    """The visibility rules of the un ignore/ignore lists compiled for a model."""
+
+    # model is ignored for custom entities
+    is_ignored: bool
+    # (channel_no, paramset_key): parameters of _RELEVANT_MASTER_PARAMSETS_BY_DEVICE
+    un_ignore_by_channel: Mapping[tuple[int | None, ParamsetKey], frozenset[str]]
+    has_un_ignore_by_channel: bool
+    # (channel_no, paramset_key): parameters of the un ignore file for the model
+    custom_un_ignore: Mapping[tuple[int | str | None, ParamsetKey], frozenset[str]]
+    # (channel_no, paramset_key): parameters of the un ignore file for all models
+    custom_un_ignore_all: Mapping[tuple[int | str | None, ParamsetKey], frozenset[str]]
+    # parameters of _UN_IGNORE_PARAMETERS_BY_DEVICE
+    un_ignore_parameters: frozenset[str]
+    # parameters of _IGNORE_PARAMETERS_BY_DEVICE
+    ignore_parameters: frozenset[str]
+    # lower case parameters of _IGNORE_DEVICES_FOR_ENTITY_EVENTS
+    ignore_events_lower: frozenset[str]
+    # channel_nos with a relevant MASTER paramset
+    relevant_master_channels: frozenset[int | None]
+
 
 class ParameterVisibilityCache:
     """Cache for parameter visibility."""
@@ -300,8 +330,54 @@ class ParameterVisibilityCache:
 
         # model, channel_no
         self._relevant_master_paramsets_by_device: Final[dict[str, set[int | None]]] = {}
+
+        # model: compiled rules
+        self._model_rules: Final[dict[str, _ModelRules]] = {}
+        # (decision, model, channel_no, paramset_key, parameter, custom_only): result
+        self._decisions: Final[
+            dict[tuple[str, str, int | None, ParamsetKey, str, bool], bool]
+        ] = {}
+        self._decision_hits: int = 0
+        self._decision_misses: int = 0
+        self._rules_hash: str | None = None
         self._init()
 
+    @property
+    def raw_un_ignore_list(self) -> frozenset[str]:
+        """Return the raw un ignore list of the config and the un ignore file."""
+        return frozenset(self._raw_un_ignore_list)
+
+    @property
+    def rules_hash(self) -> str:
+        """Return a hash of the visibility rules and the required parameters of custom entities."""
+        if self._rules_hash is None:
+            self._rules_hash = hms.hash_sha256(
+                value=(
+                    _CLIMATE_MASTER_PARAMETERS,
+                    _RELEVANT_MASTER_PARAMSETS_BY_DEVICE,
+                    _IGNORE_DEVICES_FOR_ENTITY_EVENTS,
+                    _HIDDEN_PARAMETERS,
+                    _IGNORED_PARAMETERS,
+                    _IGNORED_PARAMETERS_WILDCARDS_END,
+                    _IGNORED_PARAMETERS_WILDCARDS_START,
+                    _UN_IGNORE_PARAMETERS_BY_DEVICE,
+                    _IGNORE_PARAMETERS_BY_DEVICE,
+                    _ACCEPT_PARAMETER_ONLY_ON_CHANNEL,
+                    sorted(self._required_parameters),
+                )
+            )
+        return self._rules_hash
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return the statistics of the compiled rules and memoized decisions."""
+        return {
+            "models": len(self._model_rules),
+            "decisions": len(self._decisions),
+            "hits": self._decision_hits,
+            "misses": self._decision_misses,
+        }
+
     def _init(self) -> None:
         """Process cache initialisation."""
         for (
@@ -332,16 +408,106 @@ class ParameterVisibilityCache:
             else:
                 _add_channel(dt_l=model_l, params=parameters, ch_no=None)
 
-    @lru_cache(maxsize=128)
+    def _get_model_rules(self, model: str) -> _ModelRules:
+        """Return the rules for a model. The rules are compiled on first use."""
+        if (rules := self._model_rules.get(model)) is None:
+            rules = self._model_rules[model] = self._compile_model_rules(model=model)
+        return rules
+
+    def _compile_model_rules(self, model: str) -> _ModelRules:
+        """Compile the rules of the un ignore/ignore lists for a model."""
+        model_l = model.lower()
+
+        un_ignore_by_channel: dict[tuple[int | None, ParamsetKey], frozenset[str]] = {}
+        if dt_short := next(
+            (
+                dt
+                for dt in self._un_ignore_parameters_by_device_paramset_key
+                if model_l.startswith(dt)
+            ),
+            None,
+        ):
+            for channel_no, paramsets in self._un_ignore_parameters_by_device_paramset_key[
+                dt_short
+            ].items():
+                for paramset_key, parameters in paramsets.items():
+                    un_ignore_by_channel[(channel_no, paramset_key)] = frozenset(parameters)
+
+        def _flatten(
+            model_key: str,
+        ) -> dict[tuple[int | str | None, ParamsetKey], frozenset[str]]:
+            return {
+                (channel_no, ParamsetKey(paramset_key)): frozenset(parameters)
+                for channel_no, paramsets in self._custom_un_ignore_complex.get(
+                    model_key, {}
+                ).items()
+                for paramset_key, parameters in paramsets.items()
+            }
+
+        ignore_events_key = next(
+            (dt for dt in self._ignore_devices_for_entity_events_lower if model_l.startswith(dt)),
+            None,
+        )
+
+        return _ModelRules(
+            is_ignored=any(model_l.startswith(dt.lower()) for dt in self._ignore_custom_),
+            un_ignore_by_channel=un_ignore_by_channel,
+            has_un_ignore_by_channel=dt_short is not None,
+            custom_un_ignore=_flatten(model_key=model_l),
+            custom_un_ignore_all=_flatten(model_key=UN_IGNORE_WILDCARD),
+            un_ignore_parameters=frozenset(
+                _get_value_from_dict_by_wildcard_key(
+                    search_elements=self._un_ignore_parameters_by_device_lower,
+                    compare_with=model_l,
+                )
+                or ()
+            ),
+            ignore_parameters=frozenset(
+                parameter
+                for parameter, models in self._ignore_parameters_by_device_lower.items()
+                if any(model_l.startswith(dt) for dt in models)
+            ),
+            ignore_events_lower=frozenset(
+                event.lower()
+                for event in self._ignore_devices_for_entity_events_lower.get(
+                    ignore_events_key, ()
+                )
+            )
+            if ignore_events_key
+            else _EMPTY_PARAMETERS,
+            relevant_master_channels=frozenset(
+                channel_no
+                for dt, channel_nos in self._relevant_master_paramsets_by_device.items()
+                if model_l.startswith(dt.lower())
+                for channel_no in channel_nos
+            ),
+        )
+
+    def _get_decision(
+        self,
+        decision: str,
+        model: str,
+        channel_no: int | None,
+        paramset_key: ParamsetKey,
+        parameter: str,
+        custom_only: bool,
+        evaluate: Callable[[_ModelRules, int | None, ParamsetKey, str, bool], bool],
+    ) -> bool:
+        """Return a memoized decision, or evaluate it with the compiled rules of the model."""
+        key = (decision, model, channel_no, paramset_key, parameter, custom_only)
+        if (result := self._decisions.get(key)) is not None:
+            self._decision_hits += 1
+            return result
+        self._decision_misses += 1
+        result = self._decisions[key] = evaluate(
+            self._get_model_rules(model=model), channel_no, paramset_key, parameter, custom_only
+        )
+        return result
+
     def model_is_ignored(self, model: str) -> bool:
         """Check if a model should be ignored for custom entities."""
-        return element_matches_key(
-            search_elements=self._ignore_custom_,
-            compare_with=model.lower(),
-            do_wildcard_search=True,
-        )
+        return self._get_model_rules(model=model).is_ignored
 
-    @lru_cache(maxsize=1024)
     def parameter_is_ignored(
         self,
         model: str,
@@ -350,14 +516,32 @@ class ParameterVisibilityCache:
         parameter: str,
     ) -> bool:
         """Check if parameter can be ignored."""
-        model_l = model.lower()
+        return self._get_decision(
+            decision=_DECISION_IGNORED,
+            model=model,
+            channel_no=channel_no,
+            paramset_key=paramset_key,
+            parameter=parameter,
+            custom_only=False,
+            evaluate=self._evaluate_is_ignored,
+        )
 
+    def _evaluate_is_ignored(
+        self,
+        rules: _ModelRules,
+        channel_no: int | None,
+        paramset_key: ParamsetKey,
+        parameter: str,
+        custom_only: bool,
+    ) -> bool:
+        """Evaluate if parameter can be ignored."""
         if paramset_key == ParamsetKey.VALUES:
-            if self.parameter_is_un_ignored(
-                model=model,
+            if self._evaluate_is_un_ignored(
+                rules=rules,
                 channel_no=channel_no,
                 paramset_key=paramset_key,
                 parameter=parameter,
+                custom_only=False,
             ):
                 return False
 
@@ -370,16 +554,8 @@ class ParameterVisibilityCache:
                     )
                     and parameter not in self._required_parameters
                 )
-                or hms.element_matches_key(
-                    search_elements=self._ignore_parameters_by_device_lower.get(parameter, []),
-                    compare_with=model_l,
-                )
-                or hms.element_matches_key(
-                    search_elements=self._ignore_devices_for_entity_events_lower,
-                    compare_with=parameter,
-                    search_key=model_l,
-                    do_wildcard_search=False,
-                )
+                or parameter in rules.ignore_parameters
+                or parameter.lower() in rules.ignore_events_lower
             ):
                 return True
 
@@ -388,28 +564,22 @@ class ParameterVisibilityCache:
             ) is not None and accept_channel != channel_no:
                 return True
         if paramset_key == ParamsetKey.MASTER:
-            if parameter in self._custom_un_ignore_complex.get(model_l, {}).get(
-                channel_no, {}
-            ).get(ParamsetKey.MASTER, []):
+            if parameter in rules.custom_un_ignore.get(
+                (channel_no, ParamsetKey.MASTER), _EMPTY_PARAMETERS
+            ):
                 return False  # pragma: no cover
 
-            dt_short = tuple(
-                filter(
-                    model_l.startswith,
-                    self._un_ignore_parameters_by_device_paramset_key,
-                )
-            )
-            if dt_short and parameter not in self._un_ignore_parameters_by_device_paramset_key.get(
-                dt_short[0], {}
-            ).get(channel_no, {}).get(ParamsetKey.MASTER, []):
+            if rules.has_un_ignore_by_channel and parameter not in rules.un_ignore_by_channel.get(
+                (channel_no, ParamsetKey.MASTER), _EMPTY_PARAMETERS
+            ):
                 return True
 
         return False
 
-    def _parameter_is_un_ignored(
+    def _evaluate_custom_un_ignored(
         self,
-        model: str,
-        channel_no: int | str | None,
+        rules: _ModelRules,
+        channel_no: int | None,
         paramset_key: ParamsetKey,
         parameter: str,
         custom_only: bool = False,
@@ -420,50 +590,35 @@ class ParameterVisibilityCache:
         This can be either be the users un_ignore file, or in the
         predefined _UN_IGNORE_PARAMETERS_BY_DEVICE.
         """
-        model_l = model.lower()
-
-        # check if parameter is in custom_un_ignore
-        if (
-            paramset_key == ParamsetKey.VALUES
-            and parameter in self._custom_un_ignore_values_parameters
-        ):
-            return True
-
-        # check if parameter is in custom_un_ignore with paramset_key
-
-        search_matrix = (
-            (
-                (model_l, channel_no),
-                (model_l, UN_IGNORE_WILDCARD),
-                (UN_IGNORE_WILDCARD, channel_no),
-                (UN_IGNORE_WILDCARD, UN_IGNORE_WILDCARD),
-            )
-            if paramset_key == ParamsetKey.VALUES
-            else ((model_l, channel_no),)
-        )
+        if paramset_key == ParamsetKey.VALUES:
+            # check if parameter is in custom_un_ignore
+            if parameter in self._custom_un_ignore_values_parameters:
+                return True
 
-        for ml, cno in search_matrix:
+            # check if parameter is in custom_un_ignore with paramset_key
             if (
-                (custom_un_ignore := self._custom_un_ignore_complex)
-                and (channel_values := custom_un_ignore.get(ml))
-                and (paramset_key_values := channel_values.get(cno))
-                and parameter in paramset_key_values.get(paramset_key, set())
+                parameter
+                in rules.custom_un_ignore.get((channel_no, paramset_key), _EMPTY_PARAMETERS)
+                or parameter
+                in rules.custom_un_ignore.get(
+                    (UN_IGNORE_WILDCARD, paramset_key), _EMPTY_PARAMETERS
+                )
+                or parameter
+                in rules.custom_un_ignore_all.get((channel_no, paramset_key), _EMPTY_PARAMETERS)
+                or parameter
+                in rules.custom_un_ignore_all.get(
+                    (UN_IGNORE_WILDCARD, paramset_key), _EMPTY_PARAMETERS
+                )
             ):
                 return True  # pragma: no cover
+        elif parameter in rules.custom_un_ignore.get(
+            (channel_no, paramset_key), _EMPTY_PARAMETERS
+        ):
+            return True  # pragma: no cover
 
         # check if parameter is in _UN_IGNORE_PARAMETERS_BY_DEVICE
-        return bool(
-            not custom_only
-            and (
-                un_ignore_parameters := _get_value_from_dict_by_wildcard_key(
-                    search_elements=self._un_ignore_parameters_by_device_lower,
-                    compare_with=model_l,
-                )
-            )
-            and parameter in un_ignore_parameters
-        )
+        return not custom_only and parameter in rules.un_ignore_parameters
 
-    @lru_cache(maxsize=4096)
     def parameter_is_un_ignored(
         self,
         model: str,
@@ -475,25 +630,36 @@ class ParameterVisibilityCache:
         """
         Return if parameter is on an un_ignore list.
 
-        Additionally to _parameter_is_un_ignored these parameters
+        Additionally to _evaluate_custom_un_ignored these parameters
         from _RELEVANT_MASTER_PARAMSETS_BY_DEVICE are un ignored.
         """
-        if not custom_only:
-            dt_short = tuple(
-                filter(
-                    model.lower().startswith,
-                    self._un_ignore_parameters_by_device_paramset_key,
-                )
-            )
+        return self._get_decision(
+            decision=_DECISION_UN_IGNORED,
+            model=model,
+            channel_no=channel_no,
+            paramset_key=paramset_key,
+            parameter=parameter,
+            custom_only=custom_only,
+            evaluate=self._evaluate_is_un_ignored,
+        )
 
-            # check if parameter is in _RELEVANT_MASTER_PARAMSETS_BY_DEVICE
-            if dt_short and parameter in self._un_ignore_parameters_by_device_paramset_key.get(
-                dt_short[0], {}
-            ).get(channel_no, {}).get(paramset_key, set()):
-                return True
+    def _evaluate_is_un_ignored(
+        self,
+        rules: _ModelRules,
+        channel_no: int | None,
+        paramset_key: ParamsetKey,
+        parameter: str,
+        custom_only: bool,
+    ) -> bool:
+        """Evaluate if parameter is on an un_ignore list."""
+        # check if parameter is in _RELEVANT_MASTER_PARAMSETS_BY_DEVICE
+        if not custom_only and parameter in rules.un_ignore_by_channel.get(
+            (channel_no, paramset_key), _EMPTY_PARAMETERS
+        ):
+            return True
 
-        return self._parameter_is_un_ignored(
-            model=model,
+        return self._evaluate_custom_un_ignored(
+            rules=rules,
             channel_no=channel_no,
             paramset_key=paramset_key,
             parameter=parameter,
@@ -646,7 +812,6 @@ class ParameterVisibilityCache:
             self._custom_un_ignore_complex[model][channel_no][paramset_key] = set()
         self._custom_un_ignore_complex[model][channel_no][paramset_key].add(parameter)
 
-    @lru_cache(maxsize=1024)
     def parameter_is_hidden(
         self,
         model: str,
@@ -660,11 +825,30 @@ class ParameterVisibilityCache:
         This is required to determine the entity usage.
         Return only hidden parameters, that are no defined in the un_ignore file.
         """
-        return parameter in _HIDDEN_PARAMETERS and not self._parameter_is_un_ignored(
+        return self._get_decision(
+            decision=_DECISION_HIDDEN,
             model=model,
             channel_no=channel_no,
             paramset_key=paramset_key,
             parameter=parameter,
+            custom_only=False,
+            evaluate=self._evaluate_is_hidden,
+        )
+
+    def _evaluate_is_hidden(
+        self,
+        rules: _ModelRules,
+        channel_no: int | None,
+        paramset_key: ParamsetKey,
+        parameter: str,
+        custom_only: bool,
+    ) -> bool:
+        """Evaluate if parameter should be hidden."""
+        return parameter in _HIDDEN_PARAMETERS and not self._evaluate_custom_un_ignored(
+            rules=rules,
+            channel_no=channel_no,
+            paramset_key=paramset_key,
+            parameter=parameter,
         )
 
     def is_relevant_paramset(
@@ -681,15 +865,7 @@ class ParameterVisibilityCache:
         if paramset_key == ParamsetKey.VALUES:
             return True
         if paramset_key == ParamsetKey.MASTER:
-            for (
-                d_type,
-                channel_nos,
-            ) in self._relevant_master_paramsets_by_device.items():
-                if channel_no in channel_nos and hms.element_matches_key(
-                    search_elements=d_type,
-                    compare_with=model,
-                ):
-                    return True
+            return channel_no in self._get_model_rules(model=model).relevant_master_channels
         return False
 
     async def load(self) -> None:
@@ -731,6 +907,10 @@ class ParameterVisibilityCache:
             if "#" not in line:
                 self._add_line_to_cache(line)
 
+        # The rules are compiled with the content of the un ignore file.
+        self._model_rules.clear()
+        self._decisions.clear()
+
 
 def check_ignore_parameters_is_clean() -> bool:
     """Check if a required parameter is in ignored parameters."""
@@ -8,12 +8,13 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Coroutine, Mapping, Set as AbstractSet
+from contextlib import suppress
 from datetime import datetime
 from functools import partial
 import logging
 from logging import DEBUG
 import threading
-from time import sleep
+from time import monotonic, sleep
 from typing import Any, Final, cast
 
 from aiohttp import ClientSession
@@ -22,11 +23,17 @@ import voluptuous as vol
 
 from hahomematic import client as hmcl, config
 from hahomematic.async_support import Looper, loop_check
+from hahomematic.caches.catalog import ParameterCatalog
 from hahomematic.caches.dynamic import CentralDataCache, DeviceDetailsCache
-from hahomematic.caches.persistent import DeviceDescriptionCache, ParamsetDescriptionCache
+from hahomematic.caches.persistent import (
+    DeviceDescriptionCache,
+    EntityPlanCache,
+    ParamsetDescriptionCache,
+)
 from hahomematic.caches.visibility import ParameterVisibilityCache
 from hahomematic.central import xml_rpc_server as xmlrpc
 from hahomematic.central.decorators import callback_backend_system, callback_event
+from hahomematic.central.registry import EntityRegistry
 from hahomematic.client.json_rpc import JsonRpcAioHttpClient
 from hahomematic.client.xml_rpc import XmlRpcProxy
 from hahomematic.const import (
@@ -45,11 +52,9 @@ from hahomematic.const import (
     EVENT_DATA,
     EVENT_INTERFACE_ID,
     EVENT_TYPE,
-    IGNORE_FOR_UN_IGNORE_PARAMETERS,
     IP_ANY_V4,
     PLATFORMS,
     PORT_ANY,
-    UN_IGNORE_WILDCARD,
     BackendSystemEvent,
     DeviceDescription,
     DeviceFirmwareState,
@@ -70,7 +75,7 @@ from hahomematic.exceptions import (
     NoClients,
     NoConnection,
 )
-from hahomematic.performance import measure_execution_time
+from hahomematic.performance import StartupReport, measure_execution_time
 from hahomematic.platforms import create_entities_and_events
 from hahomematic.platforms.custom import CustomEntity, create_custom_entities
 from hahomematic.platforms.decorators import info_property, service
@@ -82,7 +87,6 @@ from hahomematic.platforms.hub import GenericHubEntity, GenericSystemVariable, H
 from hahomematic.platforms.support import PayloadMixin
 from hahomematic.support import (
     check_config,
-    get_channel_no,
     get_device_address,
     get_entity_key,
     get_ip_addr,
@@ -128,7 +132,10 @@ class CentralUnit(PayloadMixin):
         self._device_details: Final = DeviceDetailsCache(central=self)
         self._device_descriptions: Final = DeviceDescriptionCache(central=self)
         self._paramset_descriptions: Final = ParamsetDescriptionCache(central=self)
+        self._entity_plan: Final = EntityPlanCache(central=self)
         self._parameter_visibility: Final = ParameterVisibilityCache(central=self)
+        self._parameter_catalog: Final = ParameterCatalog(central=self)
+        self._entity_registry: Final = EntityRegistry()
 
         self._primary_client: hmcl.Client | None = None
         # {interface_id, client}
@@ -140,8 +147,16 @@ class CentralUnit(PayloadMixin):
         self._devices: Final[dict[str, HmDevice]] = {}
         # {sysvar_name, sysvar_entity}
         self._sysvar_entities: Final[dict[str, GenericSystemVariable]] = {}
-        # {sysvar_name, program_button}U
+        # {entity_name, sysvar_entity}
+        self._sysvar_entities_by_name: Final[dict[str, GenericSystemVariable]] = {}
+        # {sysvar_id, sysvar_entity}
+        self._sysvar_entities_by_vid: Final[dict[str, GenericSystemVariable]] = {}
+        # {program_id, program_button}
         self._program_buttons: Final[dict[str, HmProgramButton]] = {}
+        # {program_name, program_button}
+        self._program_buttons_by_ccu_name: Final[dict[str, HmProgramButton]] = {}
+        # {entity_name, program_button}
+        self._program_buttons_by_name: Final[dict[str, HmProgramButton]] = {}
         # Signature: (name, *args)
         # e.g. DEVICES_CREATED, HUB_REFRESHED
         self._backend_system_callbacks: Final[set[Callable]] = set()
@@ -154,6 +169,7 @@ class CentralUnit(PayloadMixin):
 
         CENTRAL_INSTANCES[self.name] = self
         self._connection_checker: Final = _ConnectionChecker(central=self)
+        self._cache_save_scheduler: Final = _CacheSaveScheduler(central=self)
         self._hub: Hub = Hub(central=self)
         self._version: str | None = None
         # store last event received datetime by interface
@@ -161,12 +177,22 @@ class CentralUnit(PayloadMixin):
         self._callback_ip_addr: str = IP_ANY_V4
         self._listen_ip_addr: str = IP_ANY_V4
         self._listen_port: int = PORT_ANY
+        self._startup_report: Final = StartupReport(name=self.name)
 
     @property
     def available(self) -> bool:
         """Return the availability of the central."""
         return all(client.available for client in self._clients.values())
 
+    @property
+    def cache_write_counts(self) -> dict[str, int]:
+        """Return the number of writes of the persistent caches."""
+        return {
+            "device_descriptions": self._device_descriptions.write_count,
+            "paramset_descriptions": self._paramset_descriptions.write_count,
+            "entity_plan": self._entity_plan.write_count,
+        }
+
     @property
     def callback_ip_addr(self) -> str:
         """Return the xml rpc server callback ip address."""
@@ -233,11 +259,26 @@ class CentralUnit(PayloadMixin):
         """Return if XmlRPC-Server is alive."""
         return all(client.is_callback_alive() for client in self._clients.values())
 
+    @property
+    def entity_registry(self) -> EntityRegistry:
+        """Return entity_registry."""
+        return self._entity_registry
+
+    @property
+    def entity_plan(self) -> EntityPlanCache:
+        """Return entity_plan cache."""
+        return self._entity_plan
+
     @property
     def paramset_descriptions(self) -> ParamsetDescriptionCache:
         """Return paramset_descriptions cache."""
         return self._paramset_descriptions
 
+    @property
+    def parameter_catalog(self) -> ParameterCatalog:
+        """Return parameter_catalog."""
+        return self._parameter_catalog
+
     @property
     def parameter_visibility(self) -> ParameterVisibilityCache:
         """Return parameter_visibility cache."""
@@ -294,6 +335,11 @@ class CentralUnit(PayloadMixin):
         """Return if the central is started."""
         return self._started
 
+    @property
+    def startup_report(self) -> StartupReport:
+        """Return the timing report of the last startup."""
+        return self._startup_report
+
     @property
     def supports_ping_pong(self) -> bool:
         """Return the backend supports ping pong."""
@@ -322,34 +368,84 @@ class CentralUnit(PayloadMixin):
         return self._version
 
     def add_sysvar_entity(self, sysvar_entity: GenericSystemVariable) -> None:
-        """Add new program button."""
+        """Add new sysvar entity."""
         if (ccu_var_name := sysvar_entity.ccu_var_name) is not None:
             self._sysvar_entities[ccu_var_name] = sysvar_entity
+            if sysvar_entity.name is not None:
+                self._sysvar_entities_by_name[sysvar_entity.name] = sysvar_entity
+            if sysvar_entity.vid is not None:
+                self._sysvar_entities_by_vid[sysvar_entity.vid] = sysvar_entity
 
     def remove_sysvar_entity(self, name: str) -> None:
         """Remove a sysvar entity."""
         if (sysvar_entity := self.get_sysvar_entity(name=name)) is not None:
             sysvar_entity.fire_device_removed_callback()
-            del self._sysvar_entities[name]
+            del self._sysvar_entities[sysvar_entity.ccu_var_name]
+            if sysvar_entity.name is not None:
+                _remove_from_index(
+                    index=self._sysvar_entities_by_name,
+                    key=sysvar_entity.name,
+                    entity=sysvar_entity,
+                )
+            if sysvar_entity.vid is not None:
+                _remove_from_index(
+                    index=self._sysvar_entities_by_vid,
+                    key=sysvar_entity.vid,
+                    entity=sysvar_entity,
+                )
 
     def add_program_button(self, program_button: HmProgramButton) -> None:
         """Add new program button."""
         self._program_buttons[program_button.pid] = program_button
+        self._program_buttons_by_ccu_name[program_button.ccu_program_name] = program_button
+        if program_button.name is not None:
+            self._program_buttons_by_name[program_button.name] = program_button
+
+    def rename_program_button(
+        self, program_button: HmProgramButton, old_ccu_program_name: str
+    ) -> None:
+        """Update the program name index of a program button, whose program was renamed."""
+        _remove_from_index(
+            index=self._program_buttons_by_ccu_name,
+            key=old_ccu_program_name,
+            entity=program_button,
+        )
+        self._program_buttons_by_ccu_name[program_button.ccu_program_name] = program_button
 
     def remove_program_button(self, pid: str) -> None:
         """Remove a program button."""
         if (program_button := self.get_program_button(pid=pid)) is not None:
             program_button.fire_device_removed_callback()
             del self._program_buttons[pid]
+            _remove_from_index(
+                index=self._program_buttons_by_ccu_name,
+                key=program_button.ccu_program_name,
+                entity=program_button,
+            )
+            if program_button.name is not None:
+                _remove_from_index(
+                    index=self._program_buttons_by_name,
+                    key=program_button.name,
+                    entity=program_button,
+                )
 
     async def save_caches(
-        self, save_device_descriptions: bool = False, save_paramset_descriptions: bool = False
+        self,
+        save_device_descriptions: bool = False,
+        save_paramset_descriptions: bool = False,
+        save_entity_plan: bool = False,
+        compact: bool = False,
     ) -> None:
-        """Save persistent caches."""
+        """Save persistent caches. With compact the journals are compacted into the files."""
         if save_device_descriptions:
-            await self._device_descriptions.save()
+            await self._device_descriptions.save(compact=compact)
+        # Changed paramset descriptions remove the entity plans of their devices.
+        # The entity plans are saved first, so a stored plan never outlives the paramset
+        # descriptions, it has been created for.
+        if save_entity_plan or save_paramset_descriptions:
+            await self._entity_plan.save(compact=compact)
         if save_paramset_descriptions:
-            await self._paramset_descriptions.save()
+            await self._paramset_descriptions.save(compact=compact)
 
     async def start(self) -> None:
         """Start processing of the central unit."""
@@ -357,6 +453,7 @@ class CentralUnit(PayloadMixin):
         if self._started:
             _LOGGER.debug("START: Central %s already started", self.name)
             return
+        self._startup_report.start()
         if self._config.interface_configs and (
             ip_addr := await self._identify_ip_addr(
                 port=tuple(self._config.interface_configs)[0].port
@@ -388,24 +485,51 @@ class CentralUnit(PayloadMixin):
                 f"START: Failed to start central unit {self.name}: {reduce_args(args=oserr.args)}"
             ) from oserr
 
-        await self._parameter_visibility.load()
+        with self._startup_report.measure(phase="load_parameter_visibility"):
+            await self._parameter_visibility.load()
         if self._config.start_direct:
             if await self._create_clients():
                 for client in self._clients.values():
-                    await self._refresh_device_descriptions(client=client)
+                    with self._startup_report.measure(
+                        phase="refresh_device_descriptions", interface_id=client.interface_id
+                    ):
+                        await self._refresh_device_descriptions(client=client)
         else:
             await self._start_clients()
             if self._config.enable_server:
                 self._start_connection_checker()
 
         self._started = True
+        # The entity plans of a successful start are replayed on the next start.
+        await self.save_caches(save_entity_plan=True)
+        self._finish_startup_report()
+
+    def _finish_startup_report(self) -> None:
+        """Finish the startup report with the counters of the central."""
+        self._startup_report.finish(
+            devices=len(self._devices),
+            channels=sum(len(device.channels) for device in self._devices.values()),
+            entities=len(self.get_entities(exclude_no_create=False)),
+            rpc_calls=sum(client.request_count for client in self._clients.values())
+            + self._json_rpc_client.request_count,
+        )
+        if config.LOG_STARTUP_REPORT:
+            self._startup_report.log_summary(slowest_devices=config.STARTUP_REPORT_SLOWEST_DEVICES)
+
+    def get_startup_report(self, slowest_devices: int | None = None) -> dict[str, Any]:
+        """Return the timing report of the last startup as dict."""
+        return self._startup_report.as_dict(
+            slowest_devices=slowest_devices
+            if slowest_devices is not None
+            else config.STARTUP_REPORT_SLOWEST_DEVICES
+        )
 
     async def stop(self) -> None:
         """Stop processing of the central unit."""
         if not self._started:
             _LOGGER.debug("STOP: Central %s not started", self.name)
             return
-        await self.save_caches(save_device_descriptions=True, save_paramset_descriptions=True)
+        await self._cache_save_scheduler.flush(compact=True)
         self._stop_connection_checker()
         await self._stop_clients()
         if self._json_rpc_client.is_activated:
@@ -491,7 +615,8 @@ class CentralUnit(PayloadMixin):
             await self._load_caches()
             if new_device_addresses := self._check_for_new_device_addresses():
                 await self._create_devices(new_device_addresses=new_device_addresses)
-            await self._init_hub()
+            with self._startup_report.measure(phase="init_hub"):
+                await self._init_hub()
             await self._init_clients()
 
     async def _stop_clients(self) -> None:
@@ -518,37 +643,20 @@ class CentralUnit(PayloadMixin):
             )
             return False
 
-        for interface_config in self._config.interface_configs:
-            try:
-                if client := await hmcl.create_client(
-                    central=self,
-                    interface_config=interface_config,
-                ):
-                    if (
-                        available_interfaces := client.system_information.available_interfaces
-                    ) and (interface_config.interface not in available_interfaces):
-                        _LOGGER.debug(
-                            "CREATE_CLIENTS failed: Interface: %s is not available for backend",
-                            interface_config.interface,
-                        )
-                        continue
-                    _LOGGER.debug(
-                        "CREATE_CLIENTS: Adding client %s to %s",
-                        client.interface_id,
-                        self.name,
-                    )
-                    self._clients[client.interface_id] = client
-            except BaseHomematicException as ex:
-                self.fire_interface_event(
-                    interface_id=interface_config.interface_id,
-                    interface_event_type=InterfaceEventType.PROXY,
-                    data={EVENT_AVAILABLE: False},
-                )
-                _LOGGER.warning(
-                    "CREATE_CLIENTS failed: No connection to interface %s [%s]",
-                    interface_config.interface_id,
-                    reduce_args(args=ex.args),
+        # The clients are created concurrently, so a slow interface does not delay the others.
+        for client in await asyncio.gather(
+            *(
+                self._create_client(interface_config=interface_config)
+                for interface_config in self._config.interface_configs
+            )
+        ):
+            if client:
+                _LOGGER.debug(
+                    "CREATE_CLIENTS: Adding client %s to %s",
+                    client.interface_id,
+                    self.name,
                 )
+                self._clients[client.interface_id] = client
 
         if self.has_clients:
             _LOGGER.debug(
@@ -560,11 +668,62 @@ class CentralUnit(PayloadMixin):
         _LOGGER.debug("CREATE_CLIENTS failed for %s", self.name)
         return False
 
+    async def _create_client(self, interface_config: hmcl.InterfaceConfig) -> hmcl.Client | None:
+        """Create a client for an interface within the interface timeout."""
+        try:
+            with self._startup_report.measure(
+                phase="create_client", interface_id=interface_config.interface_id
+            ):
+                async with asyncio.timeout(config.INTERFACE_TIMEOUT):
+                    client = await hmcl.create_client(
+                        central=self,
+                        interface_config=interface_config,
+                    )
+        except (BaseHomematicException, TimeoutError) as ex:
+            self.fire_interface_event(
+                interface_id=interface_config.interface_id,
+                interface_event_type=InterfaceEventType.PROXY,
+                data={EVENT_AVAILABLE: False},
+            )
+            _LOGGER.warning(
+                "CREATE_CLIENTS failed: No connection to interface %s [%s]",
+                interface_config.interface_id,
+                reduce_args(args=ex.args) if ex.args else type(ex).__name__,
+            )
+            return None
+
+        if (available_interfaces := client.system_information.available_interfaces) and (
+            interface_config.interface not in available_interfaces
+        ):
+            _LOGGER.debug(
+                "CREATE_CLIENTS failed: Interface: %s is not available for backend",
+                interface_config.interface,
+            )
+            return None
+        return client
+
     async def _init_clients(self) -> None:
-        """Init clients of control unit, and start connection checker."""
-        for client in self._clients.values():
-            if await client.proxy_init() == ProxyInitState.INIT_SUCCESS:
-                _LOGGER.debug("INIT_CLIENTS: client for %s initialized", client.interface_id)
+        """Init clients of control unit concurrently."""
+        await asyncio.gather(
+            *(self._init_client(client=client) for client in self._clients.values())
+        )
+
+    async def _init_client(self, client: hmcl.Client) -> None:
+        """Init a client within the interface timeout."""
+        try:
+            with self._startup_report.measure(
+                phase="proxy_init", interface_id=client.interface_id
+            ):
+                async with asyncio.timeout(config.INTERFACE_TIMEOUT):
+                    proxy_init_state = await client.proxy_init()
+        except TimeoutError:
+            _LOGGER.warning(
+                "INIT_CLIENTS failed: Timeout while initializing client for %s",
+                client.interface_id,
+            )
+            return
+        if proxy_init_state == ProxyInitState.INIT_SUCCESS:
+            _LOGGER.debug("INIT_CLIENTS: client for %s initialized", client.interface_id)
 
     async def _de_init_clients(self) -> None:
         """De-init clients."""
@@ -658,10 +817,7 @@ class CentralUnit(PayloadMixin):
 
     def get_entity_by_custom_id(self, custom_id: str) -> CallbackEntity | None:
         """Return homematic entity by custom_id."""
-        for entity in self.get_entities(registered=True):
-            if entity.custom_id == custom_id:
-                return entity
-        return None
+        return self._entity_registry.get_entity_by_custom_id(custom_id=custom_id)
 
     def get_entities(
         self,
@@ -670,28 +826,15 @@ class CentralUnit(PayloadMixin):
         registered: bool | None = None,
     ) -> tuple[CallbackEntity, ...]:
         """Return all externally registered entities."""
-        all_entities: list[CallbackEntity] = []
-        for device in self._devices.values():
-            all_entities.extend(
-                device.get_entities(
-                    platform=platform, exclude_no_create=exclude_no_create, registered=registered
-                )
-            )
-        return tuple(all_entities)
+        return self._entity_registry.get_entities(
+            platform=platform, exclude_no_create=exclude_no_create, registered=registered
+        )
 
     def get_readable_generic_entities(
         self, paramset_key: ParamsetKey | None = None
     ) -> tuple[GenericEntity, ...]:
         """Return the readable generic entities."""
-        return tuple(
-            ge
-            for ge in self.get_entities()
-            if (
-                isinstance(ge, GenericEntity)
-                and ge.is_readable
-                and ((paramset_key and ge.paramset_key == paramset_key) or paramset_key is None)
-            )
-        )
+        return self._entity_registry.get_readable_generic_entities(paramset_key=paramset_key)
 
     def _get_primary_client(self) -> hmcl.Client | None:
         """Return the client by interface_id or the first with a virtual remote."""
@@ -719,13 +862,7 @@ class CentralUnit(PayloadMixin):
         self, event_type: HomematicEventType, registered: bool | None = None
     ) -> tuple[tuple[GenericEvent, ...], ...]:
         """Return all channel event entities."""
-        hm_channel_events: list[tuple[GenericEvent, ...]] = []
-        for device in self.devices:
-            for channel_events in device.get_events(event_type=event_type).values():
-                if registered is None or (channel_events[0].is_registered == registered):
-                    hm_channel_events.append(channel_events)
-                    continue
-        return tuple(hm_channel_events)
+        return self._entity_registry.get_events(event_type=event_type, registered=registered)
 
     def get_virtual_remotes(self) -> tuple[HmDevice, ...]:
         """Get the virtual remote for the Client."""
@@ -749,10 +886,16 @@ class CentralUnit(PayloadMixin):
     async def _load_caches(self) -> None:
         """Load files to caches."""
         try:
-            await self._device_descriptions.load()
-            await self._paramset_descriptions.load()
-            await self._device_details.load()
-            await self._data_cache.load()
+            with self._startup_report.measure(phase="load_device_descriptions"):
+                await self._device_descriptions.load()
+            with self._startup_report.measure(phase="load_paramset_descriptions"):
+                await self._paramset_descriptions.load()
+            with self._startup_report.measure(phase="load_entity_plan"):
+                await self._entity_plan.load()
+            with self._startup_report.measure(phase="load_device_details"):
+                await self._device_details.load()
+            with self._startup_report.measure(phase="load_data_cache"):
+                await self._data_cache.load()
         except orjson.JSONDecodeError:  # pragma: no cover
             _LOGGER.warning("LOAD_CACHES failed: Unable to load caches for %s", self.name)
             await self.clear_caches()
@@ -765,54 +908,135 @@ class CentralUnit(PayloadMixin):
             )
         _LOGGER.debug("CREATE_DEVICES: Starting to create devices for %s", self.name)
 
-        new_devices = set[HmDevice]()
+        new_devices: dict[str, set[HmDevice]] = {}
 
+        # Creating the devices is CPU-only, so it is done before the values are loaded.
         for interface_id, device_addresses in new_device_addresses.items():
-            for device_address in device_addresses:
-                # Do we check for duplicates here? For now, we do.
-                if device_address in self._devices:
-                    continue
-                device: HmDevice | None = None
-                try:
-                    device = HmDevice(
-                        central=self,
-                        interface_id=interface_id,
-                        device_address=device_address,
-                    )
-                except Exception as ex:  # pragma: no cover
-                    _LOGGER.error(
-                        "CREATE_DEVICES failed: %s [%s] Unable to create device: %s, %s",
-                        type(ex).__name__,
-                        reduce_args(args=ex.args),
-                        interface_id,
-                        device_address,
-                    )
+            with self._startup_report.measure(phase="create_devices", interface_id=interface_id):
+                self._create_interface_devices(
+                    interface_id=interface_id,
+                    device_addresses=device_addresses,
+                    new_devices=new_devices,
+                )
+        _LOGGER.debug("CREATE_DEVICES: Finished creating devices for %s", self.name)
+
+        await asyncio.gather(
+            *(
+                self._load_device_values(interface_id=interface_id, devices=devices)
+                for interface_id, devices in new_devices.items()
+            )
+        )
+
+    def _create_interface_devices(
+        self,
+        interface_id: str,
+        device_addresses: set[str],
+        new_devices: dict[str, set[HmDevice]],
+    ) -> None:
+        """Create the devices of an interface with their entities."""
+        for device_address in device_addresses:
+            # Do we check for duplicates here? For now, we do.
+            if device_address in self._devices:
+                continue
+            device: HmDevice | None = None
+            try:
+                device = HmDevice(
+                    central=self,
+                    interface_id=interface_id,
+                    device_address=device_address,
+                )
+            except Exception as ex:  # pragma: no cover
+                _LOGGER.error(
+                    "CREATE_DEVICES failed: %s [%s] Unable to create device: %s, %s",
+                    type(ex).__name__,
+                    reduce_args(args=ex.args),
+                    interface_id,
+                    device_address,
+                )
+            try:
+                if device:
+                    create_entities_and_events(device=device)
+                    create_custom_entities(device=device)
+                    new_devices.setdefault(interface_id, set()).add(device)
+            except Exception as ex:  # pragma: no cover
+                _LOGGER.error(
+                    "CREATE_DEVICES failed: %s [%s] Unable to create entities: %s, %s",
+                    type(ex).__name__,
+                    reduce_args(args=ex.args),
+                    interface_id,
+                    device_address,
+                )
+
+    async def _load_device_values(self, interface_id: str, devices: set[HmDevice]) -> None:
+        """
+        Load the values of new devices of an interface concurrently and publish the devices.
+
+        A device is only added to the central, if its values have been loaded.
+        """
+        sema = asyncio.Semaphore(max(1, config.MAX_CONCURRENT_VALUE_LOADS))
+        added_devices: set[HmDevice] = set()
+        loaded_devices = 0
+        loaded_entities = 0
+
+        async def _load_value_cache(device: HmDevice) -> None:
+            nonlocal loaded_devices, loaded_entities
+            async with sema:
                 try:
-                    if device:
-                        create_entities_and_events(device=device)
-                        create_custom_entities(device=device)
+                    with self._startup_report.measure_device(device_address=device.address):
                         await device.load_value_cache()
-                        new_devices.add(device)
-                        self._devices[device_address] = device
+                    self._parameter_catalog.add_device(device=device)
+                    self._devices[device.address] = device
+                    self._entity_registry.add_device(device=device)
+                    added_devices.add(device)
                 except Exception as ex:  # pragma: no cover
                     _LOGGER.error(
-                        "CREATE_DEVICES failed: %s [%s] Unable to create entities: %s, %s",
+                        "LOAD_DEVICE_VALUES failed: %s [%s] Unable to load values: %s, %s",
                         type(ex).__name__,
                         reduce_args(args=ex.args),
                         interface_id,
-                        device_address,
+                        device.address,
                     )
-        _LOGGER.debug("CREATE_DEVICES: Finished creating devices for %s", self.name)
-
-        if new_devices:
-            new_entities = _get_new_entities(new_devices=new_devices)
-            new_channel_events = _get_new_channel_events(new_devices=new_devices)
+            loaded_devices += 1
+            loaded_entities += len(device.generic_entities)
             self.fire_backend_system_callback(
-                system_event=BackendSystemEvent.DEVICES_CREATED,
-                new_entities=new_entities,
-                new_channel_events=new_channel_events,
+                system_event=BackendSystemEvent.DEVICES_LOADING,
+                interface_id=interface_id,
+                loaded_devices=loaded_devices,
+                total_devices=len(devices),
+                loaded_entities=loaded_entities,
             )
 
+        with self._startup_report.measure(phase="load_device_values", interface_id=interface_id):
+            await asyncio.gather(*(_load_value_cache(device=device) for device in devices))
+        _LOGGER.debug(
+            "LOAD_DEVICE_VALUES: Loaded values of %i devices for %s", loaded_devices, interface_id
+        )
+
+        # The devices of an interface are published, as soon as their values are loaded.
+        if not added_devices:
+            return
+        self.fire_backend_system_callback(
+            system_event=BackendSystemEvent.DEVICES_CREATED,
+            new_entities=self._drain_new_entities(
+                device_addresses={device.address for device in added_devices}
+            ),
+            new_channel_events=_get_new_channel_events(new_devices=added_devices),
+        )
+
+    def _drain_new_entities(
+        self, device_addresses: AbstractSet[str]
+    ) -> Mapping[HmPlatform, AbstractSet[CallbackEntity]]:
+        """Return the new entities of the devices by platform."""
+        return {
+            platform: set(
+                self._entity_registry.drain_new_entities(
+                    platform=platform, device_addresses=device_addresses
+                )
+            )
+            for platform in PLATFORMS
+            if platform != HmPlatform.EVENT
+        }
+
     async def delete_device(self, interface_id: str, device_address: str) -> None:
         """Delete devices from central."""
         _LOGGER.debug(
@@ -839,7 +1063,9 @@ class CentralUnit(PayloadMixin):
         for address in addresses:
             if device := self._devices.get(address):
                 self.remove_device(device=device)
-        await self.save_caches()
+        self._cache_save_scheduler.schedule(
+            save_device_descriptions=True, save_paramset_descriptions=True, save_entity_plan=True
+        )
 
     @callback_backend_system(system_event=BackendSystemEvent.NEW_DEVICES)
     async def add_new_devices(
@@ -870,11 +1096,8 @@ class CentralUnit(PayloadMixin):
 
         async with self._sema_add_devices:
             # We need this to avoid adding duplicates.
-            known_addresses = tuple(
-                dev_desc["ADDRESS"]
-                for dev_desc in self._device_descriptions.get_raw_device_descriptions(
-                    interface_id=interface_id
-                )
+            known_addresses = frozenset(
+                self._device_descriptions.get_device_descriptions(interface_id=interface_id)
             )
             client = self._clients[interface_id]
             save_paramset_descriptions = False
@@ -886,7 +1109,10 @@ class CentralUnit(PayloadMixin):
                     )
                     save_device_descriptions = True
                     if dev_desc["ADDRESS"] not in known_addresses:
-                        await client.fetch_paramset_descriptions(device_description=dev_desc)
+                        with self._startup_report.measure(
+                            phase="fetch_paramset_descriptions", interface_id=interface_id
+                        ):
+                            await client.fetch_paramset_descriptions(device_description=dev_desc)
                         save_paramset_descriptions = True
                 except Exception as ex:  # pragma: no cover
                     _LOGGER.error(
@@ -895,13 +1121,15 @@ class CentralUnit(PayloadMixin):
                         reduce_args(args=ex.args),
                     )
 
-            await self.save_caches(
+            self._cache_save_scheduler.schedule(
                 save_device_descriptions=save_device_descriptions,
                 save_paramset_descriptions=save_paramset_descriptions,
             )
             if new_device_addresses := self._check_for_new_device_addresses():
-                await self._device_details.load()
-                await self._data_cache.load()
+                with self._startup_report.measure(phase="load_device_details"):
+                    await self._device_details.load()
+                with self._startup_report.measure(phase="load_data_cache"):
+                    await self._data_cache.load()
                 await self._create_devices(new_device_addresses=new_device_addresses)
 
     def _check_for_new_device_addresses(self) -> dict[str, set[str]]:
@@ -978,6 +1206,10 @@ class CentralUnit(PayloadMixin):
             parameter=parameter,
         )
 
+        if entity_key not in self._entity_event_subscriptions:
+            # Hidden entities are only created on first access or event.
+            self._create_lazy_entity(channel_address=channel_address, parameter=parameter)
+
         if entity_key in self._entity_event_subscriptions:
             try:
                 for callback_handler in self._entity_event_subscriptions[entity_key]:
@@ -1009,6 +1241,15 @@ class CentralUnit(PayloadMixin):
         )
         return result
 
+    def _create_lazy_entity(self, channel_address: str, parameter: str) -> None:
+        """Create an entity of a channel, that is only created on first access or event."""
+        if device := self.get_device(address=channel_address):
+            device.get_generic_entity(
+                channel_address=channel_address,
+                parameter=parameter,
+                paramset_key=ParamsetKey.VALUES,
+            )
+
     def add_event_subscription(self, entity: BaseParameterEntity) -> None:
         """Add entity to central event subscription."""
         if isinstance(entity, (GenericEntity, GenericEvent)) and entity.supports_events:
@@ -1040,7 +1281,10 @@ class CentralUnit(PayloadMixin):
 
         self._device_descriptions.remove_device(device=device)
         self._paramset_descriptions.remove_device(device=device)
+        self._entity_plan.remove_device(device=device)
         self._device_details.remove_device(device=device)
+        self._parameter_catalog.remove_device(device=device)
+        self._entity_registry.remove_device(device=device)
         del self._devices[device.address]
 
     def remove_event_subscription(self, entity: BaseParameterEntity) -> None:
@@ -1116,48 +1360,17 @@ class CentralUnit(PayloadMixin):
     ) -> list[str]:
         """Return all parameters from VALUES paramset."""
         parameters: set[str] = set()
-        for channels in self._paramset_descriptions.raw_paramset_descriptions.values():
-            for channel_address in channels:
-                model: str | None = None
-                if full_format:
-                    model = self._device_descriptions.get_model(
-                        device_address=get_device_address(address=channel_address)
-                    )
-                for parameter, parameter_data in (
-                    channels[channel_address].get(paramset_key, {}).items()
-                ):
-                    if all(parameter_data["OPERATIONS"] & operation for operation in operations):
-                        if un_ignore_candidates_only and (
-                            (
-                                (
-                                    generic_entity := self.get_generic_entity(
-                                        channel_address=channel_address,
-                                        parameter=parameter,
-                                        paramset_key=paramset_key,
-                                    )
-                                )
-                                and generic_entity.enabled_default
-                                and not generic_entity.is_un_ignored
-                            )
-                            or parameter in IGNORE_FOR_UN_IGNORE_PARAMETERS
-                        ):
-                            continue
-
-                        if not full_format:
-                            parameters.add(parameter)
-                            continue
-
-                        channel = (
-                            UN_IGNORE_WILDCARD
-                            if use_channel_wildcard
-                            else get_channel_no(address=channel_address)
-                        )
-
-                        full_parameter = f"{parameter}:{paramset_key}@{model}:"
-                        if channel is not None:
-                            full_parameter += str(channel)
-                        parameters.add(full_parameter)
-
+        for entry in self._parameter_catalog.query(
+            paramset_key=paramset_key,
+            operations=operations,
+            un_ignore_candidates_only=un_ignore_candidates_only,
+        ):
+            if not full_format:
+                parameters.add(entry.parameter)
+            elif use_channel_wildcard:
+                parameters.add(entry.un_ignore_wildcard_name)
+            else:
+                parameters.add(entry.un_ignore_name)
         return list(parameters)
 
     def _get_virtual_remote(self, device_address: str) -> HmDevice | None:
@@ -1194,15 +1407,22 @@ class CentralUnit(PayloadMixin):
         """Return the sysvar entity."""
         if sysvar := self._sysvar_entities.get(name):
             return sysvar
-        for sysvar in self._sysvar_entities.values():
-            if sysvar.name == name:
-                return sysvar
-        return None
+        return self._sysvar_entities_by_name.get(name)
+
+    def get_sysvar_entity_by_vid(self, vid: str) -> GenericSystemVariable | None:
+        """Return the sysvar entity by the id of the system variable."""
+        return self._sysvar_entities_by_vid.get(vid)
 
     def get_program_button(self, pid: str) -> HmProgramButton | None:
         """Return the program button."""
         return self._program_buttons.get(pid)
 
+    def get_program_button_by_name(self, name: str) -> HmProgramButton | None:
+        """Return the program button by the name of the program or of the entity."""
+        if program_button := self._program_buttons_by_ccu_name.get(name):
+            return program_button
+        return self._program_buttons_by_name.get(name)
+
     def get_un_ignore_candidates(self, include_master: bool = False) -> list[str]:
         """Return the candidates for un_ignore."""
         candidates = sorted(
@@ -1244,6 +1464,7 @@ class CentralUnit(PayloadMixin):
         """Clear all stored data."""
         await self._device_descriptions.clear()
         await self._paramset_descriptions.clear()
+        await self._entity_plan.clear()
         self._device_details.clear()
         self._data_cache.clear()
 
@@ -1343,6 +1564,86 @@ class CentralUnit(PayloadMixin):
         return f"central name: {self.name}"
 
 
+class _CacheSaveScheduler:
+    """
+    Debounce and coalesce the saves of the persistent caches.
+
+    The caches are saved, when no further save was requested within the debounce window,
+    but not later than the max delay after the first request.
+    """
+
+    def __init__(self, central: CentralUnit) -> None:
+        """Init the cache save scheduler."""
+        self._central: Final = central
+        self._save_device_descriptions: bool = False
+        self._save_paramset_descriptions: bool = False
+        self._save_entity_plan: bool = False
+        self._first_requested_at: float | None = None
+        self._last_requested_at: float = 0.0
+        self._is_scheduled: bool = False
+        self._wakeup: Final = asyncio.Event()
+
+    def schedule(
+        self,
+        save_device_descriptions: bool = False,
+        save_paramset_descriptions: bool = False,
+        save_entity_plan: bool = False,
+    ) -> None:
+        """Request a save of the caches."""
+        if not (save_device_descriptions or save_paramset_descriptions or save_entity_plan):
+            return
+        self._save_device_descriptions |= save_device_descriptions
+        self._save_paramset_descriptions |= save_paramset_descriptions
+        self._save_entity_plan |= save_entity_plan
+        self._last_requested_at = monotonic()
+        if self._first_requested_at is None:
+            self._first_requested_at = self._last_requested_at
+        if self._is_scheduled:
+            self._wakeup.set()
+        else:
+            self._is_scheduled = True
+            self._central.looper.create_task(
+                target=self._save_when_idle(), name=f"save_caches_{self._central.name}"
+            )
+
+    async def _save_when_idle(self) -> None:
+        """Save the caches after the debounce window or the max delay."""
+        try:
+            while self._first_requested_at is not None:
+                if (
+                    delay := min(
+                        self._last_requested_at + config.SAVE_CACHES_DEBOUNCE,
+                        self._first_requested_at + config.SAVE_CACHES_MAX_DELAY,
+                    )
+                    - monotonic()
+                ) > 0:
+                    # Wait for the next request, a flush or the end of the delay.
+                    self._wakeup.clear()
+                    with suppress(TimeoutError):
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    continue
+                await self.flush()
+        finally:
+            self._is_scheduled = False
+
+    async def flush(self, compact: bool = False) -> None:
+        """Save the requested caches now. With compact all caches are saved and compacted."""
+        save_device_descriptions = self._save_device_descriptions or compact
+        save_paramset_descriptions = self._save_paramset_descriptions or compact
+        save_entity_plan = self._save_entity_plan or compact
+        self._save_device_descriptions = False
+        self._save_paramset_descriptions = False
+        self._save_entity_plan = False
+        self._first_requested_at = None
+        self._wakeup.set()
+        await self._central.save_caches(
+            save_device_descriptions=save_device_descriptions,
+            save_paramset_descriptions=save_paramset_descriptions,
+            save_entity_plan=save_entity_plan,
+            compact=compact,
+        )
+
+
 class _ConnectionChecker(threading.Thread):
     """Periodically check Connection to CCU / Homegear."""
 
@@ -1383,23 +1684,26 @@ class _ConnectionChecker(threading.Thread):
                 )
                 await self._central.restart_clients()
             else:
-                reconnects: list[Any] = []
-                for interface_id in self._central.interface_ids:
-                    # check:
-                    #  - client is available
-                    #  - client is connected
-                    #  - interface callback is alive
-                    client = self._central.get_client(interface_id=interface_id)
-                    if (
-                        client.available is False
-                        or not await client.is_connected()
-                        or not client.is_callback_alive()
-                    ):
-                        reconnects.append(client.reconnect())
-                if reconnects:
-                    await asyncio.gather(*reconnects)
-                    if self._central.available:
-                        await self._central.load_and_refresh_entity_data()
+                # The interfaces are checked concurrently, so a hanging interface
+                # does not delay the reconnect of the others.
+                results = await asyncio.gather(
+                    *(
+                        self._check_client(
+                            client=self._central.get_client(interface_id=interface_id)
+                        )
+                        for interface_id in self._central.interface_ids
+                    ),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        _LOGGER.error(
+                            "CHECK_CONNECTION failed: %s [%s]",
+                            type(result).__name__,
+                            reduce_args(args=result.args),
+                        )
+                if any(result is True for result in results) and self._central.available:
+                    await self._central.load_and_refresh_entity_data()
         except NoConnection as nex:
             _LOGGER.error("CHECK_CONNECTION failed: no connection: %s", reduce_args(args=nex.args))
         except Exception as ex:
@@ -1409,6 +1713,26 @@ class _ConnectionChecker(threading.Thread):
                 reduce_args(args=ex.args),
             )
 
+    async def _check_client(self, client: hmcl.Client) -> bool:
+        """Check the connection of a client and reconnect it, if required. Return if reconnected."""
+        # check:
+        #  - client is available
+        #  - client is connected
+        #  - interface callback is alive
+        try:
+            async with asyncio.timeout(config.INTERFACE_TIMEOUT):
+                if client.available and await client.is_connected() and client.is_callback_alive():
+                    return False
+        except TimeoutError:
+            _LOGGER.warning(
+                "CHECK_CONNECTION failed: Timeout while checking interface %s",
+                client.interface_id,
+            )
+        # Events may have been missed, so a full sync of the device data is required.
+        self._central.data_cache.clear(interface=client.interface)
+        await client.reconnect()
+        return True
+
 
 class CentralConfig:
     """Config for a Client."""
@@ -1617,24 +1941,6 @@ class CentralConnectionState:
             )
 
 
-def _get_new_entities(
-    new_devices: set[HmDevice],
-) -> Mapping[HmPlatform, AbstractSet[CallbackEntity]]:
-    """Return new entities by platform."""
-
-    entities_by_platform: dict[HmPlatform, set[CallbackEntity]] = {
-        platform: set() for platform in PLATFORMS if platform != HmPlatform.EVENT
-    }
-
-    for device in new_devices:
-        for platform in entities_by_platform:
-            entities_by_platform[platform].update(
-                device.get_entities(platform=platform, exclude_no_create=True, registered=False)
-            )
-
-    return entities_by_platform
-
-
 def _get_new_channel_events(new_devices: set[HmDevice]) -> tuple[tuple[GenericEvent, ...], ...]:
     """Return new channel events by platform."""
     channel_events: list[tuple[GenericEvent, ...]] = []
@@ -1649,3 +1955,9 @@ def _get_new_channel_events(new_devices: set[HmDevice]) -> tuple[tuple[GenericEv
                 channel_events.append(hm_channel_events)  # type: ignore[arg-type] # noqa:PERF401
 
     return tuple(channel_events)
+
+
+def _remove_from_index[_T](index: dict[str, _T], key: str, entity: _T) -> None:
+    """Remove an entity from an index, if the key still refers to the entity."""
+    if index.get(key) is entity:
+        del index[key]
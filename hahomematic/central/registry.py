@@ -0,0 +1,210 @@
+"""Registry of the entities of the devices of the central."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from typing import Final
+
+from hahomematic.const import EntityUsage, HmPlatform, HomematicEventType, ParamsetKey
+from hahomematic.platforms.device import HmDevice
+from hahomematic.platforms.entity import CallbackEntity
+from hahomematic.platforms.event import GenericEvent
+from hahomematic.platforms.generic import GenericEntity
+
+
+class EntityRegistry:
+    """
+    Indexes of the entities and events of the registered devices.
+
+    The indexes are maintained, when devices are added or removed, lazy entities are created
+    and entities are registered or unregistered externally. Dynamic attributes like the usage
+    are still evaluated on the entities of the index.
+
+    Added entities are kept per platform, until they are drained by a consumer.
+    The generation is increased with each added or removed entity, so consumers can
+    cheaply detect, that the entities have changed.
+    """
+
+    def __init__(self) -> None:
+        """Init the entity registry."""
+        # {unique_id, entity}
+        self._entities: Final[dict[str, CallbackEntity]] = {}
+        # {platform, {unique_id, entity}}
+        self._entities_by_platform: Final[dict[HmPlatform, dict[str, CallbackEntity]]] = {}
+        # {custom_id, {unique_id, entity}}
+        self._entities_by_custom_id: Final[dict[str, dict[str, CallbackEntity]]] = {}
+        # {unique_id, entity}
+        self._registered_entities: Final[dict[str, CallbackEntity]] = {}
+        # {paramset_key, {unique_id, entity}}
+        self._readable_entities: Final[dict[ParamsetKey, dict[str, GenericEntity]]] = {}
+        # {event_type, {channel_address, {unique_id, event}}}
+        self._events: Final[dict[HomematicEventType, dict[str, dict[str, GenericEvent]]]] = {}
+        # {device_address, {unique_id}}
+        self._unique_ids_by_device: Final[dict[str, set[str]]] = {}
+        # {platform, {device_address, {unique_id, entity}}}
+        self._new_entities: Final[dict[HmPlatform, dict[str, dict[str, CallbackEntity]]]] = {}
+        self._generation: int = 0
+
+    @property
+    def generation(self) -> int:
+        """Return the generation, that is increased with each added or removed entity."""
+        return self._generation
+
+    def add_device(self, device: HmDevice) -> None:
+        """Add the entities and events of a device."""
+        if device.update_entity:
+            self.add_entity(device_address=device.address, entity=device.update_entity)
+        for channel in device.channels.values():
+            for entity in channel.get_entities(exclude_no_create=False):
+                self.add_entity(device_address=device.address, entity=entity)
+            for event in channel.generic_events:
+                self._add_event(device_address=device.address, event=event)
+
+    def add_entity(
+        self, device_address: str, entity: CallbackEntity, record_new: bool = True
+    ) -> None:
+        """
+        Add an entity of a device.
+
+        Entities, that are never published (e.g. hidden entities created on first access),
+        are added with record_new=False and are not recorded as new.
+        """
+        if (unique_id := entity.unique_id) not in self._entities:
+            if record_new:
+                self._new_entities.setdefault(entity.platform, {}).setdefault(
+                    device_address, {}
+                )[unique_id] = entity
+            self._generation += 1
+        self._entities[unique_id] = entity
+        self._entities_by_platform.setdefault(entity.platform, {})[unique_id] = entity
+        if isinstance(entity, GenericEntity) and entity.is_readable:
+            self._readable_entities.setdefault(entity.paramset_key, {})[unique_id] = entity
+        self._unique_ids_by_device.setdefault(device_address, set()).add(unique_id)
+        self.update_custom_id(entity=entity, old_custom_id=None)
+
+    def _add_event(self, device_address: str, event: GenericEvent) -> None:
+        """Add an event of a device."""
+        self._events.setdefault(event.event_type, {}).setdefault(event.channel.address, {})[
+            event.unique_id
+        ] = event
+        self._unique_ids_by_device.setdefault(device_address, set()).add(event.unique_id)
+
+    def remove_device(self, device: HmDevice) -> None:
+        """Remove the entities and events of a device."""
+        for unique_id in self._unique_ids_by_device.pop(device.address, set()):
+            if (entity := self._entities.pop(unique_id, None)) is None:
+                continue
+            self._generation += 1
+            self._entities_by_platform.get(entity.platform, {}).pop(unique_id, None)
+            self._registered_entities.pop(unique_id, None)
+            if entity.custom_id is not None:
+                self._remove_custom_id(unique_id=unique_id, custom_id=entity.custom_id)
+            if isinstance(entity, GenericEntity):
+                self._readable_entities.get(entity.paramset_key, {}).pop(unique_id, None)
+        for channel_address in device.channels:
+            for channel_events in self._events.values():
+                channel_events.pop(channel_address, None)
+        for new_entities in self._new_entities.values():
+            new_entities.pop(device.address, None)
+
+    def drain_new_entities(
+        self, platform: HmPlatform, device_addresses: Collection[str] | None = None
+    ) -> tuple[CallbackEntity, ...]:
+        """
+        Return and forget the added entities of the platform, optionally limited to devices.
+
+        Only entities, that should be created and are not registered externally, are returned.
+        """
+        if (new_entities := self._new_entities.get(platform)) is None:
+            return ()
+        if device_addresses is None:
+            drained = list(new_entities.values())
+            new_entities.clear()
+        else:
+            drained = [
+                entities
+                for device_address in device_addresses
+                if (entities := new_entities.pop(device_address, None))
+            ]
+        return tuple(
+            entity
+            for entities in drained
+            for entity in entities.values()
+            if entity.usage != EntityUsage.NO_CREATE and not entity.is_registered
+        )
+
+    def update_custom_id(self, entity: CallbackEntity, old_custom_id: str | None) -> None:
+        """Update the indexes of an entity, that has been registered or unregistered."""
+        if (unique_id := entity.unique_id) not in self._entities:
+            return
+        if old_custom_id is not None:
+            self._remove_custom_id(unique_id=unique_id, custom_id=old_custom_id)
+        if (custom_id := entity.custom_id) is None:
+            self._registered_entities.pop(unique_id, None)
+            return
+        self._registered_entities[unique_id] = entity
+        self._entities_by_custom_id.setdefault(custom_id, {})[unique_id] = entity
+
+    def _remove_custom_id(self, unique_id: str, custom_id: str) -> None:
+        """Remove an entity from the index by custom_id."""
+        if (entities := self._entities_by_custom_id.get(custom_id)) is not None:
+            entities.pop(unique_id, None)
+            if not entities:
+                del self._entities_by_custom_id[custom_id]
+
+    def get_entity(self, unique_id: str) -> CallbackEntity | None:
+        """Return the entity by unique_id."""
+        return self._entities.get(unique_id)
+
+    def get_entity_by_custom_id(self, custom_id: str) -> CallbackEntity | None:
+        """Return the first entity, that is registered by the custom_id."""
+        if entities := self._entities_by_custom_id.get(custom_id):
+            return next(iter(entities.values()))
+        return None
+
+    def get_entities(
+        self,
+        platform: HmPlatform | None = None,
+        exclude_no_create: bool = True,
+        registered: bool | None = None,
+    ) -> tuple[CallbackEntity, ...]:
+        """Return the entities."""
+        if registered is True:
+            entities = self._registered_entities
+        elif platform is None:
+            entities = self._entities
+        else:
+            entities = self._entities_by_platform.get(platform, {})
+        return tuple(
+            entity
+            for entity in entities.values()
+            if (platform is None or entity.platform == platform)
+            and (not exclude_no_create or entity.usage != EntityUsage.NO_CREATE)
+            and (registered is None or entity.is_registered == registered)
+        )
+
+    def get_readable_generic_entities(
+        self, paramset_key: ParamsetKey | None = None
+    ) -> tuple[GenericEntity, ...]:
+        """Return the readable generic entities, that are not excluded from creation."""
+        paramset_keys = (paramset_key,) if paramset_key else tuple(self._readable_entities)
+        return tuple(
+            entity
+            for p_key in paramset_keys
+            for entity in self._readable_entities.get(p_key, {}).values()
+            if entity.usage != EntityUsage.NO_CREATE
+        )
+
+    def get_events(
+        self, event_type: HomematicEventType, registered: bool | None = None
+    ) -> tuple[tuple[GenericEvent, ...], ...]:
+        """Return the events of the channels grouped by channel."""
+        return tuple(
+            channel_events
+            for channel_events in (
+                tuple(events.values())
+                for events in self._events.get(event_type, {}).values()
+                if events
+            )
+            if registered is None or channel_events[0].is_registered == registered
+        )
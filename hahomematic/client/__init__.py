@@ -37,6 +37,7 @@ from hahomematic.const import (
     ProgramData,
     ProxyInitState,
     SystemInformation,
+    SystemVariableChanges,
     SystemVariableData,
 )
 from hahomematic.exceptions import BaseHomematicException, ClientException, NoConnection
@@ -131,6 +132,11 @@ class Client(ABC):
         """Return the ping pong cache."""
         return self._ping_pong_cache
 
+    @property
+    def request_count(self) -> int:
+        """Return the number of XmlRPC requests of the client."""
+        return self._proxy.request_count + self._proxy_read.request_count
+
     @property
     def system_information(self) -> SystemInformation:
         """Return the system_information of the client."""
@@ -352,6 +358,10 @@ class Client(ABC):
     ) -> tuple[SystemVariableData, ...]:
         """Get all system variables from CCU / Homegear."""
 
+    @abstractmethod
+    async def get_system_variables_since(self, since: int) -> SystemVariableChanges | None:
+        """Get the system variables, that changed since the given timestamp, if supported."""
+
     @abstractmethod
     async def get_all_programs(self, include_internal: bool) -> tuple[ProgramData, ...]:
         """Get all programs, if available."""
@@ -521,6 +531,27 @@ class Client(ABC):
                 f"GET_VALUE failed with for: {channel_address}/{parameter}/{paramset_key}: {reduce_args(args=ex.args)}"
             ) from ex
 
+    @service(log_level=logging.NOTSET)
+    async def get_values(
+        self,
+        channel_address: str,
+        paramset_key: ParamsetKey,
+        call_source: CallSource = CallSource.MANUAL_OR_SCHEDULED,
+    ) -> dict[str, Any]:
+        """Return all values of a paramset of a channel from CCU."""
+        try:
+            _LOGGER.debug(
+                "GET_VALUES: channel_address %s, paramset_key, %s, source:%s",
+                channel_address,
+                paramset_key,
+                call_source,
+            )
+            return await self._proxy_read.getParamset(channel_address, paramset_key) or {}
+        except BaseHomematicException as ex:
+            raise ClientException(
+                f"GET_VALUES failed with for: {channel_address}/{paramset_key}: {reduce_args(args=ex.args)}"
+            ) from ex
+
     @measure_execution_time
     @service()
     async def _set_value(
@@ -951,19 +982,39 @@ class ClientCCU(Client):
 
     @measure_execution_time
     async def fetch_all_device_data(self) -> None:
-        """Fetch all device data from CCU."""
-        if all_device_data := await self._json_rpc_client.get_all_device_data(
-            interface=self.interface
-        ):
-            _LOGGER.debug(
-                "FETCH_ALL_DEVICE_DATA: Fetched all device data for interface %s", self.interface
-            )
-            self.central.data_cache.add_data(all_device_data=all_device_data)
-        else:
+        """Fetch all device data from CCU, that changed since the last sync."""
+        data_cache = self.central.data_cache
+        since = data_cache.get_sync_timestamp(interface=self.interface)
+        if await self._fetch_device_data_since(since=since):
+            return
+        if since > 0:
+            # The delta could not be applied, so a full sync is required.
+            data_cache.clear(interface=self.interface)
+            await self._fetch_device_data_since(since=0)
+
+    async def _fetch_device_data_since(self, since: int) -> bool:
+        """Fetch the device data changed since the timestamp. Return False, if a full sync is required."""
+        server_time, device_data = await self._json_rpc_client.get_device_data_since(
+            interface=self.interface, since=since
+        )
+        if server_time is None:
             _LOGGER.debug(
-                "FETCH_ALL_DEVICE_DATA: Unable to get all device data via JSON-RPC RegaScript for interface %s",
+                "FETCH_ALL_DEVICE_DATA: Unable to get device data via JSON-RPC RegaScript for interface %s",
                 self.interface,
             )
+            return True
+        _LOGGER.debug(
+            "FETCH_ALL_DEVICE_DATA: Fetched %i datapoints since %i for interface %s",
+            len(device_data),
+            since,
+            self.interface,
+        )
+        return self.central.data_cache.add_data(
+            interface=self.interface,
+            all_device_data=device_data,
+            sync_timestamp=server_time,
+            is_delta=since > 0,
+        )
 
     async def check_connection_availability(self, handle_ping_pong: bool) -> bool:
         """Check if _proxy is still initialized."""
@@ -1034,6 +1085,10 @@ class ClientCCU(Client):
             include_internal=include_internal
         )
 
+    async def get_system_variables_since(self, since: int) -> SystemVariableChanges | None:
+        """Get the system variables, that changed since the given timestamp, if supported."""
+        return await self._json_rpc_client.get_system_variables_since(since=since)
+
     async def get_all_programs(self, include_internal: bool) -> tuple[ProgramData, ...]:
         """Get all programs, if available."""
         return await self._json_rpc_client.get_all_programs(include_internal=include_internal)
@@ -1179,6 +1234,10 @@ class ClientHomegear(Client):
             ) from ex
         return tuple(variables)
 
+    async def get_system_variables_since(self, since: int) -> SystemVariableChanges | None:
+        """Get the system variables, that changed since the given timestamp, if supported."""
+        return None
+
     async def get_all_programs(self, include_internal: bool) -> tuple[ProgramData, ...]:
         """Get all programs, if available."""
         return ()
@@ -10,6 +10,7 @@ import os
 from pathlib import Path
 from ssl import SSLContext
 from typing import Any, Final
+from urllib.parse import unquote
 
 from aiohttp import (
     ClientConnectorCertificateError,
@@ -27,14 +28,17 @@ from hahomematic.const import (
     CONF_USERNAME,
     DEFAULT_ENCODING,
     HTMLTAG_PATTERN,
+    INIT_DATETIME,
     PATH_JSON_RPC,
-    REGA_SCRIPT_FETCH_ALL_DEVICE_DATA,
+    REGA_SCRIPT_FETCH_DEVICE_DATA_SINCE,
     REGA_SCRIPT_GET_SERIAL,
     REGA_SCRIPT_PATH,
     REGA_SCRIPT_SET_SYSTEM_VARIABLE,
     REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER,
+    REGA_SCRIPT_SYSTEM_VARIABLES_SINCE,
     ProgramData,
     SystemInformation,
+    SystemVariableChanges,
     SystemVariableData,
     SysvarType,
 )
@@ -46,12 +50,13 @@ from hahomematic.exceptions import (
     NoConnection,
     UnsupportedException,
 )
-from hahomematic.support import get_tls_context, parse_sys_var, reduce_args
+from hahomematic.support import changed_within_seconds, get_tls_context, parse_sys_var, reduce_args
 
 _LOGGER: Final = logging.getLogger(__name__)
 
 
 _CHANNEL_IDS: Final = "channelIds"
+_DATA: Final = "data"
 _HAS_EXT_MARKER: Final = "hasExtMarker"
 _ID: Final = "id"
 _IS_ACTIVE: Final = "isActive"
@@ -66,10 +71,14 @@ _P_MESSAGE: Final = "message"
 _P_RESULT: Final = "result"
 _SESSION_ID: Final = "_session_id_"
 _SERIAL: Final = "serial"
+_SERVER_TIME: Final = "serverTime"
+_SIGNATURE: Final = "signature"
+_SINCE: Final = "since"
 _TYPE: Final = "type"
 _UNIT: Final = "unit"
 _VALUE: Final = "value"
 _VALUE_LIST: Final = "valueList"
+_VALUES: Final = "values"
 
 
 class _JsonRpcMethod(StrEnum):
@@ -122,6 +131,9 @@ class JsonRpcAioHttpClient:
         self._last_session_id_refresh: datetime | None = None
         self._session_id: str | None = None
         self._supported_methods: tuple[str, ...] | None = None
+        self._sysvar_ext_markers: dict[str, bool] = {}
+        self._sysvar_ext_markers_refreshed_at = INIT_DATETIME
+        self.request_count: int = 0
 
     @property
     def is_activated(self) -> bool:
@@ -309,6 +321,7 @@ class JsonRpcAioHttpClient:
 
         try:
             payload = orjson.dumps({"method": method, "params": params, "jsonrpc": "1.1", "id": 0})
+            self.request_count += 1
 
             headers = {
                 "Content-Type": "application/json",
@@ -542,7 +555,9 @@ class JsonRpcAioHttpClient:
 
             _LOGGER.debug("GET_ALL_SYSTEM_VARIABLES: Getting all system variables")
             if json_result := response[_P_RESULT]:
-                ext_markers = await self._get_system_variables_ext_markers()
+                ext_markers = await self._get_cached_system_variables_ext_markers(
+                    vids={var[_ID] for var in json_result}
+                )
                 for var in json_result:
                     is_internal = var[_IS_INTERNAL]
                     if include_internal is False and is_internal is True:
@@ -578,6 +593,7 @@ class JsonRpcAioHttpClient:
                                 max_value=max_value,
                                 min_value=min_value,
                                 extended_sysvar=extended_sysvar,
+                                vid=var_id,
                             )
                         )
                     except (ValueError, TypeError) as vterr:
@@ -594,10 +610,56 @@ class JsonRpcAioHttpClient:
 
         return tuple(variables)
 
-    async def _get_system_variables_ext_markers(self) -> dict[str, Any]:
+    async def get_system_variables_since(self, since: int) -> SystemVariableChanges | None:
+        """
+        Get the system variables, that changed since the given timestamp.
+
+        A timestamp of 0 returns only the server time and the signature of the system variable ids.
+        """
+        iid = "GET_SYSTEM_VARIABLES_SINCE"
+        try:
+            response = await self._post_script(
+                script_name=REGA_SCRIPT_SYSTEM_VARIABLES_SINCE, extra_params={_SINCE: str(since)}
+            )
+
+            _LOGGER.debug("GET_SYSTEM_VARIABLES_SINCE: Getting system variables since %i", since)
+            if json_result := response[_P_RESULT]:
+                self._connection_state.remove_issue(issuer=self, iid=iid)
+                return SystemVariableChanges(
+                    server_time=int(json_result[_SERVER_TIME]),
+                    signature=json_result[_SIGNATURE],
+                    raw_values={
+                        vid: unquote(raw_value) for vid, raw_value in json_result[_VALUES].items()
+                    },
+                )
+        except BaseHomematicException as ex:
+            self._handle_exception_log(iid=iid, exception=ex)
+        except JSONDecodeError as jderr:
+            self._handle_exception_log(iid=iid, exception=jderr)
+        except (KeyError, TypeError, ValueError) as ex:
+            _LOGGER.warning(
+                "GET_SYSTEM_VARIABLES_SINCE failed: %s [%s] Unexpected result of system variables script",
+                ex.__class__.__name__,
+                reduce_args(args=ex.args),
+            )
+        return None
+
+    async def _get_cached_system_variables_ext_markers(self, vids: set[str]) -> dict[str, bool]:
+        """Get the ext markers from cache. They are refreshed, if outdated or variables were added or removed."""
+        if self._sysvar_ext_markers.keys() != vids or not changed_within_seconds(
+            last_change=self._sysvar_ext_markers_refreshed_at,
+            max_age=config.SYSVAR_EXT_MARKER_TTL,
+        ):
+            self._sysvar_ext_markers = await self._get_system_variables_ext_markers()
+            self._sysvar_ext_markers_refreshed_at = (
+                datetime.now() if self._sysvar_ext_markers else INIT_DATETIME
+            )
+        return self._sysvar_ext_markers
+
+    async def _get_system_variables_ext_markers(self) -> dict[str, bool]:
         """Get all system variables from CCU / Homegear."""
         iid = "GET_SYSTEM_VARIABLES_EXT_MARKERS"
-        ext_markers: dict[str, Any] = {}
+        ext_markers: dict[str, bool] = {}
 
         try:
             response = await self._post_script(script_name=REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER)
@@ -693,23 +755,35 @@ class JsonRpcAioHttpClient:
 
         return device_details
 
-    async def get_all_device_data(self, interface: str) -> dict[str, Any]:
-        """Get the all device data of the backend."""
-        iid = f"GET_ALL_DEVICE_DATA for {interface}"
-        all_device_data: dict[str, dict[str, dict[str, Any]]] = {}
+    async def get_device_data_since(
+        self, interface: str, since: int = 0
+    ) -> tuple[int | None, dict[str, Any]]:
+        """
+        Get the device data of the backend, that changed since the given timestamp.
+
+        A timestamp of 0 returns all device data.
+        Returns the server time of the backend and the device data.
+        """
+        iid = f"GET_DEVICE_DATA_SINCE for {interface}"
+        server_time: int | None = None
+        all_device_data: dict[str, Any] = {}
         params = {
             _INTERFACE: interface,
+            _SINCE: str(since),
         }
         try:
             response = await self._post_script(
-                script_name=REGA_SCRIPT_FETCH_ALL_DEVICE_DATA, extra_params=params
+                script_name=REGA_SCRIPT_FETCH_DEVICE_DATA_SINCE, extra_params=params
             )
 
             _LOGGER.debug(
-                "GET_ALL_DEVICE_DATA: Getting all device data for interface %s", interface
+                "GET_DEVICE_DATA_SINCE: Getting device data since %i for interface %s",
+                since,
+                interface,
             )
             if json_result := response[_P_RESULT]:
-                all_device_data = json_result
+                server_time = int(json_result[_SERVER_TIME])
+                all_device_data = json_result[_DATA]
             self._connection_state.remove_issue(issuer=self, iid=iid)
         except BaseHomematicException as ex:
             self._handle_exception_log(
@@ -724,8 +798,17 @@ class JsonRpcAioHttpClient:
                 multiple_logs=False,
                 level=logging.WARNING,
             )
+        except (KeyError, TypeError, ValueError) as ex:
+            self._handle_exception_log(
+                iid=iid,
+                exception=ex,
+                extra_msg=f"Unexpected result of device data script for interface {interface}",
+                multiple_logs=False,
+                level=logging.WARNING,
+            )
+            return None, {}
 
-        return all_device_data
+        return server_time, all_device_data
 
     async def get_all_programs(self, include_internal: bool) -> tuple[ProgramData, ...]:
         """Get the all programs of the backend."""
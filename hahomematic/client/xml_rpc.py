@@ -84,6 +84,7 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
         self._tls: Final[bool] = kwargs.pop(_TLS, False)
         self._verify_tls: Final[bool] = kwargs.pop(_VERIFY_TLS, True)
         self._supported_methods: tuple[str, ...] = ()
+        self.request_count: int = 0
         if self._tls:
             kwargs[_CONTEXT] = get_tls_context(self._verify_tls)
         xmlrpc.client.ServerProxy.__init__(  # type: ignore[misc]
@@ -123,6 +124,7 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
             ):
                 args = _cleanup_args(*args)
                 _LOGGER.debug("__ASYNC_REQUEST: %s", args)
+                self.request_count += 1
                 result = await self._looper.async_add_executor_job(
                     # pylint: disable=protected-access
                     parent._ServerProxy__request,  # type: ignore[attr-defined]
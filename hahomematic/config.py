@@ -3,22 +3,48 @@
 from __future__ import annotations
 
 from hahomematic.const import (
+    DEFAULT_CACHE_JOURNAL_MAX_AGE,
+    DEFAULT_CACHE_JOURNAL_MAX_SIZE,
+    DEFAULT_COMPACT_PARAMSET_CACHE,
     DEFAULT_CONNECTION_CHECKER_INTERVAL,
+    DEFAULT_INTERFACE_TIMEOUT,
     DEFAULT_JSON_SESSION_AGE,
     DEFAULT_LAST_COMMAND_SEND_STORE_TIMEOUT,
+    DEFAULT_LOG_STARTUP_REPORT,
+    DEFAULT_MAX_CONCURRENT_DATA_LOADS,
+    DEFAULT_MAX_CONCURRENT_VALUE_LOADS,
     DEFAULT_PING_PONG_MISMATCH_COUNT,
     DEFAULT_PING_PONG_MISMATCH_COUNT_TTL,
     DEFAULT_RECONNECT_WAIT,
+    DEFAULT_SAVE_CACHES_DEBOUNCE,
+    DEFAULT_SAVE_CACHES_MAX_DELAY,
+    DEFAULT_STARTUP_REPORT_SLOWEST_DEVICES,
+    DEFAULT_SYSVAR_EXT_MARKER_TTL,
+    DEFAULT_SYSVAR_FULL_SYNC_INTERVAL,
     DEFAULT_TIMEOUT,
+    DEFAULT_VERIFY_CACHE_HASH,
     DEFAULT_WAIT_FOR_CALLBACK,
 )
 
+CACHE_JOURNAL_MAX_AGE = DEFAULT_CACHE_JOURNAL_MAX_AGE
+CACHE_JOURNAL_MAX_SIZE = DEFAULT_CACHE_JOURNAL_MAX_SIZE
 CALLBACK_WARN_INTERVAL = DEFAULT_CONNECTION_CHECKER_INTERVAL * 40
+COMPACT_PARAMSET_CACHE = DEFAULT_COMPACT_PARAMSET_CACHE
 CONNECTION_CHECKER_INTERVAL = DEFAULT_CONNECTION_CHECKER_INTERVAL
+INTERFACE_TIMEOUT = DEFAULT_INTERFACE_TIMEOUT
 JSON_SESSION_AGE = DEFAULT_JSON_SESSION_AGE
 LAST_COMMAND_SEND_STORE_TIMEOUT = DEFAULT_LAST_COMMAND_SEND_STORE_TIMEOUT
+LOG_STARTUP_REPORT = DEFAULT_LOG_STARTUP_REPORT
+MAX_CONCURRENT_DATA_LOADS = DEFAULT_MAX_CONCURRENT_DATA_LOADS
+MAX_CONCURRENT_VALUE_LOADS = DEFAULT_MAX_CONCURRENT_VALUE_LOADS
 PING_PONG_MISMATCH_COUNT = DEFAULT_PING_PONG_MISMATCH_COUNT
 PING_PONG_MISMATCH_COUNT_TTL = DEFAULT_PING_PONG_MISMATCH_COUNT_TTL
 RECONNECT_WAIT = DEFAULT_RECONNECT_WAIT
+SAVE_CACHES_DEBOUNCE = DEFAULT_SAVE_CACHES_DEBOUNCE
+SAVE_CACHES_MAX_DELAY = DEFAULT_SAVE_CACHES_MAX_DELAY
+STARTUP_REPORT_SLOWEST_DEVICES = DEFAULT_STARTUP_REPORT_SLOWEST_DEVICES
+SYSVAR_EXT_MARKER_TTL = DEFAULT_SYSVAR_EXT_MARKER_TTL
+SYSVAR_FULL_SYNC_INTERVAL = DEFAULT_SYSVAR_FULL_SYNC_INTERVAL
 TIMEOUT = DEFAULT_TIMEOUT
+VERIFY_CACHE_HASH = DEFAULT_VERIFY_CACHE_HASH
 WAIT_FOR_CALLBACK = DEFAULT_WAIT_FOR_CALLBACK
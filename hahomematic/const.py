@@ -9,31 +9,45 @@ from enum import Enum, IntEnum, StrEnum
 import re
 from typing import Any, Final, Required, TypedDict
 
+DEFAULT_CACHE_JOURNAL_MAX_AGE: Final = 86400  # max age of a cache journal before compaction
+DEFAULT_CACHE_JOURNAL_MAX_SIZE: Final = 1048576  # max size of a cache journal before compaction
+DEFAULT_COMPACT_PARAMSET_CACHE: Final = False  # store shared paramset descriptions only once
 DEFAULT_CONNECTION_CHECKER_INTERVAL: Final = 15  # check if connection is available via rpc ping
 DEFAULT_CUSTOM_ID: Final = "custom_id"
 DEFAULT_ENCODING: Final = "UTF-8"
 DEFAULT_INCLUDE_INTERNAL_PROGRAMS: Final = False
 DEFAULT_INCLUDE_INTERNAL_SYSVARS: Final = True
+DEFAULT_INTERFACE_TIMEOUT: Final = 90  # max duration to create, init or check an interface
 DEFAULT_JSON_SESSION_AGE: Final = 90
 DEFAULT_LAST_COMMAND_SEND_STORE_TIMEOUT: Final = 60
+DEFAULT_LOG_STARTUP_REPORT: Final = False
+DEFAULT_MAX_CONCURRENT_DATA_LOADS: Final = 4  # max number of interfaces loading data at once
+DEFAULT_MAX_CONCURRENT_VALUE_LOADS: Final = 8  # max number of devices loading values at once
 DEFAULT_MAX_READ_WORKERS: Final = 1
 DEFAULT_MAX_WORKERS: Final = 1
 DEFAULT_PING_PONG_MISMATCH_COUNT: Final = 15
 DEFAULT_PING_PONG_MISMATCH_COUNT_TTL: Final = 300
 DEFAULT_PROGRAM_SCAN_ENABLED: Final = True
 DEFAULT_RECONNECT_WAIT: Final = 120  # wait with reconnect after a first ping was successful
+DEFAULT_SAVE_CACHES_DEBOUNCE: Final = 2  # wait for further changes before the caches are saved
+DEFAULT_SAVE_CACHES_MAX_DELAY: Final = 30  # max delay of a save of the caches by further changes
+DEFAULT_STARTUP_REPORT_SLOWEST_DEVICES: Final = 10  # number of devices in the startup report
+DEFAULT_SYSVAR_EXT_MARKER_TTL: Final = 3600  # max age of the cached extended sysvar markers
+DEFAULT_SYSVAR_FULL_SYNC_INTERVAL: Final = 300  # max age of the last full sync of sysvars
 DEFAULT_SYSVAR_SCAN_ENABLED: Final = True
 DEFAULT_TIMEOUT: Final = 60  # default timeout for a connection
 DEFAULT_TLS: Final = False
+DEFAULT_VERIFY_CACHE_HASH: Final = False  # compare the content hash on save and load of caches
 DEFAULT_VERIFY_TLS: Final = False
 DEFAULT_WAIT_FOR_CALLBACK: Final[int | None] = None
 MAX_WAIT_FOR_CALLBACK: Final = 600
 
-REGA_SCRIPT_FETCH_ALL_DEVICE_DATA: Final = "fetch_all_device_data.fn"
+REGA_SCRIPT_FETCH_DEVICE_DATA_SINCE: Final = "fetch_device_data_since.fn"
 REGA_SCRIPT_GET_SERIAL: Final = "get_serial.fn"
 REGA_SCRIPT_PATH: Final = "../rega_scripts"
 REGA_SCRIPT_SET_SYSTEM_VARIABLE: Final = "set_system_variable.fn"
 REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER: Final = "get_system_variables_ext_marker.fn"
+REGA_SCRIPT_SYSTEM_VARIABLES_SINCE: Final = "get_system_variables_since.fn"
 
 DEFAULT_DEVICE_DESCRIPTIONS_DIR: Final = "export_device_descriptions"
 DEFAULT_PARAMSET_DESCRIPTIONS_DIR: Final = "export_paramset_descriptions"
@@ -89,6 +103,8 @@ EVENT_TYPE: Final = "type"
 EVENT_VALUE: Final = "value"
 
 FILE_DEVICES: Final = "homematic_devices.json"
+FILE_ENTITY_PLAN: Final = "homematic_entity_plan.json"
+FILE_JOURNAL_POSTFIX: Final = ".journal"
 FILE_PARAMSETS: Final = "homematic_paramsets.json"
 
 MAX_CACHE_AGE: Final = 60
@@ -114,6 +130,7 @@ class BackendSystemEvent(StrEnum):
 
     DELETE_DEVICES = "deleteDevices"
     DEVICES_CREATED = "devicesCreated"
+    DEVICES_LOADING = "devicesLoading"
     ERROR = "error"
     HUB_REFRESHED = "hubEntityRefreshed"
     LIST_DEVICES = "listDevices"
@@ -572,6 +589,17 @@ class SystemVariableData(HubData):
     min_value: float | int | None = None
     unit: str | None = None
     values: tuple[str, ...] | None = None
+    vid: str | None = None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SystemVariableChanges:
+    """Dataclass for system variables, that changed since a timestamp."""
+
+    server_time: int
+    # count, sum and max of the ids of all system variables
+    signature: str
+    raw_values: Mapping[str, str]
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -1,12 +1,14 @@
-"""Decorators used within hahomematic."""
+"""Decorators and reports to measure the performance of hahomematic."""
 
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from functools import wraps
 import logging
+from time import perf_counter
 from typing import Any, Final
 
 _LOGGER: Final = logging.getLogger(__name__)
@@ -56,3 +58,105 @@ def measure_execution_time[_CallableT: Callable[..., Any]](func: _CallableT) ->
     if asyncio.iscoroutinefunction(func):
         return async_measure_wrapper  # type: ignore[return-value]
     return measure_wrapper  # type: ignore[return-value]
+
+
+class StartupReport:
+    """Collect the duration of the startup phases of a central unit."""
+
+    def __init__(self, name: str) -> None:
+        """Init the startup report."""
+        self._name: Final = name
+        self._phases: Final[dict[str, float]] = {}
+        self._interface_phases: Final[dict[str, dict[str, float]]] = {}
+        self._device_durations: Final[dict[str, float]] = {}
+        self._counters: Final[dict[str, int]] = {}
+        self._started_at: float | None = None
+        self._duration: float | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Return the total duration of the startup."""
+        return self._duration
+
+    def start(self) -> None:
+        """Start a new report."""
+        self._phases.clear()
+        self._interface_phases.clear()
+        self._device_durations.clear()
+        self._counters.clear()
+        self._duration = None
+        self._started_at = perf_counter()
+
+    def finish(self, **counters: int) -> None:
+        """Finish the report and store the counters."""
+        if self._started_at is not None:
+            self._duration = perf_counter() - self._started_at
+        self._counters.update(counters)
+
+    @contextmanager
+    def measure(self, phase: str, interface_id: str | None = None) -> Iterator[None]:
+        """Measure the duration of a phase. Repeated phases are summed up."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            phases = (
+                self._interface_phases.setdefault(interface_id, {})
+                if interface_id
+                else self._phases
+            )
+            phases[phase] = phases.get(phase, 0.0) + perf_counter() - start
+
+    @contextmanager
+    def measure_device(self, device_address: str) -> Iterator[None]:
+        """Measure the duration of loading a device."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._device_durations[device_address] = (
+                self._device_durations.get(device_address, 0.0) + perf_counter() - start
+            )
+
+    def as_dict(self, slowest_devices: int = 10) -> dict[str, Any]:
+        """Return the report as dict."""
+        return {
+            "name": self._name,
+            "duration": _round(self._duration),
+            "phases": {phase: _round(duration) for phase, duration in self._phases.items()},
+            "interfaces": {
+                interface_id: {phase: _round(duration) for phase, duration in phases.items()}
+                for interface_id, phases in self._interface_phases.items()
+            },
+            "counters": dict(self._counters),
+            "slowest_devices": [
+                {"address": device_address, "duration": _round(duration)}
+                for device_address, duration in sorted(
+                    self._device_durations.items(), key=lambda item: item[1], reverse=True
+                )[:slowest_devices]
+            ],
+        }
+
+    def log_summary(self, slowest_devices: int = 10) -> None:
+        """Log the report as summary table."""
+        report = self.as_dict(slowest_devices=slowest_devices)
+        lines = [f"Startup of {self._name} took {report['duration']}s"]
+        lines.extend(
+            f"  {phase:<40} {duration:>10.3f}s" for phase, duration in report["phases"].items()
+        )
+        for interface_id, phases in report["interfaces"].items():
+            lines.extend(
+                f"  {interface_id + ' ' + phase:<40} {duration:>10.3f}s"
+                for phase, duration in phases.items()
+            )
+        lines.extend(f"  {name:<40} {count:>11}" for name, count in report["counters"].items())
+        lines.extend(
+            f"  {'device ' + device['address']:<40} {device['duration']:>10.3f}s"
+            for device in report["slowest_devices"]
+        )
+        _LOGGER.info("\n".join(lines))
+
+
+def _round(duration: float | None) -> float | None:
+    """Round a duration to milliseconds."""
+    return round(duration, 3) if duration is not None else None
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Final
+from typing import Final, cast
 
 from hahomematic.const import (
     CLICK_EVENTS,
@@ -12,6 +12,7 @@ from hahomematic.const import (
     Flag,
     Operations,
     Parameter,
+    ParameterData,
     ParamsetKey,
 )
 from hahomematic.platforms import device as hmd
@@ -25,10 +26,74 @@ __all__ = ["create_entities_and_events"]
 _ALLOWED_INTERNAL_PARAMETERS: Final[tuple[Parameter, ...]] = (Parameter.DIRECTION,)
 _LOGGER: Final = logging.getLogger(__name__)
 
+# The kinds of an entry of an entity plan
+_KIND_ENTITY: Final = "entity"
+_KIND_EVENT: Final = "event"
+_KIND_LAZY: Final = "lazy"
+
 
 def create_entities_and_events(device: hmd.HmDevice) -> None:
     """Create the entities associated to this device."""
+    entity_plan_cache = device.central.entity_plan
+    if (entity_plan := entity_plan_cache.get_entity_plan(device=device)) is None or not (
+        _create_entities_and_events_by_plan(device=device, entity_plan=entity_plan)
+    ):
+        entity_plan = _get_entity_plan(device=device)
+        entity_plan_cache.add_entity_plan(device=device, entity_plan=entity_plan)
+        _create_entities_and_events_by_plan(device=device, entity_plan=entity_plan)
+
+
+def _create_entities_and_events_by_plan(
+    device: hmd.HmDevice, entity_plan: dict[str, list[list[str]]]
+) -> bool:
+    """Create the entities and events of a device based on the entity plan."""
+    # Check the plan before anything is created, so a stale plan can be replaced.
+    channel_plans: list[tuple[hmd.HmChannel, str, ParamsetKey, str, ParameterData]] = []
+    for channel_address, channel_plan in entity_plan.items():
+        if (channel := device.get_channel(channel_address=channel_address)) is None:
+            return False
+        for p_key, parameter, kind in channel_plan:
+            paramset_key = ParamsetKey(p_key)
+            if (
+                parameter_data := channel.paramsset_descriptions.get(paramset_key, {}).get(
+                    parameter
+                )
+            ) is None:
+                return False
+            channel_plans.append((channel, kind, paramset_key, parameter, parameter_data))
+
+    for channel, kind, paramset_key, parameter, parameter_data in channel_plans:
+        if paramset_key == ParamsetKey.MASTER and parameter_data["OPERATIONS"] == 0:
+            # required to fix hm master paramset operation values.
+            # The paramset descriptions are shared, so the fix is applied to a copy.
+            parameter_data = cast(ParameterData, {**parameter_data, "OPERATIONS": 3})
+        if kind == _KIND_EVENT:
+            create_event_and_append_to_channel(
+                channel=channel,
+                parameter=parameter,
+                parameter_data=parameter_data,
+            )
+        elif kind == _KIND_LAZY:
+            channel.add_lazy_entity(
+                paramset_key=paramset_key,
+                parameter=parameter,
+                parameter_data=parameter_data,
+            )
+        else:
+            create_entity_and_append_to_channel(
+                channel=channel,
+                paramset_key=paramset_key,
+                parameter=parameter,
+                parameter_data=parameter_data,
+            )
+    return True
+
+
+def _get_entity_plan(device: hmd.HmDevice) -> dict[str, list[list[str]]]:
+    """Return the entities and events, that should be created for a device."""
+    entity_plan: dict[str, list[list[str]]] = {}
     for channel in device.channels.values():
+        channel_plan = entity_plan.setdefault(channel.address, [])
         for paramset_key, paramsset_key_descriptions in channel.paramsset_descriptions.items():
             if not device.central.parameter_visibility.is_relevant_paramset(
                 model=device.model,
@@ -60,30 +125,24 @@ def create_entities_and_events(device: hmd.HmDevice) -> None:
                         parameter=parameter,
                     )
                 )
+                operations = parameter_data["OPERATIONS"]
 
                 if paramset_key == ParamsetKey.MASTER:
                     # All MASTER parameters must be un ignored
                     if not parameter_is_un_ignored:
                         continue
 
-                    # required to fix hm master paramset operation values
-                    if parameter_is_un_ignored and parameter_data["OPERATIONS"] == 0:
-                        parameter_data["OPERATIONS"] = 3
+                    # hm master paramset operation values are fixed on creation
+                    if operations == 0:
+                        operations = 3
 
-                if parameter_data["OPERATIONS"] & Operations.EVENT and (
+                if operations & Operations.EVENT and (
                     parameter in CLICK_EVENTS
                     or parameter.startswith(DEVICE_ERROR_EVENTS)
                     or parameter in IMPULSE_EVENTS
                 ):
-                    create_event_and_append_to_channel(
-                        channel=channel,
-                        parameter=parameter,
-                        parameter_data=parameter_data,
-                    )
-                if (
-                    not parameter_data["OPERATIONS"] & Operations.EVENT
-                    and not parameter_data["OPERATIONS"] & Operations.WRITE
-                ) or (
+                    channel_plan.append([paramset_key, parameter, _KIND_EVENT])
+                if (not operations & Operations.EVENT and not operations & Operations.WRITE) or (
                     parameter_data["FLAGS"] & Flag.INTERNAL
                     and parameter not in _ALLOWED_INTERNAL_PARAMETERS
                     and not parameter_is_un_ignored
@@ -97,9 +156,39 @@ def create_entities_and_events(device: hmd.HmDevice) -> None:
                 if parameter not in IMPULSE_EVENTS and (
                     not parameter.startswith(DEVICE_ERROR_EVENTS) or parameter_is_un_ignored
                 ):
-                    create_entity_and_append_to_channel(
-                        channel=channel,
-                        paramset_key=paramset_key,
-                        parameter=parameter,
-                        parameter_data=parameter_data,
+                    channel_plan.append(
+                        [
+                            paramset_key,
+                            parameter,
+                            _KIND_LAZY
+                            if _is_created_on_access(
+                                channel=channel, paramset_key=paramset_key, parameter=parameter
+                            )
+                            else _KIND_ENTITY,
+                        ]
                     )
+    return entity_plan
+
+
+def _is_created_on_access(
+    channel: hmd.HmChannel, paramset_key: ParamsetKey, parameter: str
+) -> bool:
+    """
+    Return, if the entity is only created on first access or event.
+
+    This applies to hidden VALUES parameters, that are not exposed by default.
+    The hidden parameters of channel 0 (UNREACH, CONFIG_PENDING, UPDATE_PENDING, ...)
+    are required for the device availability and the firmware update and are always created.
+    MASTER parameters are always created, because their values are only loaded at startup,
+    and an entity that is created on access would have no value.
+    """
+    return (
+        paramset_key == ParamsetKey.VALUES
+        and channel.no not in (None, 0)
+        and channel.device.central.parameter_visibility.parameter_is_hidden(
+            model=channel.device.model,
+            channel_no=channel.no,
+            paramset_key=paramset_key,
+            parameter=parameter,
+        )
+    )
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from copy import deepcopy
+from functools import cache
 import logging
+from types import MappingProxyType
 from typing import Any, Final, cast
 
 import voluptuous as vol
 
-from hahomematic import support as hms, validator as val
+from hahomematic import validator as val
 from hahomematic.const import HmPlatform, Parameter
 from hahomematic.exceptions import HaHomematicException
 from hahomematic.platforms import device as hmd
@@ -692,32 +693,33 @@ def _get_device_definition(device_profile: DeviceProfile) -> Mapping[ED, Any]:
     return cast(Mapping[ED, Any], VALID_ENTITY_DEFINITION[ED.DEVICE_DEFINITIONS][device_profile])
 
 
+@cache
 def _get_device_group(
     device_profile: DeviceProfile, base_channel_no: int | None
 ) -> Mapping[ED, Any]:
-    """Return the device group."""
-    device = _get_device_definition(device_profile)
-    group = cast(dict[ED, Any], device[ED.DEVICE_GROUP])
-    # Create a deep copy of the group due to channel rebase
-    group = deepcopy(group)
+    """Return the immutable device group rebased to the base_channel_no."""
+    group = cast(Mapping[ED, Any], _get_device_definition(device_profile)[ED.DEVICE_GROUP])
     if not base_channel_no:
-        return group
+        return _freeze(group)  # type: ignore[no-any-return]
+    rebased_group = dict(group)
     # Add base_channel_no to the primary_channel to get the real primary_channel number
     if (primary_channel := group[ED.PRIMARY_CHANNEL]) is not None:
-        group[ED.PRIMARY_CHANNEL] = primary_channel + base_channel_no
+        rebased_group[ED.PRIMARY_CHANNEL] = primary_channel + base_channel_no
 
     # Add base_channel_no to the secondary_channels
     # to get the real secondary_channel numbers
     if secondary_channel := group.get(ED.SECONDARY_CHANNELS):
-        group[ED.SECONDARY_CHANNELS] = [x + base_channel_no for x in secondary_channel]
+        rebased_group[ED.SECONDARY_CHANNELS] = tuple(
+            x + base_channel_no for x in secondary_channel
+        )
 
-    group[ED.VISIBLE_FIELDS] = _rebase_entity_dict(
+    rebased_group[ED.VISIBLE_FIELDS] = _rebase_entity_dict(
         entity_dict=ED.VISIBLE_FIELDS, group=group, base_channel_no=base_channel_no
     )
-    group[ED.FIELDS] = _rebase_entity_dict(
+    rebased_group[ED.FIELDS] = _rebase_entity_dict(
         entity_dict=ED.FIELDS, group=group, base_channel_no=base_channel_no
     )
-    return group
+    return _freeze(rebased_group)  # type: ignore[no-any-return]
 
 
 def _rebase_entity_dict(
@@ -731,22 +733,32 @@ def _rebase_entity_dict(
     return new_fields
 
 
+@cache
 def _get_device_entities(
     device_profile: DeviceProfile, base_channel_no: int | None
 ) -> Mapping[int, tuple[Parameter, ...]]:
-    """Return the device entities."""
+    """Return the immutable device entities rebased to the base_channel_no."""
     additional_entities = (
         VALID_ENTITY_DEFINITION[ED.DEVICE_DEFINITIONS]
         .get(device_profile, {})
         .get(ED.ADDITIONAL_ENTITIES, {})
     )
     if not base_channel_no:
-        return additional_entities  # type: ignore[no-any-return]
+        return _freeze(additional_entities)  # type: ignore[no-any-return]
     new_entities: dict[int, tuple[Parameter, ...]] = {}
     if additional_entities:
         for channel_no, field in additional_entities.items():
             new_entities[channel_no + base_channel_no] = field
-    return new_entities
+    return _freeze(new_entities)  # type: ignore[no-any-return]
+
+
+def _freeze(value: Any) -> Any:
+    """Return an immutable copy of the entity definition structure."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 
 def get_custom_configs(
@@ -754,43 +766,89 @@ def get_custom_configs(
     platform: HmPlatform | None = None,
 ) -> tuple[CustomConfig, ...]:
     """Return the entity configs to create custom entities."""
-    model = model.lower().replace("hb-", "hm-")
-    custom_configs: list[CustomConfig] = []
-    for platform_blacklisted_devices in ALL_BLACKLISTED_DEVICES:
-        if hms.element_matches_key(
-            search_elements=platform_blacklisted_devices,
-            compare_with=model,
-        ):
+    return _CUSTOM_CONFIG_INDEX.get_custom_configs(
+        model=model.lower().replace("hb-", "hm-"), platform=platform
+    )
+
+
+class _CustomConfigIndex:
+    """
+    Prefix index over the models of the custom entity definitions.
+
+    The index is rebuilt, when a platform registers its devices,
+    and the results are memoized per model and platform.
+    """
+
+    def __init__(self) -> None:
+        """Init the custom config index."""
+        self._signature: tuple[Any, ...] | None = None
+        self._blacklisted_models: frozenset[str] = frozenset()
+        # {platform, {model_l, (position, custom_configs)}}
+        self._platform_models: dict[
+            HmPlatform, dict[str, tuple[int, CustomConfig | tuple[CustomConfig, ...]]]
+        ] = {}
+        # {(model_l, platform), custom_configs}
+        self._results: dict[tuple[str, HmPlatform | None], tuple[CustomConfig, ...]] = {}
+
+    def _refresh(self) -> None:
+        """Rebuild the index, if the registered devices changed."""
+        signature = (
+            tuple((pf, id(devices), len(devices)) for pf, devices in ALL_DEVICES.items()),
+            tuple((id(devices), len(devices)) for devices in ALL_BLACKLISTED_DEVICES),
+        )
+        if signature == self._signature:
+            return
+        self._blacklisted_models = frozenset(
+            model.lower() for devices in ALL_BLACKLISTED_DEVICES for model in devices
+        )
+        self._platform_models.clear()
+        for pf, platform_devices in ALL_DEVICES.items():
+            models: dict[str, tuple[int, CustomConfig | tuple[CustomConfig, ...]]] = {}
+            for position, (d_type, custom_configs) in enumerate(platform_devices.items()):
+                # The first definition of a model wins.
+                models.setdefault(d_type.lower(), (position, custom_configs))
+            self._platform_models[pf] = models
+        self._results.clear()
+        self._signature = signature
+
+    def get_custom_configs(
+        self, model: str, platform: HmPlatform | None
+    ) -> tuple[CustomConfig, ...]:
+        """Return the entity configs to create custom entities."""
+        self._refresh()
+        if (result := self._results.get((model, platform))) is None:
+            result = self._results[(model, platform)] = self._get_custom_configs(
+                model=model, platform=platform
+            )
+        return result
+
+    def _get_custom_configs(
+        self, model: str, platform: HmPlatform | None
+    ) -> tuple[CustomConfig, ...]:
+        """Return the entity configs to create custom entities from the index."""
+        prefixes = tuple(model[:length] for length in range(len(model) + 1))
+        if any(prefix in self._blacklisted_models for prefix in prefixes):
             return ()
 
-    for pf, platform_devices in ALL_DEVICES.items():
-        if platform is not None and pf != platform:
-            continue
-        if func := _get_entity_config_by_platform(
-            platform_devices=platform_devices,
-            model=model,
-        ):
-            if isinstance(func, tuple):
-                custom_configs.extend(func)  # noqa:PERF401
+        custom_configs: list[CustomConfig] = []
+        for pf, models in self._platform_models.items():
+            if platform is not None and pf != platform:
+                continue
+            # An exact match wins, otherwise the first matching definition.
+            if (match := models.get(model)) is None and (
+                matches := [models[prefix] for prefix in prefixes if prefix in models]
+            ):
+                match = min(matches, key=lambda item: item[0])
+            if match is None:
+                continue
+            if isinstance(func := match[1], tuple):
+                custom_configs.extend(func)
             else:
                 custom_configs.append(func)
-    return tuple(custom_configs)
-
-
-def _get_entity_config_by_platform(
-    platform_devices: Mapping[str, CustomConfig | tuple[CustomConfig, ...]],
-    model: str,
-) -> CustomConfig | tuple[CustomConfig, ...] | None:
-    """Return the entity configs to create custom entities."""
-    for d_type, custom_configs in platform_devices.items():
-        if model.lower() == d_type.lower():
-            return custom_configs
+        return tuple(custom_configs)
 
-    for d_type, custom_configs in platform_devices.items():
-        if model.lower().startswith(d_type.lower()):
-            return custom_configs
 
-    return None
+_CUSTOM_CONFIG_INDEX: Final = _CustomConfigIndex()
 
 
 def is_multi_channel_device(model: str, platform: HmPlatform) -> bool:
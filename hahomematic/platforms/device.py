@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Collection, Mapping
 from copy import copy
 from datetime import datetime
 from functools import partial
@@ -49,7 +49,7 @@ from hahomematic.platforms.custom import definition as hmed, entity as hmce
 from hahomematic.platforms.decorators import info_property, service, state_property
 from hahomematic.platforms.entity import BaseParameterEntity, CallbackEntity
 from hahomematic.platforms.event import GenericEvent
-from hahomematic.platforms.generic import GenericEntity
+from hahomematic.platforms.generic import GenericEntity, create_entity_and_append_to_channel
 from hahomematic.platforms.support import (
     ChannelNameData,
     PayloadMixin,
@@ -580,6 +580,7 @@ class HmDevice(PayloadMixin):
         await self._central.save_caches(save_paramset_descriptions=True)
         for entity in self.generic_entities:
             entity.update_parameter_data()
+        self._central.parameter_catalog.add_device(device=self)
         self.fire_device_updated_callback()
 
     @loop_check
@@ -631,6 +632,10 @@ class HmChannel(PayloadMixin):
         self._base_no: Final = self._device.get_sub_device_base_channel(channel_no=self._no)
         self._custom_entity: hmce.CustomEntity | None = None
         self._generic_entities: Final[dict[ENTITY_KEY, GenericEntity]] = {}
+        # {entity_key, (paramset_key, parameter, parameter_data)}
+        self._lazy_generic_entities: Final[
+            dict[ENTITY_KEY, tuple[ParamsetKey, str, ParameterData]]
+        ] = {}
         self._generic_events: Final[dict[ENTITY_KEY, GenericEvent]] = {}
         self._modified_at: datetime = INIT_DATETIME
         self._rooms: Final = self._central.device_details.get_channel_rooms(
@@ -822,6 +827,33 @@ class HmChannel(PayloadMixin):
         if isinstance(entity, GenericEvent):
             self._generic_events[entity.entity_key] = entity
 
+    def add_lazy_entity(
+        self, paramset_key: ParamsetKey, parameter: str, parameter_data: ParameterData
+    ) -> None:
+        """Add an entity to a channel, that is created on first access or event."""
+        self._lazy_generic_entities[
+            get_entity_key(
+                channel_address=self._address, paramset_key=paramset_key, parameter=parameter
+            )
+        ] = (paramset_key, parameter, parameter_data)
+
+    def _create_lazy_entity(self, entity_key: ENTITY_KEY) -> GenericEntity | None:
+        """Create an entity, that was added for creation on first access."""
+        if (lazy_entity := self._lazy_generic_entities.pop(entity_key, None)) is None:
+            return None
+        paramset_key, parameter, parameter_data = lazy_entity
+        create_entity_and_append_to_channel(
+            channel=self,
+            paramset_key=paramset_key,
+            parameter=parameter,
+            parameter_data=parameter_data,
+        )
+        if entity := self._generic_entities.get(entity_key):
+            self._central.entity_registry.add_entity(
+                device_address=self._device.address, entity=entity, record_new=False
+            )
+        return entity
+
     def _remove_entity(self, entity: CallbackEntity) -> None:
         """Remove an entity from a channel."""
         if isinstance(entity, BaseParameterEntity):
@@ -892,21 +924,23 @@ class HmChannel(PayloadMixin):
     ) -> GenericEntity | None:
         """Return an entity from device."""
         if paramset_key:
-            return self._generic_entities.get(
-                get_entity_key(
-                    channel_address=self._address,
-                    paramset_key=paramset_key,
-                    parameter=parameter,
-                )
-            )
-
-        if entity := self._generic_entities.get(
-            get_entity_key(
+            entity_key = get_entity_key(
                 channel_address=self._address,
-                paramset_key=ParamsetKey.VALUES,
+                paramset_key=paramset_key,
                 parameter=parameter,
             )
-        ):
+            if entity := self._generic_entities.get(entity_key):
+                return entity
+            return self._create_lazy_entity(entity_key=entity_key)
+
+        values_entity_key = get_entity_key(
+            channel_address=self._address,
+            paramset_key=ParamsetKey.VALUES,
+            parameter=parameter,
+        )
+        if entity := self._generic_entities.get(values_entity_key):
+            return entity
+        if entity := self._create_lazy_entity(entity_key=values_entity_key):
             return entity
         return self._generic_entities.get(
             get_entity_key(
@@ -960,14 +994,9 @@ class _ValueCache:
     async def init_base_entities(self) -> None:
         """Load data by get_value."""
         try:
-            for entity in self._get_base_entities():
-                value = await self.get_value(
-                    channel_address=entity.channel.address,
-                    paramset_key=entity.paramset_key,
-                    parameter=entity.parameter,
-                    call_source=CallSource.HM_INIT,
-                )
-                entity.write_value(value=value)
+            await self.load_values(
+                entities=self._get_base_entities(), call_source=CallSource.HM_INIT
+            )
         except BaseHomematicException as ex:
             _LOGGER.debug(
                 "init_base_entities: Failed to init cache for channel0 %s, %s [%s]",
@@ -992,14 +1021,9 @@ class _ValueCache:
     async def init_readable_events(self) -> None:
         """Load data by get_value."""
         try:
-            for event in self._get_readable_events():
-                value = await self.get_value(
-                    channel_address=event.channel.address,
-                    paramset_key=event.paramset_key,
-                    parameter=event.parameter,
-                    call_source=CallSource.HM_INIT,
-                )
-                event.write_value(value=value)
+            await self.load_values(
+                entities=self._get_readable_events(), call_source=CallSource.HM_INIT
+            )
         except BaseHomematicException as ex:
             _LOGGER.debug(
                 "init_base_events: Failed to init cache for channel0 %s, %s [%s]",
@@ -1012,6 +1036,99 @@ class _ValueCache:
         """Get readable events."""
         return {event for event in self._device.generic_events if event.is_readable}
 
+    async def load_values(
+        self,
+        entities: Collection[BaseParameterEntity],
+        call_source: CallSource,
+        direct_call: bool = False,
+    ) -> None:
+        """Load the values of the entities with one call per channel and paramset_key."""
+        entities_by_paramset: dict[tuple[str, ParamsetKey], list[BaseParameterEntity]] = {}
+        for entity in entities:
+            entities_by_paramset.setdefault(
+                (entity.channel.address, entity.paramset_key), []
+            ).append(entity)
+        for (channel_address, paramset_key), paramset_entities in entities_by_paramset.items():
+            values = await self._get_values(
+                channel_address=channel_address,
+                paramset_key=paramset_key,
+                parameters={entity.parameter for entity in paramset_entities},
+                call_source=call_source,
+                direct_call=direct_call,
+            )
+            for entity in paramset_entities:
+                entity.write_value(value=values[entity.parameter])
+
+    async def _get_values(
+        self,
+        channel_address: str,
+        paramset_key: ParamsetKey,
+        parameters: set[str],
+        call_source: CallSource,
+        direct_call: bool,
+    ) -> dict[str, Any]:
+        """
+        Return the values of the parameters of a paramset.
+
+        Values, that are not cached, are loaded with a single call for the whole paramset.
+        Parameters, that are not part of the loaded paramset, are loaded one by one,
+        as well as all parameters, if the paramset could not be loaded.
+        """
+        async with self._sema_get_or_load_value:
+            values: dict[str, Any] = {}
+            if direct_call is False:
+                for parameter in parameters:
+                    if (
+                        cached_value := self._get_value_from_cache(
+                            channel_address=channel_address,
+                            paramset_key=paramset_key,
+                            parameter=parameter,
+                        )
+                    ) != NO_CACHE_ENTRY:
+                        values[parameter] = cached_value
+
+            if missing_parameters := parameters - values.keys():
+                try:
+                    paramset = await self._device.client.get_values(
+                        channel_address=channel_address,
+                        paramset_key=paramset_key,
+                        call_source=call_source,
+                    )
+                except BaseHomematicException as ex:
+                    _LOGGER.debug(
+                        "GET_OR_LOAD_VALUES: Failed to get data for %s, %s, %s: %s",
+                        self._device.model,
+                        channel_address,
+                        paramset_key,
+                        ex,
+                    )
+                    # The parameters are loaded one by one, so a single unreadable
+                    # parameter doesn't hide the values of the whole paramset.
+                    paramset = {}
+                for parameter, value in paramset.items():
+                    self._add_entry_to_device_cache(
+                        channel_address=channel_address,
+                        paramset_key=paramset_key,
+                        parameter=parameter,
+                        value=value,
+                    )
+                for parameter in missing_parameters:
+                    values[parameter] = (
+                        paramset[parameter]
+                        if parameter in paramset
+                        else await self._load_value(
+                            channel_address=channel_address,
+                            paramset_key=paramset_key,
+                            parameter=parameter,
+                            call_source=call_source,
+                        )
+                    )
+
+            return {
+                parameter: NO_CACHE_ENTRY if value == self._NO_VALUE_CACHE_ENTRY else value
+                for parameter, value in values.items()
+            }
+
     async def get_value(
         self,
         channel_address: str,
@@ -1037,31 +1154,46 @@ class _ValueCache:
                     NO_CACHE_ENTRY if cached_value == self._NO_VALUE_CACHE_ENTRY else cached_value
                 )
 
-            value: Any = self._NO_VALUE_CACHE_ENTRY
-            try:
-                value = await self._device.client.get_value(
-                    channel_address=channel_address,
-                    paramset_key=paramset_key,
-                    parameter=parameter,
-                    call_source=call_source,
-                )
-            except BaseHomematicException as ex:
-                _LOGGER.debug(
-                    "GET_OR_LOAD_VALUE: Failed to get data for %s, %s, %s: %s",
-                    self._device.model,
-                    channel_address,
-                    parameter,
-                    ex,
-                )
-            self._add_entry_to_device_cache(
+            value = await self._load_value(
                 channel_address=channel_address,
                 paramset_key=paramset_key,
                 parameter=parameter,
-                value=value,
+                call_source=call_source,
             )
-
             return NO_CACHE_ENTRY if value == self._NO_VALUE_CACHE_ENTRY else value
 
+    async def _load_value(
+        self,
+        channel_address: str,
+        paramset_key: ParamsetKey,
+        parameter: str,
+        call_source: CallSource,
+    ) -> Any:
+        """Load a single value from the backend and add it to the device cache."""
+        value: Any = self._NO_VALUE_CACHE_ENTRY
+        try:
+            value = await self._device.client.get_value(
+                channel_address=channel_address,
+                paramset_key=paramset_key,
+                parameter=parameter,
+                call_source=call_source,
+            )
+        except BaseHomematicException as ex:
+            _LOGGER.debug(
+                "GET_OR_LOAD_VALUE: Failed to get data for %s, %s, %s: %s",
+                self._device.model,
+                channel_address,
+                parameter,
+                ex,
+            )
+        self._add_entry_to_device_cache(
+            channel_address=channel_address,
+            paramset_key=paramset_key,
+            parameter=parameter,
+            value=value,
+        )
+        return value
+
     def _add_entry_to_device_cache(
         self, channel_address: str, paramset_key: ParamsetKey, parameter: str, value: Any
     ) -> None:
@@ -225,7 +225,9 @@ class CallbackEntity(ABC):
                 raise HaHomematicException(
                     f"REGISTER_entity_updated_CALLBACK failed: hm_entity: {self.full_name} is already registered by {self._custom_id}"
                 )
-            self._custom_id = custom_id
+            if self._custom_id is None:
+                self._custom_id = custom_id
+                self._central.entity_registry.update_custom_id(entity=self, old_custom_id=None)
 
         if callable(cb) and cb not in self._entity_updated_callbacks:
             self._entity_updated_callbacks[cb] = custom_id
@@ -238,6 +240,7 @@ class CallbackEntity(ABC):
             del self._entity_updated_callbacks[cb]
         if self.custom_id == custom_id:
             self._custom_id = None
+            self._central.entity_registry.update_custom_id(entity=self, old_custom_id=custom_id)
 
     def register_device_removed_callback(self, cb: Callable) -> CALLBACK_TYPE:
         """Register the device removed callback."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 import logging
-from typing import Final
+from typing import Final, cast
 
 from hahomematic import support as hms
 from hahomematic.const import (
@@ -95,7 +95,8 @@ def create_entity_and_append_to_channel(
     elif parameter not in CLICK_EVENTS:
         # Also check, if sensor could be a binary_sensor due to.
         if is_binary_sensor(parameter_data):
-            parameter_data["TYPE"] = ParameterType.BOOL
+            # The paramset descriptions are shared, so the type is changed on a copy.
+            parameter_data = cast(ParameterData, {**parameter_data, "TYPE": ParameterType.BOOL})
             entity_t = HmBinarySensor
         else:
             entity_t = HmSensor
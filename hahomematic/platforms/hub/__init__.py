@@ -4,16 +4,19 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Collection, Mapping, Set as AbstractSet
+from datetime import datetime
 import logging
 from typing import Final
 
-from hahomematic import central as hmcu
+from hahomematic import central as hmcu, config
 from hahomematic.const import (
     HUB_PLATFORMS,
+    INIT_DATETIME,
     Backend,
     BackendSystemEvent,
     HmPlatform,
     ProgramData,
+    SystemVariableChanges,
     SystemVariableData,
     SysvarType,
 )
@@ -25,6 +28,7 @@ from hahomematic.platforms.hub.select import HmSysvarSelect
 from hahomematic.platforms.hub.sensor import HmSysvarSensor
 from hahomematic.platforms.hub.switch import HmSysvarSwitch
 from hahomematic.platforms.hub.text import HmSysvarText
+from hahomematic.support import changed_within_seconds, reduce_args
 
 __all__ = [
     "GenericHubEntity",
@@ -56,6 +60,9 @@ class Hub:
         self._sema_fetch_programs: Final = asyncio.Semaphore()
         self._central: Final = central
         self._config: Final = central.config
+        self._sysvar_sync_timestamp: int = 0
+        self._sysvar_signature: str | None = None
+        self._sysvar_full_sync_at: datetime = INIT_DATETIME
 
     async def fetch_sysvar_data(self, scheduled: bool) -> None:
         """Fetch sysvar data for the hub."""
@@ -107,7 +114,12 @@ class Hub:
 
         for program_data in programs:
             if entity := self._central.get_program_button(pid=program_data.pid):
+                ccu_program_name = entity.ccu_program_name
                 entity.update_data(data=program_data)
+                if entity.ccu_program_name != ccu_program_name:
+                    self._central.rename_program_button(
+                        program_button=entity, old_ccu_program_name=ccu_program_name
+                    )
             else:
                 new_programs.append(self._create_program(data=program_data))
 
@@ -120,7 +132,14 @@ class Hub:
     async def _update_sysvar_entities(self) -> None:
         """Retrieve all variable data and update hmvariable values."""
         variables: tuple[SystemVariableData, ...] = ()
+        changes: SystemVariableChanges | None = None
         if client := self._central.primary_client:
+            if self._central.model is Backend.CCU:
+                changes = await client.get_system_variables_since(
+                    since=self._sysvar_sync_timestamp
+                )
+                if changes and self._update_changed_sysvar_entities(changes=changes):
+                    return
             variables = await client.get_all_system_variables(
                 include_internal=self._config.include_internal_sysvars
             )
@@ -129,7 +148,13 @@ class Hub:
                 "UPDATE_SYSVAR_ENTITIES: No sysvars received for %s",
                 self._central.name,
             )
+            self._sysvar_sync_timestamp = 0
             return
+        # The server time is taken before all variables are fetched,
+        # so the next delta contains all later changes.
+        self._sysvar_sync_timestamp = changes.server_time if changes else 0
+        self._sysvar_signature = changes.signature if changes else None
+        self._sysvar_full_sync_at = datetime.now()
         _LOGGER.debug(
             "UPDATE_SYSVAR_ENTITIES: %i sysvars received for %s",
             len(variables),
@@ -161,6 +186,44 @@ class Hub:
                 new_hub_entities=_get_new_hub_entities(entities=new_sysvars),
             )
 
+    def _update_changed_sysvar_entities(self, changes: SystemVariableChanges) -> bool:
+        """
+        Update the sysvar entities with the changed values.
+
+        Returns False, if a full sync is required, because variables were added or removed,
+        the server time went backwards, the last full sync is outdated
+        or a changed value could not be parsed.
+        Renamed variables and changed types are picked up by the periodic full sync.
+        """
+        if (
+            self._sysvar_sync_timestamp == 0
+            or changes.server_time < self._sysvar_sync_timestamp
+            or changes.signature != self._sysvar_signature
+            or not changed_within_seconds(
+                last_change=self._sysvar_full_sync_at, max_age=config.SYSVAR_FULL_SYNC_INTERVAL
+            )
+        ):
+            return False
+        _LOGGER.debug(
+            "UPDATE_SYSVAR_ENTITIES: %i changed sysvars received for %s",
+            len(changes.raw_values),
+            self._central.name,
+        )
+        for vid, raw_value in changes.raw_values.items():
+            if sysvar_entity := self._central.get_sysvar_entity_by_vid(vid=vid):
+                try:
+                    sysvar_entity.write_value(raw_value)
+                except (ValueError, TypeError) as vterr:
+                    _LOGGER.debug(
+                        "UPDATE_SYSVAR_ENTITIES: %s [%s] Failed to parse changed sysvar %s",
+                        vterr.__class__.__name__,
+                        reduce_args(args=vterr.args),
+                        sysvar_entity.ccu_var_name,
+                    )
+                    return False
+        self._sysvar_sync_timestamp = changes.server_time
+        return True
+
     def _create_program(self, data: ProgramData) -> HmProgramButton:
         """Create program as entity."""
         program_button = HmProgramButton(central=self._central, data=data)
@@ -203,10 +266,11 @@ class Hub:
 
     def _identify_missing_program_ids(self, programs: tuple[ProgramData, ...]) -> tuple[str, ...]:
         """Identify missing programs."""
+        program_ids = {x.pid for x in programs}
         return tuple(
             program_button.pid
             for program_button in self._central.program_buttons
-            if program_button.pid not in [x.pid for x in programs]
+            if program_button.pid not in program_ids
         )
 
     def _identify_missing_variable_names(
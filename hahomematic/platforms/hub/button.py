@@ -31,7 +31,7 @@ class HmProgramButton(GenericHubEntity):
             data=data,
         )
         self.pid: Final = data.pid
-        self.ccu_program_name: Final = data.name
+        self.ccu_program_name: str = data.name
         self.is_active: bool = data.is_active
         self.is_internal: bool = data.is_internal
         self.last_execute_time: str = data.last_execute_time
@@ -51,6 +51,9 @@ class HmProgramButton(GenericHubEntity):
     def update_data(self, data: ProgramData) -> None:
         """Set variable value on CCU/Homegear."""
         do_update: bool = False
+        if self.ccu_program_name != data.name:
+            self.ccu_program_name = data.name
+            do_update = True
         if self.is_active != data.is_active:
             self.is_active = data.is_active
             do_update = True
@@ -17,7 +17,7 @@ from hahomematic.platforms.decorators import (
 )
 from hahomematic.platforms.entity import CallbackEntity
 from hahomematic.platforms.support import PayloadMixin, generate_unique_id
-from hahomematic.support import parse_sys_var
+from hahomematic.support import parse_sys_var, to_bool
 
 
 class GenericHubEntity(CallbackEntity, PayloadMixin):
@@ -73,6 +73,7 @@ class GenericSystemVariable(GenericHubEntity):
         """Initialize the entity."""
         super().__init__(central=central, address=SYSVAR_ADDRESS, data=data)
         self.ccu_var_name: Final = data.name
+        self.vid: Final = data.vid
         self.data_type: Final = data.data_type
         self._values: Final[tuple[str, ...] | None] = tuple(data.values) if data.values else None
         self._max: Final = data.max_value
@@ -134,9 +135,9 @@ class GenericSystemVariable(GenericHubEntity):
         if self.data_type:
             value = parse_sys_var(data_type=self.data_type, raw_value=value)
         elif isinstance(old_value, bool):
-            value = bool(value)
+            value = to_bool(value) if isinstance(value, str) else bool(value)
         elif isinstance(old_value, int):
-            value = int(value)
+            value = int(float(value)) if isinstance(value, str) else int(value)
         elif isinstance(old_value, str):
             value = str(value)
         elif isinstance(old_value, float):
@@ -27,6 +27,8 @@ from hahomematic.const import (
     DEVICE_ADDRESS_PATTERN,
     ENTITY_KEY,
     FILE_DEVICES,
+    FILE_ENTITY_PLAN,
+    FILE_JOURNAL_POSTFIX,
     FILE_PARAMSETS,
     IDENTIFIER_SEPARATOR,
     INIT_DATETIME,
@@ -147,7 +149,7 @@ def parse_sys_var(data_type: SysvarType | None, raw_value: Any) -> Any:
     if data_type == SysvarType.FLOAT:
         return float(raw_value)
     if data_type in (SysvarType.INTEGER, SysvarType.LIST):
-        return int(raw_value)
+        return int(float(raw_value))
     return raw_value
 
 
@@ -360,10 +362,13 @@ def _get_search_key(search_elements: Collection[str], search_key: str) -> str |
 def cleanup_cache_dirs(instance_name: str, storage_folder: str) -> None:
     """Clean up the used cached directories."""
     cache_dir = f"{storage_folder}/{CACHE_PATH}"
-    files_to_delete = [FILE_DEVICES, FILE_PARAMSETS]
+    files_to_delete = [FILE_DEVICES, FILE_ENTITY_PLAN, FILE_PARAMSETS]
 
     for file_to_delete in files_to_delete:
         delete_file(folder=cache_dir, file_name=f"{instance_name}_{file_to_delete}")
+        delete_file(
+            folder=cache_dir, file_name=f"{instance_name}_{file_to_delete}{FILE_JOURNAL_POSTFIX}"
+        )
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -18,12 +18,14 @@ from hahomematic.const import (
     CallSource,
     CommandRxMode,
     InterfaceName,
+    Operations,
     ParameterData,
     ParamsetKey,
     ProductGroup,
     ProgramData,
     ProxyInitState,
     SystemInformation,
+    SystemVariableChanges,
     SystemVariableData,
 )
 from hahomematic.support import is_channel_address
@@ -70,6 +72,11 @@ class ClientLocal(Client):  # pragma: no cover
             return ProductGroup.HM
         return ProductGroup.UNKNOWN
 
+    @property
+    def request_count(self) -> int:
+        """Return the number of XmlRPC requests of the client."""
+        return 0
+
     @property
     def supports_ping_pong(self) -> bool:
         """Return the supports_ping_pong info of the backend."""
@@ -133,6 +140,10 @@ class ClientLocal(Client):  # pragma: no cover
         """Get all system variables from CCU / Homegear."""
         return ()
 
+    async def get_system_variables_since(self, since: int) -> SystemVariableChanges | None:
+        """Get the system variables, that changed since the given timestamp, if supported."""
+        return None
+
     async def get_all_programs(self, include_internal: bool) -> tuple[ProgramData, ...]:
         """Get all programs, if available."""
         return ()
@@ -197,6 +208,23 @@ class ClientLocal(Client):  # pragma: no cover
         """Return a value from CCU."""
         return
 
+    async def get_values(
+        self,
+        channel_address: str,
+        paramset_key: ParamsetKey,
+        call_source: CallSource = CallSource.MANUAL_OR_SCHEDULED,
+    ) -> dict[str, Any]:
+        """Return all values of a paramset of a channel from CCU."""
+        return {
+            parameter: None
+            for parameter, parameter_data in self.central.paramset_descriptions.get_paramset_key_descriptions(
+                interface_id=self.interface_id,
+                channel_address=channel_address,
+                paramset_key=paramset_key,
+            ).items()
+            if parameter_data["OPERATIONS"] & Operations.READ
+        }
+
     async def set_value(
         self,
         channel_address: str,
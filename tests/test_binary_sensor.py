@@ -9,7 +9,7 @@ import pytest
 
 from hahomematic.central import CentralUnit
 from hahomematic.client import Client
-from hahomematic.const import EntityUsage
+from hahomematic.const import EntityUsage, ParameterType, ParamsetKey
 from hahomematic.platforms.generic import HmBinarySensor
 from hahomematic.platforms.hub import HmSysvarBinarySensor
 
@@ -49,6 +49,16 @@ async def test_hmbinarysensor(
     assert binary_sensor.value is False
     assert binary_sensor.is_writeable is False
     assert binary_sensor.visible is True
+    # The type of the shared paramset description is not changed.
+    assert (
+        central.paramset_descriptions.get_parameter_data(
+            interface_id=const.INTERFACE_ID,
+            channel_address="VCU5864966:1",
+            paramset_key=ParamsetKey.VALUES,
+            parameter="STATE",
+        )["TYPE"]
+        == ParameterType.ENUM
+    )
     await central.event(const.INTERFACE_ID, "VCU5864966:1", "STATE", 1)
     assert binary_sensor.value is True
     await central.event(const.INTERFACE_ID, "VCU5864966:1", "STATE", 0)
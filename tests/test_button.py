@@ -109,3 +109,45 @@ async def test_hmprogrambutton(
     assert button2.is_internal is False
     assert button2.ccu_program_name == "p_2"
     assert button2.name == "p_2"
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        ({}, True, False, True, None, None),
+    ],
+)
+async def test_hmprogrambutton_by_name(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the lookup of program buttons by name."""
+    central, mock_client, _ = central_client_factory
+    button = central.get_program_button("pid1")
+    assert central.get_program_button_by_name("p1") is button
+    assert central.get_program_button_by_name("P_p1") is button
+    assert central.get_program_button_by_name("p_2") is central.get_program_button("pid2")
+    assert central.get_program_button_by_name("p3") is None
+
+    # a renamed program keeps the program button
+    mock_client.get_all_programs.return_value = [
+        ProgramData(
+            name="p3", pid="pid1", is_active=True, is_internal=False, last_execute_time=""
+        ),
+    ]
+    await central.fetch_program_data(scheduled=True)
+    assert central.get_program_button("pid1") is button
+    assert button.ccu_program_name == "p3"
+    assert central.get_program_button_by_name("p3") is button
+    assert central.get_program_button_by_name("p1") is None
+    assert central.get_program_button_by_name("P_p1") is button
+    assert central.get_program_button("pid2") is None
+    assert central.get_program_button_by_name("p_2") is None
+    assert len(central.program_buttons) == 1
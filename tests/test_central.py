@@ -2,29 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
+from functools import partial
 from typing import Any
-from unittest.mock import Mock, call, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 
-from hahomematic.central import CentralUnit
-from hahomematic.client import Client
+from hahomematic.caches.catalog import ParameterCatalogEntry
+from hahomematic.caches.dynamic import CentralDataCache
+from hahomematic.central import CentralConfig, CentralUnit
+from hahomematic.client import Client, InterfaceConfig
 from hahomematic.config import PING_PONG_MISMATCH_COUNT
 from hahomematic.const import (
     DATETIME_FORMAT_MILLIS,
     DEFAULT_INCLUDE_INTERNAL_PROGRAMS,
     DEFAULT_INCLUDE_INTERNAL_SYSVARS,
     EVENT_AVAILABLE,
+    IGNORE_FOR_UN_IGNORE_PARAMETERS,
+    NO_CACHE_ENTRY,
+    Backend,
+    BackendSystemEvent,
     EntityUsage,
     HmPlatform,
+    INIT_DATETIME,
     HomematicEventType,
     InterfaceEventType,
+    InterfaceName,
     Operations,
     Parameter,
     ParamsetKey,
+    ProxyInitState,
+    SystemInformation,
+    SystemVariableChanges,
+    SystemVariableData,
+    SysvarType,
 )
 from hahomematic.exceptions import HaHomematicException, NoClients
+from hahomematic.platforms import create_entities_and_events
+from hahomematic.platforms.device import HmDevice
 
 from tests import const, helper
 
@@ -93,6 +110,62 @@ async def test_device_get_entities(
     assert entities_reg == ()
 
 
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_entity_registry(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the indexes of the entity registry."""
+    central, _, _ = central_client_factory
+    all_entities = [
+        entity
+        for device in central.devices
+        for entity in device.get_entities(exclude_no_create=False)
+    ]
+    assert set(central.get_entities(exclude_no_create=False)) == set(all_entities)
+    for platform in (HmPlatform.SENSOR, HmPlatform.SWITCH, HmPlatform.UPDATE):
+        assert set(central.get_entities(platform=platform)) == {
+            entity
+            for device in central.devices
+            for entity in device.get_entities(platform=platform)
+        }
+    assert central.get_readable_generic_entities(paramset_key=ParamsetKey.VALUES)
+    assert all(
+        entity.is_readable and entity.paramset_key == ParamsetKey.VALUES
+        for entity in central.get_readable_generic_entities(paramset_key=ParamsetKey.VALUES)
+    )
+    assert len(central.get_events(event_type=HomematicEventType.KEYPRESS)) == len(
+        central.get_events(event_type=HomematicEventType.KEYPRESS, registered=False)
+    )
+
+    switch = central.get_entities(platform=HmPlatform.SWITCH)[0]
+    unregister = switch.register_entity_updated_callback(cb=Mock(), custom_id="switch")
+    assert central.get_entity_by_custom_id(custom_id="switch") is switch
+    assert central.get_entities(registered=True) == (switch,)
+    assert switch not in central.get_entities(platform=HmPlatform.SWITCH, registered=False)
+    unregister()
+    assert central.get_entity_by_custom_id(custom_id="switch") is None
+    assert central.get_entities(registered=True) == ()
+
+    switch.register_entity_updated_callback(cb=Mock(), custom_id="switch")
+    await central.delete_devices(interface_id=const.INTERFACE_ID, addresses=["VCU2128127"])
+    assert central.get_entity_by_custom_id(custom_id="switch") is None
+    assert central.entity_registry.get_entity(unique_id=switch.unique_id) is None
+    assert len(central.get_entities(exclude_no_create=False)) == 27
+
+
 @pytest.mark.asyncio()
 @pytest.mark.parametrize(
     (
@@ -479,6 +552,102 @@ async def test_all_parameters_with_un_ignore(
     assert len(parameters) == expected_result
 
 
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_parameter_catalog(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the queries of the parameter catalog."""
+    central, _, _ = central_client_factory
+    catalog = central.parameter_catalog
+    readable = catalog.query(
+        paramset_key=ParamsetKey.VALUES, operations=(Operations.READ, Operations.EVENT)
+    )
+    assert len(readable) == 65
+    assert all(entry.supports_operations(operations_mask=5) for entry in readable)
+    assert {entry.model for entry in readable} == {"HmIP-BSM", "HmIP-STHD"}
+    candidates = catalog.query(
+        paramset_key=ParamsetKey.VALUES,
+        operations=(Operations.READ, Operations.EVENT),
+        un_ignore_candidates_only=True,
+    )
+    assert len(candidates) == 44
+    assert all(entry.is_un_ignore_candidate(operations_mask=5) for entry in candidates)
+
+    # The operations must be supported by a single channel.
+    entry = ParameterCatalogEntry(
+        model="HmIP-BSM",
+        channel_no=1,
+        paramset_key=ParamsetKey.VALUES,
+        parameter="LEVEL",
+        operations={"VCU0000001:1": Operations.READ, "VCU0000002:1": Operations.WRITE},
+        entities={"VCU0000001:1": None, "VCU0000002:1": None},
+    )
+    assert entry.supports_operations(operations_mask=Operations.READ)
+    assert not entry.supports_operations(operations_mask=Operations.READ | Operations.WRITE)
+    assert not entry.is_un_ignore_candidate(operations_mask=Operations.READ | Operations.WRITE)
+
+    # The un ignore state of the entities is evaluated on every query.
+    non_candidate = next(
+        entry
+        for entry in readable
+        if entry not in candidates and entry.parameter not in IGNORE_FOR_UN_IGNORE_PARAMETERS
+    )
+    entity = next(entity for entity in non_candidate.entities.values() if entity)
+    entity.force_usage(forced_usage=EntityUsage.NO_CREATE)
+    assert non_candidate in catalog.query(
+        paramset_key=ParamsetKey.VALUES,
+        operations=(Operations.READ, Operations.EVENT),
+        un_ignore_candidates_only=True,
+    )
+
+    # full-text and pagination
+    assert [
+        entry.un_ignore_name
+        for entry in catalog.query(paramset_key=ParamsetKey.VALUES, text="actual_temperature:")
+    ] == ["ACTUAL_TEMPERATURE:VALUES@HmIP-BSM:0", "ACTUAL_TEMPERATURE:VALUES@HmIP-STHD:1"]
+    page = catalog.query(
+        paramset_key=ParamsetKey.VALUES,
+        operations=(Operations.READ, Operations.EVENT),
+        offset=10,
+        limit=5,
+    )
+    assert page == readable[10:15]
+
+    # The results are kept until the next change of the devices.
+    with patch.object(catalog, "_get_entries", wraps=catalog._get_entries) as get_entries:
+        for _ in range(1000):
+            catalog.query(
+                paramset_key=ParamsetKey.VALUES,
+                operations=(Operations.READ, Operations.EVENT),
+                un_ignore_candidates_only=True,
+                offset=10,
+                limit=5,
+            )
+        get_entries.assert_not_called()
+        catalog.query(paramset_key=ParamsetKey.MASTER)
+        get_entries.assert_called_once()
+    assert central.get_un_ignore_candidates(include_master=True)
+
+    await central.delete_devices(interface_id=const.INTERFACE_ID, addresses=["VCU6354483"])
+    assert not catalog.query(paramset_key=ParamsetKey.VALUES, text="@HmIP-STHD:")
+    assert {entry.model for entry in catalog.query(paramset_key=ParamsetKey.VALUES)} == {
+        "HmIP-BSM"
+    }
+
+
 @pytest.mark.asyncio()
 @pytest.mark.parametrize(
     (
@@ -582,7 +751,7 @@ async def test_add_device(
     dev_desc = helper.load_device_description(central=central, filename="HmIP-BSM.json")
     await central.add_new_devices(interface_id=const.INTERFACE_ID, device_descriptions=dev_desc)
     assert len(central._devices) == 2
-    assert len(central.get_entities(exclude_no_create=False)) == 58
+    assert len(central.get_entities(exclude_no_create=False)) == 54
     assert len(central.device_descriptions._raw_device_descriptions.get(const.INTERFACE_ID)) == 20
     assert (
         len(central.paramset_descriptions._raw_paramset_descriptions.get(const.INTERFACE_ID)) == 20
@@ -591,6 +760,53 @@ async def test_add_device(
     assert len(central._devices) == 2
 
 
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, ["HmIP-BSM.json"], None),
+    ],
+)
+async def test_drain_new_entities(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test, that only the entities of added devices are published."""
+    central, _, _ = central_client_factory
+    registry = central.entity_registry
+    new_entities: list[Any] = []
+
+    def _system_callback(system_event: BackendSystemEvent, **kwargs: Any) -> None:
+        if system_event == BackendSystemEvent.DEVICES_CREATED:
+            new_entities.append(kwargs["new_entities"])
+
+    central.register_backend_system_callback(cb=_system_callback)
+    # The entities of the existing device have been published on startup.
+    assert registry.drain_new_entities(platform=HmPlatform.SENSOR) == ()
+    generation = registry.generation
+
+    dev_desc = helper.load_device_description(central=central, filename="HmIP-BSM.json")
+    await central.add_new_devices(interface_id=const.INTERFACE_ID, device_descriptions=dev_desc)
+    assert registry.generation == generation + 27
+    published = {entity for entities in new_entities[0].values() for entity in entities}
+    assert published
+    assert {entity.device.address for entity in published} == {"VCU2128127"}
+    assert published == set(
+        central.get_device(address="VCU2128127").get_entities(registered=False)
+    )
+    for platform in new_entities[0]:
+        assert registry.drain_new_entities(platform=platform) == ()
+
+    await central.delete_devices(interface_id=const.INTERFACE_ID, addresses=["VCU2128127"])
+    assert registry.generation == generation + 54
+
+
 @pytest.mark.asyncio()
 @pytest.mark.parametrize(
     (
@@ -611,7 +827,7 @@ async def test_delete_device(
     """Test device delete_device."""
     central, _, _ = central_client_factory
     assert len(central._devices) == 2
-    assert len(central.get_entities(exclude_no_create=False)) == 58
+    assert len(central.get_entities(exclude_no_create=False)) == 54
     assert len(central.device_descriptions._raw_device_descriptions.get(const.INTERFACE_ID)) == 20
     assert (
         len(central.paramset_descriptions._raw_paramset_descriptions.get(const.INTERFACE_ID)) == 20
@@ -626,6 +842,60 @@ async def test_delete_device(
     )
 
 
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_save_caches_debounced(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test, that a burst of changes is saved with a single write of the caches."""
+    central, _, _ = central_client_factory
+    with (
+        patch("hahomematic.config.SAVE_CACHES_DEBOUNCE", 0.2),
+        patch("hahomematic.config.SAVE_CACHES_MAX_DELAY", 5),
+        patch.object(central, "save_caches", AsyncMock()) as save_caches,
+    ):
+        for address in ("VCU2128127", "VCU6354483"):
+            await central.delete_devices(interface_id=const.INTERFACE_ID, addresses=[address])
+            await asyncio.sleep(0.05)
+        assert save_caches.call_count == 0
+        await asyncio.sleep(0.4)
+        assert save_caches.call_args_list == [
+            call(
+                save_device_descriptions=True,
+                save_paramset_descriptions=True,
+                save_entity_plan=True,
+                compact=False,
+            )
+        ]
+
+        # A long burst is saved after the max delay.
+        with patch("hahomematic.config.SAVE_CACHES_MAX_DELAY", 0.3):
+            for _ in range(5):
+                await central.delete_devices(interface_id=const.INTERFACE_ID, addresses=[])
+                await asyncio.sleep(0.1)
+        assert save_caches.call_count == 2
+
+        # Pending changes are saved and compacted on stop.
+        await central.delete_devices(interface_id=const.INTERFACE_ID, addresses=[])
+        await central._cache_save_scheduler.flush(compact=True)
+        assert save_caches.call_count == 3
+        assert save_caches.call_args.kwargs["compact"] is True
+        await asyncio.sleep(0.3)
+        assert save_caches.call_count == 3
+
+
 @pytest.mark.asyncio()
 @pytest.mark.parametrize(
     (
@@ -760,29 +1030,29 @@ async def test_central_services(
         include_internal=DEFAULT_INCLUDE_INTERNAL_SYSVARS
     )
 
-    assert len(mock_client.method_calls) == 42
+    assert len(mock_client.method_calls) == 34
     await central.load_and_refresh_entity_data(paramset_key=ParamsetKey.MASTER)
-    assert len(mock_client.method_calls) == 42
+    assert len(mock_client.method_calls) == 34
     await central.load_and_refresh_entity_data(paramset_key=ParamsetKey.VALUES)
-    assert len(mock_client.method_calls) == 60
+    assert len(mock_client.method_calls) == 38
 
     await central.get_system_variable(name="SysVar_Name")
     assert mock_client.method_calls[-1] == call.get_system_variable("SysVar_Name")
 
-    assert len(mock_client.method_calls) == 61
+    assert len(mock_client.method_calls) == 39
     await central.set_system_variable(name="sv_alarm", value=True)
     assert mock_client.method_calls[-1] == call.set_system_variable(name="sv_alarm", value=True)
-    assert len(mock_client.method_calls) == 62
+    assert len(mock_client.method_calls) == 40
     await central.set_system_variable(name="SysVar_Name", value=True)
-    assert len(mock_client.method_calls) == 62
+    assert len(mock_client.method_calls) == 40
 
     await central.set_install_mode(interface_id=const.INTERFACE_ID)
     assert mock_client.method_calls[-1] == call.set_install_mode(
         on=True, t=60, mode=1, device_address=None
     )
-    assert len(mock_client.method_calls) == 63
+    assert len(mock_client.method_calls) == 41
     await central.set_install_mode(interface_id="NOT_A_VALID_INTERFACE_ID")
-    assert len(mock_client.method_calls) == 63
+    assert len(mock_client.method_calls) == 41
 
     await central.get_client(interface_id=const.INTERFACE_ID).set_value(
         channel_address="123",
@@ -796,7 +1066,7 @@ async def test_central_services(
         parameter="LEVEL",
         value=1.0,
     )
-    assert len(mock_client.method_calls) == 64
+    assert len(mock_client.method_calls) == 42
 
     with pytest.raises(HaHomematicException):
         await central.get_client(interface_id="NOT_A_VALID_INTERFACE_ID").set_value(
@@ -805,7 +1075,7 @@ async def test_central_services(
             parameter="LEVEL",
             value=1.0,
         )
-    assert len(mock_client.method_calls) == 64
+    assert len(mock_client.method_calls) == 42
 
     await central.get_client(interface_id=const.INTERFACE_ID).put_paramset(
         channel_address="123",
@@ -815,14 +1085,14 @@ async def test_central_services(
     assert mock_client.method_calls[-1] == call.put_paramset(
         channel_address="123", paramset_key="VALUES", values={"LEVEL": 1.0}
     )
-    assert len(mock_client.method_calls) == 65
+    assert len(mock_client.method_calls) == 43
     with pytest.raises(HaHomematicException):
         await central.get_client(interface_id="NOT_A_VALID_INTERFACE_ID").put_paramset(
             channel_address="123",
             paramset_key=ParamsetKey.VALUES,
             values={"LEVEL": 1.0},
         )
-    assert len(mock_client.method_calls) == 65
+    assert len(mock_client.method_calls) == 43
 
     assert (
         central.get_generic_entity(
@@ -851,7 +1121,7 @@ async def test_central_direct(factory: helper.Factory) -> None:
         assert central.available is False
         assert central.system_information.serial == "0815_4711"
         assert len(central._devices) == 2
-        assert len(central.get_entities(exclude_no_create=False)) == 58
+        assert len(central.get_entities(exclude_no_create=False)) == 54
     finally:
         await central.stop()
 
@@ -988,6 +1258,108 @@ async def test_unknown_pong_failure(
     assert client.ping_pong_cache.unknown_pong_count == 16
 
 
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        ({}, True, False, False, None, None),
+    ],
+)
+async def test_sysvar_delta_poll(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the delta poll and the indexed reconciliation of system variables."""
+    central, mock_client, _ = central_client_factory
+    central._model = Backend.CCU
+    sysvar_count = 1000
+    signature = f"{sysvar_count};{sum(range(sysvar_count))};{sysvar_count - 1}"
+    variables = tuple(
+        SystemVariableData(
+            vid=str(i),
+            name=f"sv_{i}" if i else "Temperature",
+            data_type=SysvarType.INTEGER,
+            value=0,
+        )
+        for i in range(sysvar_count)
+    )
+    added = f"{sysvar_count + 1};{sum(range(sysvar_count + 1))};{sysvar_count}"
+    removed = f"{sysvar_count - 1};{sum(range(sysvar_count - 1))};{sysvar_count - 2}"
+    changes = [
+        SystemVariableChanges(server_time=100, signature=signature, raw_values={}),
+        SystemVariableChanges(
+            server_time=160, signature=signature, raw_values={"1": "5.000000", "2": "7"}
+        ),
+        SystemVariableChanges(server_time=220, signature=added, raw_values={}),
+        SystemVariableChanges(server_time=280, signature=added, raw_values={}),
+        SystemVariableChanges(server_time=340, signature=added, raw_values={}),
+        SystemVariableChanges(server_time=400, signature=added, raw_values={"4": "abc"}),
+        SystemVariableChanges(server_time=460, signature=removed, raw_values={}),
+    ]
+    mock_client.get_all_system_variables.return_value = variables
+    mock_client.get_system_variables_since.side_effect = changes
+    full_sync_count = mock_client.get_all_system_variables.call_count
+
+    # initial full sync
+    await central.fetch_sysvar_data(scheduled=True)
+    assert len(central.sysvar_entities) == sysvar_count
+    assert mock_client.get_system_variables_since.call_args == call(since=0)
+    assert mock_client.get_all_system_variables.call_count == full_sync_count + 1
+    assert central.get_sysvar_entity_by_vid(vid="1") is central.get_sysvar_entity(name="sv_1")
+    assert central.get_sysvar_entity(name="Sv_Temperature") is central.get_sysvar_entity(
+        name="Temperature"
+    )
+
+    # delta sync only transfers the changed values
+    await central.fetch_sysvar_data(scheduled=True)
+    assert mock_client.get_system_variables_since.call_args == call(since=100)
+    assert mock_client.get_all_system_variables.call_count == full_sync_count + 1
+    assert central.get_sysvar_entity("sv_1").value == 5
+    assert central.get_sysvar_entity("sv_2").value == 7
+    assert central.get_sysvar_entity("sv_3").value == 0
+
+    # an added variable requires a full sync
+    await central.fetch_sysvar_data(scheduled=True)
+    assert mock_client.get_system_variables_since.call_args == call(since=160)
+    assert mock_client.get_all_system_variables.call_count == full_sync_count + 2
+
+    # renamed variables are picked up by the periodic full sync
+    mock_client.get_all_system_variables.return_value = tuple(
+        SystemVariableData(vid="3", name="sv_renamed", data_type=SysvarType.INTEGER, value=0)
+        if var.vid == "3"
+        else var
+        for var in variables
+    )
+    await central.fetch_sysvar_data(scheduled=True)
+    assert mock_client.get_all_system_variables.call_count == full_sync_count + 2
+    central._hub._sysvar_full_sync_at = INIT_DATETIME
+    await central.fetch_sysvar_data(scheduled=True)
+    assert mock_client.get_all_system_variables.call_count == full_sync_count + 3
+    assert central.get_sysvar_entity(name="sv_3") is None
+    assert central.get_sysvar_entity_by_vid(vid="3") is central.get_sysvar_entity(
+        name="sv_renamed"
+    )
+
+    # a value, that cannot be parsed, requires a full sync
+    await central.fetch_sysvar_data(scheduled=True)
+    assert mock_client.get_all_system_variables.call_count == full_sync_count + 4
+    assert central.get_sysvar_entity("sv_4").value == 0
+
+    # a removed variable is removed from all indexes
+    mock_client.get_all_system_variables.return_value = variables[:-1]
+    await central.fetch_sysvar_data(scheduled=True)
+    assert mock_client.get_all_system_variables.call_count == full_sync_count + 5
+    assert len(central.sysvar_entities) == sysvar_count - 1
+    assert central.get_sysvar_entity(name="sv_999") is None
+    assert central.get_sysvar_entity_by_vid(vid="999") is None
+
+
 @pytest.mark.asyncio()
 @pytest.mark.parametrize(
     (
@@ -1016,6 +1388,182 @@ async def test_central_caches(
     )
 
 
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_central_data_cache_delta(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test merging of delta device data into the central data cache."""
+    central, _, _ = central_client_factory
+    data_cache = central.data_cache
+    data_cache.clear()
+    assert data_cache.get_sync_timestamp(interface="BidCos-RF") == 0
+    # a delta without a previous full sync requires a full sync
+    assert (
+        data_cache.add_data(
+            interface="BidCos-RF", all_device_data={}, sync_timestamp=100, is_delta=True
+        )
+        is False
+    )
+
+    assert data_cache.add_data(
+        interface="BidCos-RF",
+        all_device_data={
+            "BidCos-RF.VCU0000001%3A1.STATE": False,
+            "BidCos-RF.VCU0000001%3A2.STATE": False,
+        },
+        sync_timestamp=100,
+    )
+    assert data_cache.add_data(
+        interface="HmIP-RF",
+        all_device_data={"HmIP-RF.VCU0000002%3A1.STATE": False},
+        sync_timestamp=200,
+    )
+    assert data_cache.add_data(
+        interface="BidCos-RF",
+        all_device_data={"BidCos-RF.VCU0000001%3A1.STATE": True},
+        sync_timestamp=150,
+        is_delta=True,
+    )
+    assert data_cache.get_sync_timestamp(interface="BidCos-RF") == 150
+    assert data_cache.get_data("BidCos-RF", "VCU0000001:1", "STATE") is True
+    assert data_cache.get_data("BidCos-RF", "VCU0000001:2", "STATE") is False
+    assert data_cache.get_data("HmIP-RF", "VCU0000002:1", "STATE") is False
+
+    # a backend clock that went backwards requires a full sync
+    assert (
+        data_cache.add_data(
+            interface="BidCos-RF", all_device_data={}, sync_timestamp=50, is_delta=True
+        )
+        is False
+    )
+
+    data_cache.clear(interface="BidCos-RF")
+    assert data_cache.get_sync_timestamp(interface="BidCos-RF") == 0
+    assert data_cache.get_data("BidCos-RF", "VCU0000001:1", "STATE") == NO_CACHE_ENTRY
+    assert data_cache.get_data("HmIP-RF", "VCU0000002:1", "STATE") is False
+
+
+@pytest.mark.asyncio()
+async def test_central_data_cache_concurrent_load() -> None:
+    """Test the concurrent loading of device data with a limit."""
+    running = 0
+    max_running = 0
+
+    async def _fetch_all_device_data() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    clients = [Mock(fetch_all_device_data=_fetch_all_device_data) for _ in range(5)]
+    data_cache = CentralDataCache(central=Mock(clients=clients))
+    with patch("hahomematic.config.MAX_CONCURRENT_DATA_LOADS", 2):
+        await data_cache.load(direct_call=True)
+    assert max_running == 2
+
+
+@pytest.mark.asyncio()
+async def test_central_data_cache_stale_while_revalidate() -> None:
+    """Test that outdated data is served, while one revalidation runs in background."""
+    central = Mock()
+    data_cache = CentralDataCache(central=central)
+    data_cache.add_data(
+        interface="BidCos-RF",
+        all_device_data={"BidCos-RF.VCU0000001%3A1.STATE": True},
+        sync_timestamp=100,
+    )
+    assert data_cache.get_data("BidCos-RF", "VCU0000001:1", "STATE") is True
+    assert central.looper.create_task.call_count == 0
+
+    data_cache._refreshed_at["BidCos-RF"] = datetime(2000, 1, 1)
+    assert data_cache.is_empty is True
+    assert data_cache.get_data("BidCos-RF", "VCU0000001:1", "STATE") is True
+    assert data_cache.get_data("BidCos-RF", "VCU0000001:1", "STATE") is True
+    assert central.looper.create_task.call_count == 1
+    # avoid a warning about the never awaited revalidation
+    central.looper.create_task.call_args.kwargs["target"].close()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_central_load_device_values(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the progress reporting of the device value loading."""
+    central, client, _ = central_client_factory
+    system_events: list[tuple[BackendSystemEvent, dict[str, Any]]] = []
+
+    def _system_callback(system_event: BackendSystemEvent, **kwargs: Any) -> None:
+        system_events.append((system_event, kwargs))
+
+    central.register_backend_system_callback(cb=_system_callback)
+    devices = set(central._devices.values())
+    with patch("hahomematic.config.MAX_CONCURRENT_VALUE_LOADS", 2):
+        await central._load_device_values(interface_id=client.interface_id, devices=devices)
+
+    progress = [
+        kwargs for event, kwargs in system_events if event == BackendSystemEvent.DEVICES_LOADING
+    ]
+    assert len(progress) == len(devices)
+    assert [kwargs["loaded_devices"] for kwargs in progress] == list(range(1, len(devices) + 1))
+    assert progress[-1]["total_devices"] == len(devices)
+    assert progress[-1]["loaded_entities"] == sum(
+        len(device.generic_entities) for device in devices
+    )
+    assert system_events[-1][0] == BackendSystemEvent.DEVICES_CREATED
+
+    # A device, whose values could not be loaded, is neither added nor published.
+    for device in devices:
+        del central._devices[device.address]
+        central._entity_registry.remove_device(device=device)
+        central._parameter_catalog.remove_device(device=device)
+    failed_device = next(device for device in devices if device.address == "VCU2128127")
+    load_value_cache = HmDevice.load_value_cache
+
+    async def _load_value_cache(self: HmDevice) -> None:
+        if self is failed_device:
+            raise HaHomematicException("load failed")
+        await load_value_cache(self)
+
+    system_events.clear()
+    with patch.object(HmDevice, "load_value_cache", _load_value_cache):
+        await central._load_device_values(interface_id=client.interface_id, devices=devices)
+    assert set(central._devices.values()) == devices - {failed_device}
+    assert system_events[-1][0] == BackendSystemEvent.DEVICES_CREATED
+    published = {
+        entity.device
+        for entities in system_events[-1][1]["new_entities"].values()
+        for entity in entities
+    }
+    assert published == devices - {failed_device}
+
+
 @pytest.mark.asyncio()
 @pytest.mark.parametrize(
     (
@@ -1041,3 +1589,321 @@ async def test_central_getter(
     assert central.get_event("123", 1) is None
     assert central.get_program_button("123") is None
     assert central.get_sysvar_entity("123") is None
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, ["LEVEL:VALUES@HmIP-BSM:4"]),
+    ],
+)
+async def test_parameter_visibility_rules(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the compiled rules and memoized decisions of the parameter visibility."""
+    central, _, _ = central_client_factory
+    parameter_visibility = central.parameter_visibility
+    stats = parameter_visibility.stats
+    assert stats["models"] == 2
+    assert stats["decisions"] > 0
+    assert stats["misses"] == stats["decisions"]
+
+    assert (
+        parameter_visibility.parameter_is_un_ignored(
+            model="HmIP-BSM",
+            channel_no=4,
+            paramset_key=ParamsetKey.VALUES,
+            parameter="LEVEL",
+        )
+        is True
+    )
+    assert (
+        parameter_visibility.parameter_is_un_ignored(
+            model="HmIP-BSM",
+            channel_no=5,
+            paramset_key=ParamsetKey.VALUES,
+            parameter="LEVEL",
+        )
+        is False
+    )
+    assert (
+        parameter_visibility.parameter_is_ignored(
+            model="HmIP-STHD",
+            channel_no=0,
+            paramset_key=ParamsetKey.VALUES,
+            parameter="LOWBAT",
+        )
+        is False
+    )
+    assert (
+        parameter_visibility.parameter_is_ignored(
+            model="HmIP-STHD",
+            channel_no=1,
+            paramset_key=ParamsetKey.VALUES,
+            parameter="LOWBAT",
+        )
+        is True
+    )
+    assert parameter_visibility.is_relevant_paramset(
+        model="HmIP-STHD", paramset_key=ParamsetKey.MASTER, channel_no=1
+    )
+    assert not parameter_visibility.is_relevant_paramset(
+        model="HmIP-BSM", paramset_key=ParamsetKey.MASTER, channel_no=1
+    )
+    assert parameter_visibility.model_is_ignored(model="HmIP-BSM") is False
+
+    hits = parameter_visibility.stats["hits"]
+    parameter_visibility.parameter_is_un_ignored(
+        model="HmIP-BSM",
+        channel_no=4,
+        paramset_key=ParamsetKey.VALUES,
+        parameter="LEVEL",
+    )
+    assert parameter_visibility.stats["hits"] == hits + 1
+
+    await parameter_visibility.load()
+    assert parameter_visibility.stats["models"] == 0
+    assert parameter_visibility.stats["decisions"] == 0
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_central_startup_report(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the startup report of the central."""
+    central, _, _ = central_client_factory
+    report = central.get_startup_report()
+    assert report["name"] == central.name
+    assert report["duration"] is not None
+    assert "load_parameter_visibility" in report["phases"]
+    assert "load_data_cache" in report["phases"]
+    interface_phases = report["interfaces"][const.INTERFACE_ID]
+    assert "create_client" in interface_phases
+    assert "refresh_device_descriptions" in interface_phases
+    assert "fetch_paramset_descriptions" in interface_phases
+    assert "create_devices" in interface_phases
+    assert "load_device_values" in interface_phases
+    assert report["counters"]["devices"] == 2
+    assert report["counters"]["entities"] == 54
+    assert report["counters"]["channels"] == 20
+    assert report["counters"]["rpc_calls"] == 0
+    assert {device["address"] for device in report["slowest_devices"]} == {
+        "VCU2128127",
+        "VCU6354483",
+    }
+    assert len(central.get_startup_report(slowest_devices=1)["slowest_devices"]) == 1
+    central.startup_report.log_summary()
+
+
+@pytest.mark.asyncio()
+async def test_central_concurrent_clients() -> None:
+    """Test the concurrent creation, init and check of clients with latency per interface."""
+    latencies = {
+        InterfaceName.BIDCOS_RF: 0.1,
+        InterfaceName.HMIP_RF: 0.2,
+        InterfaceName.VIRTUAL_DEVICES: 0.3,
+    }
+    central = CentralConfig(
+        name=const.CENTRAL_NAME,
+        host=const.CCU_HOST,
+        username=const.CCU_USERNAME,
+        password=const.CCU_PASSWORD,
+        central_id="test1234",
+        storage_folder="homematicip_local",
+        interface_configs={
+            InterfaceConfig(central_name=const.CENTRAL_NAME, interface=interface, port=port)
+            for port, interface in enumerate(latencies, start=2001)
+        },
+        default_callback_port=54321,
+        client_session=None,
+        start_direct=True,
+    ).create_central()
+
+    # The number of calls, that are running at the same time.
+    in_flight: list[int] = [0, 0]
+
+    async def _delayed(interface: str, result: Any = None) -> Any:
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        try:
+            await asyncio.sleep(latencies[interface])
+        finally:
+            in_flight[0] -= 1
+        return result
+
+    def _get_max_in_flight() -> int:
+        max_in_flight = in_flight[1]
+        in_flight[1] = 0
+        return max_in_flight
+
+    async def _create_client(central: CentralUnit, interface_config: InterfaceConfig) -> Mock:
+        interface = interface_config.interface
+        client = Mock(
+            interface=interface,
+            interface_id=interface_config.interface_id,
+            system_information=SystemInformation(),
+            available=True,
+        )
+        client.proxy_init = AsyncMock(
+            side_effect=partial(_delayed, interface, ProxyInitState.INIT_SUCCESS)
+        )
+        client.is_connected = AsyncMock(side_effect=partial(_delayed, interface, True))
+        client.reconnect = AsyncMock(return_value=True)
+        return await _delayed(interface, client)
+
+    with patch("hahomematic.client.create_client", side_effect=_create_client):
+        assert await central._create_clients() is True
+        # The clients of all interfaces are created at the same time, not one after another.
+        assert _get_max_in_flight() == 3
+    assert len(central._clients) == 3
+
+    await central._init_clients()
+    assert _get_max_in_flight() == 3
+    for client in central._clients.values():
+        client.proxy_init.assert_called_once()
+
+    with patch(
+        "hahomematic.central.CentralUnit.load_and_refresh_entity_data"
+    ) as load_and_refresh_entity_data:
+        await central._connection_checker._check_connection()
+        assert _get_max_in_flight() == 3
+        for client in central._clients.values():
+            client.reconnect.assert_not_called()
+        load_and_refresh_entity_data.assert_not_called()
+
+        # A hanging interface is reconnected after the timeout, without delaying the others.
+        with patch("hahomematic.config.INTERFACE_TIMEOUT", 0.25):
+            await central._connection_checker._check_connection()
+            assert _get_max_in_flight() == 3
+        for client in central._clients.values():
+            if client.interface == InterfaceName.VIRTUAL_DEVICES:
+                client.reconnect.assert_called_once()
+            else:
+                client.reconnect.assert_not_called()
+        load_and_refresh_entity_data.assert_called_once()
+
+    # A hanging interface does not prevent the creation of the others.
+    central._clients.clear()
+    with (
+        patch("hahomematic.client.create_client", side_effect=_create_client),
+        patch("hahomematic.config.INTERFACE_TIMEOUT", 0.25),
+    ):
+        assert await central._create_clients() is False
+    assert len(central._clients) == 2
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_central_entity_plan(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the replay of the entity plan."""
+    central, _, _ = central_client_factory
+    device = central.get_device(address="VCU2128127")
+    entity_plan = central.entity_plan.get_entity_plan(device=device)
+    assert entity_plan
+    assert ["VALUES", "SECTION", "lazy"] in entity_plan["VCU2128127:4"]
+    assert ["VALUES", "PRESS_SHORT", "event"] in entity_plan["VCU2128127:1"]
+
+    # The entity plan is replayed without visibility checks.
+    new_device = HmDevice(
+        central=central, interface_id=const.INTERFACE_ID, device_address="VCU2128127"
+    )
+    with patch.object(
+        central.parameter_visibility, "parameter_is_ignored", side_effect=AssertionError
+    ):
+        create_entities_and_events(device=new_device)
+    assert [entity.entity_key for entity in new_device.generic_entities] == [
+        entity.entity_key for entity in device.generic_entities
+    ]
+    assert [event.entity_key for event in new_device.generic_events] == [
+        event.entity_key for event in device.generic_events
+    ]
+
+    # The entity plan is invalid, if the firmware of the device changed.
+    with patch("hahomematic.platforms.device.HmDevice.firmware", "9.9.9"):
+        assert central.entity_plan.get_entity_plan(device=device) is None
+
+    # The validity is checked without the paramset descriptions.
+    with patch.object(
+        central.paramset_descriptions,
+        "get_channel_paramset_descriptions",
+        side_effect=AssertionError,
+    ):
+        assert central.entity_plan.get_entity_plan(device=device)
+
+    # An unchanged paramset description keeps the entity plan.
+    paramset_description = central.paramset_descriptions.get_paramset_key_descriptions(
+        interface_id=const.INTERFACE_ID,
+        channel_address="VCU2128127:1",
+        paramset_key=ParamsetKey.VALUES,
+    )
+    central.paramset_descriptions.add(
+        interface_id=const.INTERFACE_ID,
+        channel_address="VCU2128127:1",
+        paramset_key=ParamsetKey.VALUES,
+        paramset_description=paramset_description,
+    )
+    assert central.entity_plan.get_entity_plan(device=device)
+
+    # A changed paramset description removes the entity plan of the device.
+    parameter_data = paramset_description["PRESS_SHORT"]
+    central.paramset_descriptions.add(
+        interface_id=const.INTERFACE_ID,
+        channel_address="VCU2128127:1",
+        paramset_key=ParamsetKey.VALUES,
+        paramset_description={
+            **paramset_description,
+            "PRESS_SHORT": {**parameter_data, "FLAGS": parameter_data["FLAGS"] ^ 1},
+        },
+    )
+    assert central.entity_plan.get_entity_plan(device=device) is None
+    assert "VCU2128127" in central.entity_plan.dirty_segments
+    create_entities_and_events(
+        device=HmDevice(
+            central=central, interface_id=const.INTERFACE_ID, device_address="VCU2128127"
+        )
+    )
+    assert central.entity_plan.get_entity_plan(device=device)
+
+    central.remove_device(device=device)
+    assert central.entity_plan.get_entity_plan(device=device) is None
+
+    # The entity plans are invalid, if the version, the rules or the un ignore list changed.
+    other_device = central.get_device(address="VCU6354483")
+    assert central.entity_plan.get_entity_plan(device=other_device)
+    central.entity_plan._fingerprint = "changed"
+    assert central.entity_plan.get_entity_plan(device=other_device) is None
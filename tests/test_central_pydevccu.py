@@ -7,7 +7,7 @@ import os
 import orjson
 import pytest
 
-from hahomematic.const import EntityUsage
+from hahomematic.const import EntityUsage, ParamsetKey
 from hahomematic.platforms.decorators import (
     get_public_attributes_for_config_property,
     get_public_attributes_for_info_property,
@@ -115,7 +115,7 @@ async def test_central_full(central_unit_full) -> None:
     ) as fptr:
         fptr.write(orjson.dumps(addresses, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
-    assert usage_types[EntityUsage.NO_CREATE] == 3172
+    assert usage_types[EntityUsage.NO_CREATE] == 2680
     assert usage_types[EntityUsage.CE_PRIMARY] == 208
     assert usage_types[EntityUsage.ENTITY] == 3638
     assert usage_types[EntityUsage.CE_VISIBLE] == 125
@@ -123,7 +123,46 @@ async def test_central_full(central_unit_full) -> None:
 
     assert len(ce_channels) == 121
     assert len(entity_types) == 6
-    assert len(parameters) == 219
+    assert len(parameters) == 218
+
+    # Hidden VALUES entities of channels other than 0 are only created on access or event.
+    # The eagerly created hidden entities are the diagnostics of channel 0, the MASTER
+    # parameters and the parameters, that are used by custom entities.
+    assert (
+        sum(
+            len(channel._lazy_generic_entities)
+            for device in central_unit_full.devices
+            for channel in device.channels.values()
+        )
+        == 492
+    )
+    ce_entities = {
+        entity.unique_id
+        for custom_entity in custom_entities
+        for entity in custom_entity._data_entities.values()
+    }
+    visibility = central_unit_full.parameter_visibility
+    hidden_entities: dict[tuple[ParamsetKey, bool, bool], int] = {}
+    for entity in central_unit_full.get_entities(exclude_no_create=False):
+        if isinstance(entity, GenericEntity) and visibility.parameter_is_hidden(
+            model=entity.device.model,
+            channel_no=entity.channel.no,
+            paramset_key=entity.paramset_key,
+            parameter=entity.parameter,
+        ):
+            key = (
+                entity.paramset_key,
+                entity.channel.no in (None, 0),
+                entity.unique_id in ce_entities,
+            )
+            hidden_entities[key] = hidden_entities.get(key, 0) + 1
+    assert hidden_entities == {
+        (ParamsetKey.MASTER, False, False): 63,
+        (ParamsetKey.MASTER, False, True): 84,
+        (ParamsetKey.MASTER, True, False): 8,
+        (ParamsetKey.VALUES, False, True): 36,
+        (ParamsetKey.VALUES, True, False): 999,
+    }
 
     assert len(central_unit_full._devices) == 383
     virtual_remotes = ["VCU4264293", "VCU0000057", "VCU0000001"]
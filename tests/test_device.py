@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import Mock
+from typing import Any
+from unittest.mock import Mock, call
 
 import pytest
 
 from hahomematic.central import CentralUnit
 from hahomematic.client import Client
+from hahomematic.const import CallSource, EntityUsage, ParamsetKey
+from hahomematic.exceptions import ClientException
 
 from tests import const, helper
 
@@ -46,7 +49,7 @@ async def test_device_general(
         str(device) == "address: VCU2128127, "
         "model: 8, "
         "name: HmIP-BSM_VCU2128127, "
-        "generic_entities: 27, "
+        "generic_entities: 23, "
         "custom_entities: 3, "
         "events: 6"
     )
@@ -132,3 +135,131 @@ async def test_device_config_pending(
     # Save triggered, but data not changed
     assert cache_hash == central.paramset_descriptions.cache_hash
     assert last_save_triggered != central.paramset_descriptions.last_save_triggered
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_device_lazy_entity(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the creation of hidden entities on first access or event."""
+    central, _, _ = central_client_factory
+    device = central.get_device(address="VCU2128127")
+    channel = device.get_channel(channel_address="VCU2128127:4")
+    assert len(channel._lazy_generic_entities) == 1
+    assert "SECTION" not in [entity.parameter for entity in device.generic_entities]
+
+    await central.event(const.INTERFACE_ID, "VCU2128127:4", "SECTION", 3)
+    assert len(channel._lazy_generic_entities) == 0
+    entity = device.get_generic_entity(channel_address="VCU2128127:4", parameter="SECTION")
+    assert entity.value == 3
+    assert entity.usage == EntityUsage.NO_CREATE
+    assert len(device.generic_entities) == 24
+    assert central.entity_registry.get_entity(unique_id=entity.unique_id) is entity
+    assert entity not in central.entity_registry._new_entities.get(entity.platform, {}).get(
+        device.address, {}
+    ).values()
+
+    channel = device.get_channel(channel_address="VCU2128127:5")
+    assert device.get_generic_entity(channel_address="VCU2128127:5", parameter="SECTION")
+    assert len(channel._lazy_generic_entities) == 0
+    assert len(device.generic_entities) == 25
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_device_load_values(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the load of the values of a device with one call per channel."""
+    central, mock_client, _ = central_client_factory
+    device = central.get_device(address="VCU2128127")
+    entities = [
+        entity
+        for entity in device.generic_entities
+        if entity.channel.address in ("VCU2128127:3", "VCU2128127:7")
+        and entity.paramset_key == ParamsetKey.VALUES
+        and entity.is_readable
+    ]
+    assert len(entities) > 2
+
+    async def _get_values(
+        channel_address: str, paramset_key: ParamsetKey, call_source: CallSource
+    ) -> dict[str, Any]:
+        if channel_address == "VCU2128127:7":
+            return {entity.parameter: 1 for entity in entities if entity.channel.no == 7}
+        return {}
+
+    mock_client.get_values.side_effect = _get_values
+    method_calls = len(mock_client.method_calls)
+    await device.value_cache.load_values(
+        entities=entities, call_source=CallSource.MANUAL_OR_SCHEDULED, direct_call=True
+    )
+    calls = mock_client.method_calls[method_calls:]
+    assert [c for c in calls if c[0] == "get_values"] == [
+        call.get_values(
+            channel_address=channel_address,
+            paramset_key=ParamsetKey.VALUES,
+            call_source=CallSource.MANUAL_OR_SCHEDULED,
+        )
+        for channel_address in ("VCU2128127:3", "VCU2128127:7")
+    ]
+    # The parameters of channel 3 are missing in the paramset and are loaded one by one.
+    assert [c.kwargs["channel_address"] for c in calls if c[0] == "get_value"] == [
+        "VCU2128127:3" for entity in entities if entity.channel.no == 3
+    ]
+    assert all(entity.value == 1 for entity in entities if entity.channel.no == 7)
+
+    # A second load is served from the device cache.
+    method_calls = len(mock_client.method_calls)
+    await device.value_cache.load_values(entities=entities, call_source=CallSource.HM_INIT)
+    assert len(mock_client.method_calls) == method_calls
+
+    # A failed paramset call falls back to the load of the single parameters.
+    entities_3 = [entity for entity in entities if entity.channel.no == 3]
+    unreadable = entities_3[0].parameter
+
+    async def _get_values_failed(
+        channel_address: str, paramset_key: ParamsetKey, call_source: CallSource
+    ) -> dict[str, Any]:
+        raise ClientException("getParamset failed")
+
+    async def _get_value(
+        channel_address: str, paramset_key: ParamsetKey, parameter: str, call_source: CallSource
+    ) -> Any:
+        if parameter == unreadable:
+            raise ClientException("getValue failed")
+        return 2
+
+    mock_client.get_values.side_effect = _get_values_failed
+    mock_client.get_value.side_effect = _get_value
+    unreadable_value = entities_3[0].value
+    await device.value_cache.load_values(
+        entities=entities_3, call_source=CallSource.MANUAL_OR_SCHEDULED, direct_call=True
+    )
+    assert entities_3[0].value == unreadable_value
+    assert all(entity.value == 2 for entity in entities_3[1:])
@@ -4,25 +4,47 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from datetime import datetime, timedelta
+from functools import cache
+import importlib.resources
+import os
+import sys
+from time import perf_counter
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import orjson
 import pytest
 
+from hahomematic.caches.dynamic import DeviceDetailsCache
+from hahomematic.caches.persistent import DeviceDescriptionCache, ParamsetDescriptionCache
 from hahomematic.caches.visibility import _get_value_from_dict_by_wildcard_key
 from hahomematic.central import CentralUnit
 from hahomematic.client import Client
 from hahomematic.const import (
+    CACHE_PATH,
+    FILE_PARAMSETS,
     INIT_DATETIME,
     SCHEDULER_PROFILE_PATTERN,
     SCHEDULER_TIME_PATTERN,
     VIRTUAL_REMOTE_ADDRESSES,
+    DataOperationResult,
     EntityUsage,
+    HmPlatform,
+    Parameter,
     ParameterType,
+    ParamsetKey,
     SysvarType,
 )
 from hahomematic.converter import _COMBINED_PARAMETER_TO_HM_CONVERTER, convert_hm_level_to_cpv
 from hahomematic.exceptions import HaHomematicException
+from hahomematic.platforms.custom.const import ED, DeviceProfile, Field
+from hahomematic.platforms.custom.definition import (
+    ALL_BLACKLISTED_DEVICES,
+    ALL_DEVICES,
+    _get_device_group,
+    get_custom_configs,
+)
+from hahomematic.platforms.custom.support import CustomConfig
 from hahomematic.platforms.support import (
     _check_channel_name_with_channel_no,
     convert_value,
@@ -155,6 +177,7 @@ def test_parse_sys_var() -> None:
     assert parse_sys_var(data_type=SysvarType.STRING, raw_value="1.4") == "1.4"
     assert parse_sys_var(data_type=SysvarType.FLOAT, raw_value="1.4") == 1.4
     assert parse_sys_var(data_type=SysvarType.INTEGER, raw_value="1") == 1
+    assert parse_sys_var(data_type=SysvarType.INTEGER, raw_value="1.000000") == 1
     assert parse_sys_var(data_type=SysvarType.ALARM, raw_value="true") is True
     assert parse_sys_var(data_type=SysvarType.LIST, raw_value="1") == 1
     assert parse_sys_var(data_type=SysvarType.LOGIC, raw_value="true") is True
@@ -625,3 +648,688 @@ def test_scheduler_time_pattern() -> None:
     assert SCHEDULER_TIME_PATTERN.match("5:00")
     assert SCHEDULER_TIME_PATTERN.match("25:00") is None
     assert SCHEDULER_TIME_PATTERN.match("F:00") is None
+
+
+def test_custom_config_index() -> None:
+    """Test the indexed lookup of custom configs against a linear scan over all models."""
+
+    def _get_custom_configs_by_scan(
+        model: str, platform: HmPlatform | None = None
+    ) -> tuple[CustomConfig, ...]:
+        model = model.lower().replace("hb-", "hm-")
+        for blacklisted_devices in ALL_BLACKLISTED_DEVICES:
+            if element_matches_key(search_elements=blacklisted_devices, compare_with=model):
+                return ()
+        custom_configs: list[CustomConfig] = []
+        for pf, platform_devices in ALL_DEVICES.items():
+            if platform is not None and pf != platform:
+                continue
+            matches = [
+                configs for d_type, configs in platform_devices.items() if model == d_type.lower()
+            ] or [
+                configs
+                for d_type, configs in platform_devices.items()
+                if model.startswith(d_type.lower())
+            ]
+            if matches:
+                if isinstance(matches[0], tuple):
+                    custom_configs.extend(matches[0])
+                else:
+                    custom_configs.append(matches[0])
+        return tuple(custom_configs)
+
+    models: set[str] = set()
+    for filename in os.listdir(
+        os.path.join(str(importlib.resources.files("pydevccu")), "device_descriptions")
+    ):
+        for device_description in helper.load_device_description(central=None, filename=filename):
+            if not device_description.get("PARENT"):
+                models.add(device_description["TYPE"])
+    models.update({"HB-LC-Bl1PBU-FM", "hmip-bsm", "unknown"})
+    assert len(models) > 300
+
+    platforms: tuple[HmPlatform | None, ...] = (None, *ALL_DEVICES)
+    for model in models:
+        for platform in platforms:
+            assert get_custom_configs(model=model, platform=platform) == (
+                _get_custom_configs_by_scan(model=model, platform=platform)
+            )
+    assert any(get_custom_configs(model=model) for model in models)
+
+
+def test_device_group_rebased() -> None:
+    """Test the cached and immutable rebased device groups."""
+    group = _get_device_group(DeviceProfile.IP_COVER, 0)
+    assert group[ED.PRIMARY_CHANNEL] == 0
+    assert group[ED.SECONDARY_CHANNELS] == (1, 2)
+    assert group[ED.FIELDS][-1][Field.DIRECTION] == Parameter.ACTIVITY_STATE
+
+    rebased_group = _get_device_group(DeviceProfile.IP_COVER, 4)
+    assert rebased_group is _get_device_group(DeviceProfile.IP_COVER, 4)
+    assert rebased_group[ED.PRIMARY_CHANNEL] == 4
+    assert rebased_group[ED.SECONDARY_CHANNELS] == (5, 6)
+    assert rebased_group[ED.FIELDS][3][Field.DIRECTION] == Parameter.ACTIVITY_STATE
+    assert rebased_group[ED.VISIBLE_FIELDS][3][Field.CHANNEL_LEVEL] == Parameter.LEVEL
+    assert rebased_group[ED.REPEATABLE_FIELDS] == group[ED.REPEATABLE_FIELDS]
+
+    with pytest.raises(TypeError):
+        rebased_group[ED.PRIMARY_CHANNEL] = 1  # type: ignore[index]
+    with pytest.raises(TypeError):
+        rebased_group[ED.FIELDS][3][Field.DIRECTION] = Parameter.LEVEL  # type: ignore[index]
+    # The definition itself is not changed by the rebase.
+    assert _get_device_group(DeviceProfile.IP_COVER, 0)[ED.PRIMARY_CHANNEL] == 0
+
+
+def _get_synthetic_paramset_description(device_no: int) -> Any:
+    """Return the paramset descriptions of a synthetic HmIP-eTRV-2."""
+    return _get_synthetic_raw(resource="paramset_descriptions", device_no=device_no)
+
+
+@cache
+def _get_raw_template(resource: str) -> bytes:
+    """Return the descriptions of a HmIP-eTRV-2."""
+    return orjson.dumps(
+        helper._load_json_file(anchor="pydevccu", resource=resource, filename="HmIP-eTRV-2.json")
+    )
+
+
+def _get_synthetic_raw(resource: str, device_no: int) -> Any:
+    """Return a fresh copy of the descriptions of a HmIP-eTRV-2 with a synthetic address."""
+    return orjson.loads(
+        _get_raw_template(resource=resource).replace(b"VCU3609622", f"VCU{device_no:07d}".encode())
+    )
+
+
+def _get_synthetic_central(storage_folder: str = "") -> Mock:
+    """Return a central for the persistent caches of a synthetic installation."""
+
+    async def _async_add_executor_job(target: Callable[[], Any], name: str) -> Any:
+        return target()
+
+    central = Mock()
+    central.name = "synthetic"
+    central.config.storage_folder = storage_folder
+    central.config.use_caches = True
+    central.looper.async_add_executor_job = _async_add_executor_job
+    return central
+
+
+def _get_synthetic_paramset_description_cache(
+    device_count: int, storage_folder: str = "", add_paramset_descriptions: bool = True
+) -> ParamsetDescriptionCache:
+    """Return a paramset description cache of a synthetic installation of HmIP-eTRV-2."""
+    device_descriptions: dict[str, Any] = {}
+    central = _get_synthetic_central(storage_folder=storage_folder)
+    central.device_descriptions.find_device_description = (
+        lambda interface_id, device_address: device_descriptions.get(device_address)
+    )
+    paramset_descriptions = ParamsetDescriptionCache(central=central)
+    for device_no in range(device_count):
+        for device_description in _get_synthetic_raw(
+            resource="device_descriptions", device_no=device_no
+        ):
+            device_descriptions[device_description["ADDRESS"]] = device_description
+        if not add_paramset_descriptions:
+            continue
+        for address, channel_paramsets in _get_synthetic_paramset_description(
+            device_no=device_no
+        ).items():
+            for paramset_key, paramset_description in channel_paramsets.items():
+                paramset_descriptions.add(
+                    interface_id="IF",
+                    channel_address=address,
+                    paramset_key=ParamsetKey(paramset_key),
+                    paramset_description=paramset_description,
+                )
+    return paramset_descriptions
+
+
+def test_paramset_description_flyweights() -> None:
+    """Test the shared paramset descriptions on a synthetic installation with 1000 devices."""
+
+    def _get_size(obj: Any, seen: set[int]) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            size += sum(_get_size(k, seen) + _get_size(v, seen) for k, v in obj.items())
+        elif isinstance(obj, list | tuple):
+            size += sum(_get_size(item, seen) for item in obj)
+        return size
+
+    paramset_descriptions = _get_synthetic_paramset_description_cache(device_count=1000)
+    device_paramsets = _get_synthetic_paramset_description(device_no=0)
+    channels_per_device = len(device_paramsets)
+    raw = paramset_descriptions.raw_paramset_descriptions["IF"]
+    assert len(raw) == 1000 * channels_per_device
+    # Without flyweights every device holds its own copy of the paramset descriptions.
+    size_before = 1000 * _get_size(device_paramsets, set())
+    size_after = _get_size(raw, set())
+    assert size_after < size_before / 10
+    assert paramset_descriptions.flyweight_count == sum(
+        len(channel_paramsets) for channel_paramsets in device_paramsets.values()
+    )
+
+    first_values = paramset_descriptions.get_paramset_key_descriptions(
+        interface_id="IF", channel_address="VCU0000000:1", paramset_key=ParamsetKey.VALUES
+    )
+    assert first_values is paramset_descriptions.get_paramset_key_descriptions(
+        interface_id="IF", channel_address="VCU0000999:1", paramset_key=ParamsetKey.VALUES
+    )
+    assert first_values == device_paramsets["VCU0000000:1"]["VALUES"]
+
+
+@pytest.mark.asyncio()
+async def test_paramset_description_flyweights_pruned(tmp_path: Any) -> None:
+    """Test that the shared paramset descriptions are released with the devices."""
+    paramset_descriptions = _get_synthetic_paramset_description_cache(
+        device_count=2, storage_folder=str(tmp_path)
+    )
+    flyweight_count = paramset_descriptions.flyweight_count
+    assert flyweight_count > 0
+
+    def _get_device(device_no: int) -> Mock:
+        device = Mock()
+        device.interface_id = "IF"
+        device.address = f"VCU{device_no:07d}"
+        device.channels = dict.fromkeys(_get_synthetic_paramset_description(device_no=device_no))
+        return device
+
+    def _assert_refs() -> None:
+        refs: dict[int, int] = {}
+        for channel_paramsets in paramset_descriptions.raw_paramset_descriptions.values():
+            for paramsets in channel_paramsets.values():
+                for paramset_description in paramsets.values():
+                    refs[id(paramset_description)] = refs.get(id(paramset_description), 0) + 1
+        assert paramset_descriptions._flyweight_refs == {
+            key: refs[id(flyweight)]
+            for key, flyweight in paramset_descriptions._flyweights.items()
+        }
+
+    _assert_refs()
+    # A changed paramset description releases the shared one of the channel.
+    channel_values = _get_synthetic_paramset_description(device_no=1)["VCU0000001:1"]["VALUES"]
+    del channel_values["LEVEL"]
+    paramset_descriptions.add(
+        interface_id="IF",
+        channel_address="VCU0000001:1",
+        paramset_key=ParamsetKey.VALUES,
+        paramset_description=channel_values,
+    )
+    _assert_refs()
+
+    paramset_descriptions.remove_device(device=_get_device(device_no=0))
+    assert paramset_descriptions.flyweight_count == flyweight_count - 1
+    _assert_refs()
+    paramset_descriptions.remove_device(device=_get_device(device_no=1))
+    assert paramset_descriptions.flyweight_count == 0
+    assert paramset_descriptions._flyweight_refs == {}
+    assert paramset_descriptions._flyweight_keys == {}
+
+    paramset_descriptions = _get_synthetic_paramset_description_cache(
+        device_count=2, storage_folder=str(tmp_path)
+    )
+    await paramset_descriptions.clear()
+    assert paramset_descriptions.flyweight_count == 0
+
+
+@pytest.mark.asyncio()
+async def test_paramset_description_compact_format(tmp_path: Any) -> None:
+    """Test the migration between the json and the compact format of the paramset descriptions."""
+    storage_folder = str(tmp_path)
+    file_name = f"{tmp_path}/{CACHE_PATH}/synthetic_{FILE_PARAMSETS}"
+    paramset_descriptions = _get_synthetic_paramset_description_cache(
+        device_count=100, storage_folder=storage_folder
+    )
+    expected = orjson.loads(
+        orjson.dumps(
+            paramset_descriptions.raw_paramset_descriptions, option=orjson.OPT_NON_STR_KEYS
+        )
+    )
+
+    async def _save_and_load() -> ParamsetDescriptionCache:
+        assert await paramset_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+        loaded = _get_synthetic_paramset_description_cache(
+            device_count=100, storage_folder=storage_folder, add_paramset_descriptions=False
+        )
+        assert await loaded.load() == DataOperationResult.LOAD_SUCCESS
+        assert loaded.raw_paramset_descriptions == expected
+        return loaded
+
+    await _save_and_load()
+    json_size = os.path.getsize(file_name)
+
+    with patch("hahomematic.config.COMPACT_PARAMSET_CACHE", True):
+        # An existing json file is migrated with the next save.
+        paramset_descriptions = _get_synthetic_paramset_description_cache(
+            device_count=100, storage_folder=storage_folder, add_paramset_descriptions=False
+        )
+        assert await paramset_descriptions.load() == DataOperationResult.LOAD_SUCCESS
+        loaded = await _save_and_load()
+    compact_size = os.path.getsize(file_name)
+
+    assert compact_size < json_size / 10
+    assert loaded.get_paramset_key_descriptions(
+        interface_id="IF", channel_address="VCU0000000:1", paramset_key=ParamsetKey.VALUES
+    ) is loaded.get_paramset_key_descriptions(
+        interface_id="IF", channel_address="VCU0000099:1", paramset_key=ParamsetKey.VALUES
+    )
+
+    # Without changes nothing is saved.
+    assert await loaded.save() == DataOperationResult.NO_SAVE
+
+    # A compact file is migrated back to json, if the compact format is disabled.
+    paramset_descriptions = _get_synthetic_paramset_description_cache(
+        device_count=100, storage_folder=storage_folder, add_paramset_descriptions=False
+    )
+    assert await paramset_descriptions.load() == DataOperationResult.LOAD_SUCCESS
+    await _save_and_load()
+    assert os.path.getsize(file_name) == json_size
+
+
+@pytest.mark.asyncio()
+async def test_paramset_description_compact_format_table(tmp_path: Any) -> None:
+    """Test that the compact format contains each shared paramset description only once."""
+    file_sizes: dict[int, int] = {}
+    with patch("hahomematic.config.COMPACT_PARAMSET_CACHE", True):
+        for device_count in (1, 200):
+            storage_folder = str(tmp_path / str(device_count))
+            file_name = f"{storage_folder}/{CACHE_PATH}/synthetic_{FILE_PARAMSETS}"
+            paramset_descriptions = _get_synthetic_paramset_description_cache(
+                device_count=device_count, storage_folder=storage_folder
+            )
+            assert await paramset_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+            file_sizes[device_count] = os.path.getsize(file_name)
+            with open(file_name, "rb") as fptr:
+                file_content = orjson.loads(fptr.read())
+
+            shared = {
+                id(paramset_description)
+                for channel_paramsets in paramset_descriptions.raw_paramset_descriptions[
+                    "IF"
+                ].values()
+                for paramset_description in channel_paramsets.values()
+            }
+            assert len(file_content["paramsets"]) == len(shared)
+            assert len(file_content["interfaces"]["IF"]) == len(
+                paramset_descriptions.raw_paramset_descriptions["IF"]
+            )
+
+            loaded = _get_synthetic_paramset_description_cache(
+                device_count=device_count,
+                storage_folder=storage_folder,
+                add_paramset_descriptions=False,
+            )
+            assert await loaded.load() == DataOperationResult.LOAD_SUCCESS
+            assert sum(loaded._flyweight_refs.values()) == sum(
+                id(paramset_description) in loaded._flyweight_keys
+                for channel_paramsets in loaded.raw_paramset_descriptions["IF"].values()
+                for paramset_description in channel_paramsets.values()
+            )
+            assert loaded.raw_paramset_descriptions == orjson.loads(
+                orjson.dumps(
+                    paramset_descriptions.raw_paramset_descriptions,
+                    option=orjson.OPT_NON_STR_KEYS,
+                )
+            )
+
+    # The table doesn't grow with the devices, only the references of the channels do.
+    assert file_sizes[200] < file_sizes[1] * 3
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_paramset_description_snapshot(compact: bool) -> None:
+    """Test that the snapshot for the serialization is not changed with the cache."""
+    paramset_descriptions = _get_synthetic_paramset_description_cache(device_count=2)
+    with patch("hahomematic.config.COMPACT_PARAMSET_CACHE", compact):
+        snapshot = paramset_descriptions._get_file_content()
+        expected = orjson.dumps(snapshot, option=orjson.OPT_NON_STR_KEYS)
+        paramset_descriptions.add(
+            interface_id="IF",
+            channel_address="VCU0000000:1",
+            paramset_key=ParamsetKey.LINK,
+            paramset_description={},
+        )
+        paramset_descriptions.remove_device(
+            device=Mock(
+                interface_id="IF",
+                address="VCU0000001",
+                channels=dict.fromkeys(_get_synthetic_paramset_description(device_no=1)),
+            )
+        )
+        assert orjson.dumps(snapshot, option=orjson.OPT_NON_STR_KEYS) == expected
+
+
+@pytest.mark.asyncio()
+async def test_paramset_description_file_access_in_executor(tmp_path: Any) -> None:
+    """Test that the file and the journal are only accessed in the executor."""
+    paramset_descriptions = _get_synthetic_paramset_description_cache(
+        device_count=2, storage_folder=str(tmp_path)
+    )
+    in_executor = [False]
+
+    async def _async_add_executor_job(target: Callable[[], Any], name: str) -> Any:
+        in_executor[0] = True
+        try:
+            return target()
+        finally:
+            in_executor[0] = False
+
+    def _exists(path: str) -> bool:
+        assert in_executor[0], f"{path} is accessed on the loop"
+        return os.path.isfile(path) or os.path.isdir(path)
+
+    paramset_descriptions._central.looper.async_add_executor_job = _async_add_executor_job
+    with patch("hahomematic.caches.persistent.os.path.exists", side_effect=_exists):
+        assert await paramset_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+        channel_values = _get_synthetic_paramset_description(device_no=1)["VCU0000001:1"][
+            "VALUES"
+        ]
+        del channel_values["LEVEL"]
+        paramset_descriptions.add(
+            interface_id="IF",
+            channel_address="VCU0000001:1",
+            paramset_key=ParamsetKey.VALUES,
+            paramset_description=channel_values,
+        )
+        assert await paramset_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+        assert os.path.isfile(f"{tmp_path}/{CACHE_PATH}/synthetic_{FILE_PARAMSETS}.journal")
+        assert await paramset_descriptions.save(compact=True) == DataOperationResult.SAVE_SUCCESS
+        assert await paramset_descriptions.load() == DataOperationResult.LOAD_SUCCESS
+        await paramset_descriptions.clear()
+        assert await paramset_descriptions.save(compact=True) == DataOperationResult.NO_SAVE
+
+
+@pytest.mark.asyncio()
+async def test_paramset_description_dirty_tracking(tmp_path: Any) -> None:
+    """Test that the paramset descriptions are only saved after a change."""
+    paramset_descriptions = _get_synthetic_paramset_description_cache(
+        device_count=2, storage_folder=str(tmp_path)
+    )
+    assert paramset_descriptions.data_changed is True
+    assert paramset_descriptions.dirty_segments == {"IF"}
+    assert await paramset_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+    assert paramset_descriptions.data_changed is False
+    assert paramset_descriptions.last_hash_saved is None
+    assert await paramset_descriptions.save() == DataOperationResult.NO_SAVE
+
+    # An unchanged paramset description doesn't mark the cache as changed.
+    channel_values = _get_synthetic_paramset_description(device_no=1)["VCU0000001:1"]["VALUES"]
+    paramset_descriptions.add(
+        interface_id="IF",
+        channel_address="VCU0000001:1",
+        paramset_key=ParamsetKey.VALUES,
+        paramset_description=channel_values,
+    )
+    assert paramset_descriptions.data_changed is False
+
+    del channel_values["LEVEL"]
+    paramset_descriptions.add(
+        interface_id="IF",
+        channel_address="VCU0000001:1",
+        paramset_key=ParamsetKey.VALUES,
+        paramset_description=channel_values,
+    )
+    assert paramset_descriptions.dirty_segments == {"IF"}
+    assert await paramset_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+    # The change is appended to the journal.
+    assert os.path.exists(f"{tmp_path}/{CACHE_PATH}/synthetic_{FILE_PARAMSETS}.journal")
+
+    loaded = _get_synthetic_paramset_description_cache(
+        device_count=2, storage_folder=str(tmp_path), add_paramset_descriptions=False
+    )
+    assert await loaded.load() == DataOperationResult.LOAD_SUCCESS
+    assert loaded.data_changed is False
+    assert "LEVEL" not in loaded.get_paramset_key_descriptions(
+        interface_id="IF", channel_address="VCU0000001:1", paramset_key=ParamsetKey.VALUES
+    )
+
+    # Without changes the journal is compacted into the file on request.
+    assert await loaded.save(compact=True) == DataOperationResult.SAVE_SUCCESS
+    assert not os.path.exists(f"{tmp_path}/{CACHE_PATH}/synthetic_{FILE_PARAMSETS}.journal")
+
+    with patch("hahomematic.config.VERIFY_CACHE_HASH", True):
+        assert await loaded.load() == DataOperationResult.LOAD_SUCCESS
+        assert loaded.last_hash_saved == loaded.cache_hash
+        # A cache marked as changed is not saved, if the content hash is unchanged.
+        loaded._mark_dirty(segment="IF")
+        assert await loaded.save() == DataOperationResult.NO_SAVE
+        assert loaded.data_changed is False
+        assert await loaded.load() == DataOperationResult.NO_LOAD
+
+
+@pytest.mark.asyncio()
+async def test_paramset_description_journal(tmp_path: Any) -> None:
+    """Test the journal of the paramset descriptions for added and removed devices."""
+    journal_file = f"{tmp_path}/{CACHE_PATH}/synthetic_{FILE_PARAMSETS}.journal"
+    paramset_descriptions = _get_synthetic_paramset_description_cache(
+        device_count=2, storage_folder=str(tmp_path)
+    )
+    # The first save writes the file.
+    assert await paramset_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+    assert not os.path.exists(journal_file)
+    assert paramset_descriptions.write_count == 1
+    # Nothing is written without changes.
+    assert await paramset_descriptions.save() == DataOperationResult.NO_SAVE
+    assert paramset_descriptions.write_count == 1
+
+    for address, channel_paramsets in _get_synthetic_paramset_description(device_no=2).items():
+        for paramset_key, paramset_description in channel_paramsets.items():
+            paramset_descriptions.add(
+                interface_id="IF",
+                channel_address=address,
+                paramset_key=ParamsetKey(paramset_key),
+                paramset_description=paramset_description,
+            )
+    device = Mock(interface_id="IF", channels={"VCU0000000:0": None, "VCU0000000:1": None})
+    paramset_descriptions.remove_device(device=device)
+    assert await paramset_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+    journal_size = os.path.getsize(journal_file)
+    assert paramset_descriptions.write_count == 2
+    # Only the added device is written to the journal.
+    assert (
+        journal_size < len(orjson.dumps(_get_synthetic_paramset_description(device_no=2))) + 1000
+    )
+
+    # An incomplete entry at the end of the journal, e.g. after a crash, is ignored.
+    with open(journal_file, mode="ab") as fptr:
+        fptr.write(b'["add", "IF", "VCU0000003:1"')
+
+    async def _load() -> ParamsetDescriptionCache:
+        loaded = _get_synthetic_paramset_description_cache(
+            device_count=3, storage_folder=str(tmp_path), add_paramset_descriptions=False
+        )
+        assert await loaded.load() == DataOperationResult.LOAD_SUCCESS
+        assert loaded.raw_paramset_descriptions == paramset_descriptions.raw_paramset_descriptions
+        return loaded
+
+    loaded = await _load()
+    assert "VCU0000000:1" not in loaded.raw_paramset_descriptions["IF"]
+    assert "VCU0000002:1" in loaded.raw_paramset_descriptions["IF"]
+
+    # The journal is compacted into the file, if it exceeds its max size.
+    paramset_descriptions.remove_device(
+        device=Mock(interface_id="IF", channels={"VCU0000001:1": None})
+    )
+    with patch("hahomematic.config.CACHE_JOURNAL_MAX_SIZE", journal_size - 1):
+        assert await paramset_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+    assert not os.path.exists(journal_file)
+    await _load()
+
+
+@pytest.mark.asyncio()
+async def test_paramset_description_journal_incomplete_entry(tmp_path: Any) -> None:
+    """Test, that changes after an incomplete entry of the journal are not lost."""
+    journal_file = f"{tmp_path}/{CACHE_PATH}/synthetic_{FILE_PARAMSETS}.journal"
+    paramset_descriptions = _get_synthetic_paramset_description_cache(
+        device_count=3, storage_folder=str(tmp_path)
+    )
+    assert await paramset_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+    paramset_descriptions.remove_device(
+        device=Mock(interface_id="IF", channels={"VCU0000000:1": None})
+    )
+    assert await paramset_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+    with open(journal_file, mode="ab") as fptr:
+        fptr.write(b'["add", "IF", "VCU0000003:1"')
+
+    async def _load() -> ParamsetDescriptionCache:
+        loaded = _get_synthetic_paramset_description_cache(
+            device_count=3, storage_folder=str(tmp_path), add_paramset_descriptions=False
+        )
+        assert await loaded.load() == DataOperationResult.LOAD_SUCCESS
+        return loaded
+
+    loaded = await _load()
+    assert "VCU0000000:1" not in loaded.raw_paramset_descriptions["IF"]
+    # The change is not appended to the incomplete entry, but compacted into the file.
+    loaded.remove_device(device=Mock(interface_id="IF", channels={"VCU0000002:1": None}))
+    assert await loaded.save() == DataOperationResult.SAVE_SUCCESS
+    assert not os.path.exists(journal_file)
+    loaded.remove_device(device=Mock(interface_id="IF", channels={"VCU0000001:1": None}))
+    assert await loaded.save() == DataOperationResult.SAVE_SUCCESS
+    assert os.path.exists(journal_file)
+
+    reloaded = await _load()
+    assert reloaded.raw_paramset_descriptions == loaded.raw_paramset_descriptions
+    assert "VCU0000001:1" not in reloaded.raw_paramset_descriptions["IF"]
+    assert "VCU0000002:1" not in reloaded.raw_paramset_descriptions["IF"]
+
+
+async def test_device_description_cache_scaling(tmp_path: Any) -> None:
+    """Test, that adding, looking up and removing device descriptions scales linear."""
+    durations: dict[int, float] = {}
+    for device_count in (100, 1000, 10000):
+        device_descriptions = DeviceDescriptionCache(
+            central=_get_synthetic_central(storage_folder=str(tmp_path))
+        )
+        raw_device_descriptions = [
+            _get_synthetic_raw(resource="device_descriptions", device_no=device_no)
+            for device_no in range(device_count)
+        ]
+        start = perf_counter()
+        for raw in raw_device_descriptions:
+            for device_description in raw:
+                device_descriptions.add_device_description(
+                    interface_id="IF", device_description=device_description
+                )
+        for device_no in range(device_count):
+            device_address = f"VCU{device_no:07d}"
+            assert device_descriptions.get_model(device_address=device_address) == "HmIP-eTRV-2"
+            assert len(
+                device_descriptions.get_device_with_channels(
+                    interface_id="IF", device_address=device_address
+                )
+            ) == len(raw_device_descriptions[device_no])
+        durations[device_count] = perf_counter() - start
+
+        assert len(device_descriptions.get_addresses(interface_id="IF")) == device_count
+        assert (
+            len(
+                device_descriptions.get_device_addresses_by_model(
+                    interface_id="IF", model="HmIP-eTRV-2"
+                )
+            )
+            == device_count
+        )
+        device_descriptions.remove_device(
+            device=Mock(
+                interface_id="IF",
+                address="VCU0000000",
+                channels={
+                    device_description["ADDRESS"]: None
+                    for device_description in raw_device_descriptions[0][1:]
+                },
+            )
+        )
+        assert len(device_descriptions.get_addresses(interface_id="IF")) == device_count - 1
+        assert device_descriptions.get_model(device_address="VCU0000000") is None
+        assert "VCU0000000" not in device_descriptions.get_device_addresses_by_model(
+            interface_id="IF", model="HmIP-eTRV-2"
+        )
+
+        # The lists of device descriptions are only built for the file.
+        assert await device_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+        loaded = DeviceDescriptionCache(
+            central=_get_synthetic_central(storage_folder=str(tmp_path))
+        )
+        assert await loaded.load() == DataOperationResult.LOAD_SUCCESS
+        assert loaded.get_device_descriptions(
+            interface_id="IF"
+        ) == device_descriptions.get_device_descriptions(interface_id="IF")
+        assert len(loaded.get_addresses(interface_id="IF")) == device_count - 1
+        await device_descriptions.clear()
+        assert device_descriptions.get_addresses(interface_id="IF") == ()
+
+    # 100 times the devices would take 10000 times longer with a quadratic complexity.
+    assert durations[10000] < durations[100] * 500
+
+
+async def test_device_channel_indexes() -> None:
+    """Test the lookups of the channels and rooms of devices on a synthetic installation."""
+    device_count = 1000
+    paramset_descriptions = _get_synthetic_paramset_description_cache(device_count=device_count)
+    channel_addresses = list(_get_synthetic_paramset_description(device_no=1))
+
+    central = _get_synthetic_central()
+    central.primary_client.fetch_device_details = AsyncMock()
+    central.primary_client.get_all_rooms = AsyncMock(
+        return_value={
+            address: {f"Room {device_no}"}
+            for device_no in range(device_count)
+            for address in (f"VCU{device_no:07d}:1", f"VCU{device_no:07d}:2")
+        }
+    )
+    central.primary_client.get_all_functions = AsyncMock(return_value={})
+    device_details = DeviceDetailsCache(central=central)
+    await device_details.load(direct_call=True)
+
+    class _UnscannableDict(dict):
+        """A dict, that fails on a scan of all its items."""
+
+        def __iter__(self) -> Any:
+            raise AssertionError("The lookup scans all channels")
+
+        keys = values = items = __iter__
+
+    # The lookups use the indexes by device and don't scan all channels.
+    raw_paramset_descriptions = paramset_descriptions._raw_paramset_descriptions
+    channel_paramsets = raw_paramset_descriptions["IF"]
+    raw_paramset_descriptions["IF"] = _UnscannableDict(channel_paramsets)
+    channel_rooms = device_details._channel_rooms
+    device_details._channel_rooms = _UnscannableDict(channel_rooms)  # type: ignore[misc]
+    for device_no in range(device_count):
+        device_address = f"VCU{device_no:07d}"
+        assert paramset_descriptions.get_channel_addresses_by_paramset_key(
+            interface_id="IF", device_address=device_address
+        )
+        assert device_details.get_device_rooms(device_address=device_address) == {
+            f"Room {device_no}"
+        }
+    raw_paramset_descriptions["IF"] = channel_paramsets
+    device_details._channel_rooms = channel_rooms  # type: ignore[misc]
+
+    # The channels of VCU0000010 don't belong to VCU0000001.
+    by_paramset_key = paramset_descriptions.get_channel_addresses_by_paramset_key(
+        interface_id="IF", device_address="VCU0000001"
+    )
+    assert sorted(by_paramset_key[ParamsetKey.MASTER]) == sorted(
+        address
+        for address, paramsets in _get_synthetic_paramset_description(device_no=1).items()
+        if ParamsetKey.MASTER in paramsets
+    )
+    assert set(by_paramset_key[ParamsetKey.VALUES]) <= set(channel_addresses)
+
+    paramset_descriptions.remove_device(
+        device=Mock(
+            interface_id="IF", address="VCU0000001", channels=dict.fromkeys(channel_addresses)
+        )
+    )
+    assert (
+        paramset_descriptions.get_channel_addresses_by_paramset_key(
+            interface_id="IF", device_address="VCU0000001"
+        )
+        == {}
+    )
+    device_details.clear()
+    assert device_details.get_device_rooms(device_address="VCU0000001") == set()